@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la extracción Camelot por páginas en paralelo (read_pdf_tables)
+frente a camelot.read_pdf(pages="all") en un solo proceso.
+
+Genera un PDF sintético de varias páginas con tablas de agenda y mide el
+tiempo de extracción para distintos números de procesos.
+
+Uso:
+    python benchmarks/bench_camelot_pages.py
+    python benchmarks/bench_camelot_pages.py --pages 24 --columns 5 --workers 1,2,4,8
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import camelot
+
+from src.parser.common.camelot_extract import read_pdf_tables
+from tests.fixtures.synthetic_pdf import write_agenda_pdf
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    default_workers = ",".join(str(w) for w in (1, 2, 4, 8) if w <= cpus) or "1"
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=16)
+    parser.add_argument("--columns", type=int, default=2, choices=[2, 4, 5, 6])
+    parser.add_argument("--workers", default=default_workers)
+    parser.add_argument("--repeat", type=int, default=2, help="Repeticiones (se toma la mejor)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = write_agenda_pdf(Path(tmp) / "agenda.pdf", pages=args.pages, columns=args.columns)
+
+        baseline = timed(lambda: camelot.read_pdf(str(pdf_path), pages="all"), args.repeat)
+        results = []
+        for workers in (int(w) for w in args.workers.split(",")):
+            seconds = timed(lambda: read_pdf_tables(pdf_path, workers=workers), args.repeat)
+            results.append((workers, seconds))
+
+    print(f"PDF sintético: {args.pages} páginas, {args.columns} columnas, {cpus} CPUs")
+    print(f"{'procesos':>8} {'seg':>7} {'pág/s':>7} {'speedup':>8}")
+    print(f"{'read_pdf':>8} {baseline:>7.2f} {args.pages / baseline:>7.1f} {1.0:>8.2f}")
+    for workers, seconds in results:
+        print(f"{workers:>8} {seconds:>7.2f} {args.pages / seconds:>7.1f} {baseline / seconds:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
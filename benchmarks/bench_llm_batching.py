@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark del modo por lotes de parse_raw_ai contra un Ollama falso local.
+
+El servidor simula un coste fijo por petición más un coste proporcional
+a la longitud del prompt (prompt-eval), que es lo que domina en Ollama
+cuando cada celda es corta y las instrucciones ocupan ~1.5 KB.
+
+Uso:
+    python benchmarks/bench_llm_batching.py
+    python benchmarks/bench_llm_batching.py --rows 60 --delay 0.05 --char-delay 0.00002
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.parser import ai_parser
+from tests.fixtures.fake_ollama import FakeOllamaServer
+
+ACTIVITIES = [
+    "(*) Taller de cerámica. 18:00 h. Sala 2. Público: adultos",
+    "Cuentacuentos: El bosque encantado. 17:30 h. Biblioteca. Público: infantil de 4 a 8 años",
+    "(*) Yoga en familia. 11:00 h. Sala de encuentro. Público: familiar",
+    "Cine fórum. 19:00 h. Salón de actos. Público: juvenil",
+]
+
+
+def synthetic_rows(n: int) -> list[list[str]]:
+    return [[f"DIA {(i % 28) + 1}", ACTIVITIES[i % len(ACTIVITIES)]] for i in range(n)]
+
+
+def run(batch_size: int, rows: list, server: FakeOllamaServer) -> dict:
+    server.prompts.clear()
+    server.prompt_tokens = server.eval_tokens = 0
+
+    start = time.perf_counter()
+    activities = ai_parser.parse_raw_ai(rows, month="202602", batch_size=batch_size, max_workers=1)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "batch_size": batch_size,
+        "requests": len(server.prompts),
+        "seconds": elapsed,
+        "requests_per_sec": len(server.prompts) / elapsed,
+        "rows_per_sec": len(rows) / elapsed,
+        "prompt_tokens": server.prompt_tokens,
+        "eval_tokens": server.eval_tokens,
+        "activities": len(activities),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=48)
+    parser.add_argument("--delay", type=float, default=0.02, help="Latencia fija por petición (s)")
+    parser.add_argument("--char-delay", type=float, default=0.00001, help="Coste por carácter de prompt (s)")
+    parser.add_argument("--sizes", default="1,4,8,16")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    ai_parser.configure_llm_cache(enabled=False)
+    rows = synthetic_rows(args.rows)
+
+    with FakeOllamaServer(delay=args.delay, prompt_char_delay=args.char_delay) as server:
+        ai_parser.configure_client(base_url=server.url)
+        results = [run(int(size), rows, server) for size in args.sizes.split(",")]
+
+    print(f"{'lote':>5} {'peticiones':>10} {'seg':>7} {'pet/s':>7} {'filas/s':>8} {'tokens prompt':>14} {'tokens salida':>14}")
+    for r in results:
+        print(
+            f"{r['batch_size']:>5} {r['requests']:>10} {r['seconds']:>7.2f} {r['requests_per_sec']:>7.1f} "
+            f"{r['rows_per_sec']:>8.1f} {r['prompt_tokens']:>14} {r['eval_tokens']:>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark del coste por petición a Ollama: requests.post sin sesión
+(una conexión TCP nueva por celda) frente al OllamaClient compartido
+(requests.Session con keep-alive).
+
+Usa un Ollama falso local sin latencia, así que lo medido es el
+sobrecoste de cliente + conexión, no el tiempo de generación.
+
+Uso:
+    python benchmarks/bench_ollama_session.py
+    python benchmarks/bench_ollama_session.py --requests 500
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.parser import ai_parser
+from tests.fixtures.fake_ollama import FakeOllamaServer
+
+PROMPT = ai_parser._build_prompt("17", "Yoga en parejas. 19:30 h. Sala de encuentro. Público: adultos", "202602")
+
+
+def bare_post(url: str):
+    response = requests.post(
+        f"{url}/api/generate",
+        json={"model": "mistral", "prompt": PROMPT, "stream": False},
+        timeout=300,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def time_calls(fn, n: int) -> list[float]:
+    timings = []
+    for _ in range(n):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    with FakeOllamaServer() as server:
+        client = ai_parser.OllamaClient(server.url)
+
+        before_connections = server.connections
+        bare = time_calls(lambda: bare_post(server.url), args.requests)
+        bare_connections = server.connections - before_connections
+
+        before_connections = server.connections
+        pooled = time_calls(lambda: client.generate(PROMPT, "mistral").json(), args.requests)
+        pooled_connections = server.connections - before_connections
+        client.close()
+
+    print(f"{'modo':<16} {'media ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'conexiones':>11}")
+    for name, timings, conns in (
+        ("requests.post", bare, bare_connections),
+        ("OllamaClient", pooled, pooled_connections),
+    ):
+        p95 = statistics.quantiles(timings, n=20)[-1]
+        print(
+            f"{name:<16} {statistics.mean(timings) * 1000:>9.3f} "
+            f"{statistics.median(timings) * 1000:>8.3f} {p95 * 1000:>8.3f} {conns:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Benchmark de extremo a extremo de run_orchestrator.
+
+Genera PDFs sintéticos para cada cívico con el layout que maneja su
+process_pdf (2, 4, 5 o 6 columnas), los sirve desde un servidor local con
+URLs como las del Ayuntamiento, y ejecuta el orquestador completo (descarga,
+Camelot, parse_raw, validación, guardado y publicación) contra un Ollama
+falso con la latencia indicada. Las cachés de tablas y del LLM se desactivan
+para que cada ejecución haga todo el trabajo.
+
+Guarda en JSON el tiempo total, CPU (proceso + hijos), RSS máximo y el
+desglose por etapa y cívico, junto con el commit, para comparar ejecuciones:
+
+Uso:
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --pages 4 --llm-delay 0.5 --jobs 4
+    python benchmarks/bench_pipeline.py --compare .cache/bench_pipeline/abc1234.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.downloader.download_pdf import download_pdf
+from src.orchestrator.main import run_orchestrator
+from src.parser import ai_parser
+from src.parser.common.camelot_extract import configure_table_cache
+from src.parser.registry import get_parser
+from src.publish.main import publish_month
+from src.utils.warning_logger import close_warning_loggers
+from tests.fixtures.fake_ollama import FakeOllamaServer
+from tests.fixtures.pdf_server import PdfServer
+from tests.fixtures.synthetic_pdf import write_agenda_pdf
+
+MONTH = "202601"
+RESULTS_DIR = Path(".cache/bench_pipeline")
+
+# Layout de tabla que espera el process_pdf de cada cívico
+LAYOUTS = {
+    "gamonal_norte": 5,
+    "rio_vena": 2,
+    "vista_alegre": 4,
+    "capiscol": 4,
+    "san_agustin": 2,
+    "huelgas": 6,
+    "san_juan": 2,
+}
+
+
+class StageTimer:
+    """
+    Envuelve una etapa y apunta su duración en un JSONL.
+
+    Es picklable (la función se serializa por referencia), así que también
+    mide extract_raw cuando el orquestador lo ejecuta en su pool de procesos.
+    """
+
+    def __init__(self, stage: str, civico: str, fn, log_path: Path):
+        self.stage = stage
+        self.civico = civico
+        self.fn = fn
+        self.log_path = log_path
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.fn(*args, **kwargs)
+        finally:
+            line = json.dumps({
+                "stage": self.stage,
+                "civico": self.civico,
+                "seconds": time.perf_counter() - start,
+            })
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def prepare_month(data_dir: Path, server_url: str, civicos: dict) -> None:
+    links = [
+        {
+            "civico_id": civico,
+            "title": f"{civico.upper()} AGENDA ENERO 2026",
+            "url": f"{server_url}/documents/{i}/0/{civico}.pdf/{i:08d}-bench",
+            "filename": f"{i:08d}-bench",
+            "is_new": True,
+        }
+        for i, civico in enumerate(civicos, start=1)
+    ]
+    month_dir = data_dir / MONTH
+    month_dir.mkdir(parents=True)
+    (month_dir / "links.json").write_text(json.dumps({"links": links}), encoding="utf-8")
+
+
+def stage_totals(log_path: Path) -> dict:
+    by_stage = defaultdict(float)
+    by_civico = defaultdict(lambda: defaultdict(float))
+    if log_path.exists():
+        for line in log_path.read_text(encoding="utf-8").splitlines():
+            entry = json.loads(line)
+            by_stage[entry["stage"]] += entry["seconds"]
+            by_civico[entry["civico"]][entry["stage"]] += entry["seconds"]
+    return {"stages": dict(by_stage), "civicos": {c: dict(s) for c, s in by_civico.items()}}
+
+
+def run(args) -> dict:
+    configure_table_cache(enabled=False)
+    ai_parser.configure_llm_cache(enabled=False)
+    civicos = {c: LAYOUTS[c] for c in (args.civicos.split(",") if args.civicos else LAYOUTS)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        files = {}
+        for i, (civico, columns) in enumerate(civicos.items(), start=1):
+            pdf = write_agenda_pdf(
+                tmp / "pdfs" / f"{civico}.pdf", pages=args.pages, columns=columns,
+                rows_per_page=args.rows_per_page, first_day=1 + 3 * i,
+            )
+            files[f"/documents/{i}/0/{civico}.pdf/{i:08d}-bench"] = pdf.read_bytes()
+
+        stages_log = tmp / "stages.jsonl"
+        data_dir = tmp / "data"
+        url_to_civico = {}
+
+        def timed_download(url, output_dir):
+            return StageTimer("download", url_to_civico.get(url, "?"), download_pdf, stages_log)(url, output_dir)
+
+        parsers = {
+            civico: {
+                name: StageTimer(name, civico, fn, stages_log)
+                for name, fn in get_parser(civico).items()
+            }
+            for civico in civicos
+        }
+
+        with PdfServer(files, delay=args.download_delay) as pdf_server, \
+                FakeOllamaServer(delay=args.llm_delay) as ollama:
+            ai_parser.configure_client(base_url=ollama.url)
+            prepare_month(data_dir, pdf_server.url, civicos)
+            for link in json.loads((data_dir / MONTH / "links.json").read_text())["links"]:
+                url_to_civico[link["url"]] = link["civico_id"]
+
+            children_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+            cpu_before = time.process_time()
+            start = time.perf_counter()
+
+            activities = run_orchestrator(
+                MONTH, base_data_path=data_dir, download_fn=timed_download, parsers=parsers, jobs=args.jobs,
+            )
+            orchestrator_seconds = time.perf_counter() - start
+            if not args.no_publish:
+                StageTimer("publish", "*", publish_month, stages_log)(data_dir / MONTH)
+
+            wall = time.perf_counter() - start
+            cpu = time.process_time() - cpu_before
+            children = resource.getrusage(resource.RUSAGE_CHILDREN)
+            close_warning_loggers()
+
+            llm_requests = len(ollama.prompts)
+            llm_tokens = {"prompt": ollama.prompt_tokens, "eval": ollama.eval_tokens}
+
+        breakdown = stage_totals(stages_log)
+        run_report = json.loads((data_dir / MONTH / "run_report.json").read_text(encoding="utf-8"))
+
+    children_cpu = (children.ru_utime - children_before.ru_utime) + (children.ru_stime - children_before.ru_stime)
+    measured = sum(s for stage, s in breakdown["stages"].items() if stage != "publish")
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "params": {
+            "civicos": civicos,
+            "pages": args.pages,
+            "rows_per_page": args.rows_per_page,
+            "llm_delay": args.llm_delay,
+            "download_delay": args.download_delay,
+            "jobs": args.jobs,
+            "publish": not args.no_publish,
+        },
+        "activities": sum(len(v) for v in (activities or {}).values()),
+        "llm_requests": llm_requests,
+        "llm_tokens": llm_tokens,
+        "wall_seconds": wall,
+        "cpu_seconds": cpu + children_cpu,
+        "cpu_seconds_self": cpu,
+        "cpu_seconds_children": children_cpu,
+        # ru_maxrss está en KB en Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "peak_rss_children_mb": children.ru_maxrss / 1024,
+        "stages": {
+            **breakdown["stages"],
+            # Con jobs=1 las etapas son secuenciales: lo que queda es validar y guardar
+            "other": orchestrator_seconds - measured if args.jobs <= 1 else None,
+        },
+        "civicos": breakdown["civicos"],
+        # Etapas medidas por el propio orquestador (src/utils/timing.py)
+        "run_report": {"stages": run_report["stages"], "llm": run_report["llm"]},
+    }
+
+
+def print_result(result: dict, baseline: dict | None = None) -> None:
+    def delta(key, value, sub=None):
+        if baseline is None:
+            return ""
+        old = baseline.get(sub, {}).get(key) if sub else baseline.get(key)
+        if not old or value is None:
+            return ""
+        return f"  ({100 * (value - old) / old:+.0f}%)"
+
+    p = result["params"]
+    print(
+        f"Pipeline {result['commit']}: {len(p['civicos'])} cívicos × {p['pages']} páginas, "
+        f"jobs={p['jobs']}, LLM {p['llm_delay']}s/petición, {result['cpus']} CPUs"
+    )
+    print(f"  actividades      {result['activities']:>10}")
+    print(f"  peticiones LLM   {result['llm_requests']:>10}")
+    for key, label in (("wall_seconds", "tiempo total s"), ("cpu_seconds", "CPU s"), ("peak_rss_mb", "RSS máx MB")):
+        print(f"  {label:<16} {result[key]:>10.2f}{delta(key, result[key])}")
+    print("  etapas (s, suma de cívicos):")
+    for stage, seconds in result["stages"].items():
+        if seconds is not None:
+            print(f"    {stage:<14} {seconds:>10.2f}{delta(stage, seconds, 'stages')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--civicos", help=f"Cívicos separados por comas (por defecto: {','.join(LAYOUTS)})")
+    parser.add_argument("--pages", type=int, default=2, help="Páginas por PDF")
+    parser.add_argument("--rows-per-page", type=int, default=8)
+    parser.add_argument("--llm-delay", type=float, default=0.05, help="Latencia del Ollama falso por petición (s)")
+    parser.add_argument("--download-delay", type=float, default=0.0, help="Latencia del servidor de PDFs (s)")
+    parser.add_argument("--jobs", type=int, default=1, help="Cívicos en paralelo (run_orchestrator jobs)")
+    parser.add_argument("--no-publish", action="store_true", help="No medir publish_month")
+    parser.add_argument("--output", help=f"Fichero JSON de resultados (por defecto: {RESULTS_DIR}/<commit>.json)")
+    parser.add_argument("--compare", help="Resultados anteriores con los que comparar")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    result = run(args)
+
+    baseline = json.loads(Path(args.compare).read_text(encoding="utf-8")) if args.compare else None
+    print_result(result, baseline)
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{result['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"Resultados en {output}")
+
+
+if __name__ == "__main__":
+    main()
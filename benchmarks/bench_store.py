@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark del almacén columnar de actividades (src/store).
+
+Genera `--years` años de meses sintéticos (`--per-month` actividades por mes
+repartidas entre 7 cívicos) en un directorio temporal y compara, para
+consultas típicas:
+- Recorrido de los actividades.json ya cargados como dicts, parseando
+  fecha/fecha_fin con strptime en cada consulta (lo que hacen hoy los scripts)
+- ActivityStore.query sobre las columnas NumPy
+
+Uso:
+    python benchmarks/bench_store.py
+    python benchmarks/bench_store.py --years 10 --per-month 2000 --repeat 50
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.store.activity_store import ActivityStore
+
+CIVICOS = ["capiscol", "gamonal_norte", "huelgas", "rio_vena", "san_agustin", "san_juan", "vista_alegre"]
+PUBLICOS = ["Adultos", "Público familiar", "Infantil de 4 a 8 años", "Juvenil", "Mayores", "Familias"]
+
+
+def synthetic_month(year: int, month: int, n: int, rng: random.Random) -> dict:
+    data = {civico: [] for civico in CIVICOS}
+    days = (date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)).day
+    for i in range(n):
+        day = date(year, month, rng.randint(1, days))
+        span = rng.choice([0] * 8 + [3, 14])
+        data[CIVICOS[i % len(CIVICOS)]].append({
+            "nombre": f"Actividad {i}",
+            "descripcion": None,
+            "fecha": day.strftime("%d/%m/%Y"),
+            "fecha_fin": (day + timedelta(days=span)).strftime("%d/%m/%Y") if span else None,
+            "hora": f"{rng.randint(9, 20):02d}:{rng.choice([0, 15, 30, 45]):02d}",
+            "hora_fin": None,
+            "requiere_inscripcion": rng.random() < 0.4,
+            "lugar": "Sala de encuentro",
+            "publico": rng.choice(PUBLICOS),
+            "edad_minima": None,
+            "edad_maxima": None,
+            "precio": rng.choice([None, 0, 3, 10]),
+        })
+    return data
+
+
+def write_dataset(data_dir: Path, first_year: int, years: int, per_month: int) -> None:
+    rng = random.Random(0)
+    for year in range(first_year, first_year + years):
+        for month in range(1, 13):
+            month_dir = data_dir / f"{year}{month:02d}"
+            month_dir.mkdir()
+            (month_dir / "actividades.json").write_text(
+                json.dumps(synthetic_month(year, month, per_month, rng), ensure_ascii=False), encoding="utf-8"
+            )
+
+
+def load_dicts(data_dir: Path) -> list[tuple[str, dict]]:
+    rows = []
+    for source in sorted(data_dir.glob("*/actividades.json")):
+        for civico, activities in json.loads(source.read_text(encoding="utf-8")).items():
+            rows.extend((civico, a) for a in activities)
+    return rows
+
+
+def scan(rows, first: date, last: date, publico: str | None = None, civicos=None, inscripcion=None) -> int:
+    found = 0
+    for civico, a in rows:
+        start = datetime.strptime(a["fecha"], "%d/%m/%Y").date()
+        end = datetime.strptime(a["fecha_fin"], "%d/%m/%Y").date() if a.get("fecha_fin") else start
+        if end < first or start > last:
+            continue
+        if publico and publico not in a["publico"].lower():
+            continue
+        if civicos and civico not in civicos:
+            continue
+        if inscripcion is not None and a["requiere_inscripcion"] != inscripcion:
+            continue
+        found += 1
+    return found
+
+
+def timed(fn, repeat: int) -> tuple[float, object]:
+    result = None
+    begin = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - begin) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--per-month", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    first_year = 2022
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        write_dataset(data_dir, first_year, args.years, args.per_month)
+        total = args.years * 12 * args.per_month
+        print(f"Dataset: {args.years} años, {total} actividades\n")
+
+        load_dicts_s, rows = timed(lambda: load_dicts(data_dir), 1)
+        load_store_s, store = timed(lambda: ActivityStore.load(data_dir), 1)
+        print(f"Carga JSON (dicts):        {load_dicts_s * 1000:9.1f} ms")
+        print(f"Carga ActivityStore:       {load_store_s * 1000:9.1f} ms\n")
+
+        today = date(first_year + args.years // 2, 3, 10)
+        queries = {
+            "familiares próximos 14 días": (
+                lambda: scan(rows, today, today + timedelta(days=14), publico="famil"),
+                lambda: len(store.query(start=today, end=today + timedelta(days=14), publico="famil")),
+            ),
+            "un día, 2 cívicos, inscripción": (
+                lambda: scan(rows, today, today, civicos={"capiscol", "huelgas"}, inscripcion=True),
+                lambda: len(store.query(start=today, civicos=["capiscol", "huelgas"], requiere_inscripcion=True)),
+            ),
+            "un año completo": (
+                lambda: scan(rows, date(first_year, 1, 1), date(first_year, 12, 31)),
+                lambda: len(store.query(start=date(first_year, 1, 1), end=date(first_year, 12, 31))),
+            ),
+        }
+
+        print(f"{'consulta':<32} {'resultados':>10} {'recorrido':>11} {'store':>10} {'speedup':>8}")
+        for name, (scan_fn, store_fn) in queries.items():
+            scan_s, expected = timed(scan_fn, max(1, args.repeat // 10))
+            store_s, found = timed(store_fn, args.repeat)
+            assert found == expected, f"{name}: {found} != {expected}"
+            print(
+                f"{name:<32} {found:>10} {scan_s * 1000:>9.2f}ms {store_s * 1000:>8.3f}ms "
+                f"{scan_s / store_s:>7.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
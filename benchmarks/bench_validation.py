@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark de validación de actividades contra el schema.
+
+Compara, con N actividades sintéticas repartidas entre los cívicos:
+- jsonschema.validate() por cívico sobre su lista acumulada (lo que hacía
+  el orquestador, con `--existing` actividades previas en actividades.json)
+- ActivityValidator precompilado validando solo el lote nuevo de cada cívico
+- ActivityValidator.validate_document sobre el documento completo
+- Validación actividad a actividad (`--per-call`): jsonschema.validate
+  reconstruye el validador en cada llamada; ActivityValidator.validate no
+
+Uso:
+    python benchmarks/bench_validation.py
+    python benchmarks/bench_validation.py --activities 10000 --civicos 7
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import jsonschema
+
+from src.validators.validate_activities import SCHEMA_PATH, get_activity_validator
+
+PUBLICOS = ["adultos", "infantil de 4 a 8 años", "familiar", "juvenil", "mayores"]
+
+
+def synthetic_activities(n: int) -> list[dict]:
+    return [
+        {
+            "nombre": f"Actividad {i}",
+            "descripcion": None if i % 3 else "Descripción de prueba",
+            "fecha": f"{i % 28 + 1:02d}/02/2026",
+            "fecha_fin": None,
+            "hora": f"{10 + i % 10:02d}:{(i * 15) % 60:02d}",
+            "hora_fin": None,
+            "requiere_inscripcion": i % 2 == 0,
+            "lugar": "Sala de encuentro",
+            "publico": PUBLICOS[i % len(PUBLICOS)],
+            "edad_minima": 4 if i % 5 == 1 else None,
+            "edad_maxima": 8 if i % 5 == 1 else None,
+            "precio": None,
+        }
+        for i in range(n)
+    ]
+
+
+def split_by_civico(activities: list[dict], n_civicos: int) -> list[tuple[str, list[dict]]]:
+    size = -(-len(activities) // n_civicos)
+    return [(f"civico_{c}", activities[c * size:(c + 1) * size]) for c in range(n_civicos)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--activities", type=int, default=10000)
+    parser.add_argument("--civicos", type=int, default=7)
+    parser.add_argument("--per-call", type=int, default=1000, help="Actividades validadas de una en una")
+    parser.add_argument("--existing", type=int, default=0, help="Actividades previas por cívico (reproceso)")
+    args = parser.parse_args()
+
+    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    batches = split_by_civico(synthetic_activities(args.activities), args.civicos)
+
+    # Antes: jsonschema.validate sobre la lista acumulada de cada cívico
+    start = time.perf_counter()
+    previous = synthetic_activities(args.existing)
+    accumulated = {civico: list(previous) for civico, _ in batches}
+    for civico, batch in batches:
+        accumulated[civico].extend(batch)
+        jsonschema.validate(instance={civico: accumulated[civico]}, schema=schema)
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    validator = get_activity_validator(schema)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    issues = []
+    for civico, batch in batches:
+        issues += validator.validate_batch(batch, civico=civico)
+    incremental = time.perf_counter() - start
+    assert not issues
+
+    start = time.perf_counter()
+    assert not validator.validate_document(dict(batches))
+    document = time.perf_counter() - start
+
+    single = synthetic_activities(args.per_call)
+    start = time.perf_counter()
+    for activity in single:
+        jsonschema.validate(instance={"civico": [activity]}, schema=schema)
+    legacy_single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for activity in single:
+        validator.validate(activity)
+    compiled_single = time.perf_counter() - start
+
+    print(f"{args.activities} actividades en {args.civicos} cívicos")
+    print(f"{'modo':<40} {'seg':>7} {'act/s':>9}")
+    for name, seconds in (
+        ("jsonschema.validate (lista acumulada)", legacy),
+        ("construir ActivityValidator", build),
+        ("validate_batch (solo nuevas)", incremental),
+        ("validate_document (todo)", document),
+    ):
+        rate = f"{args.activities / seconds:>9.0f}" if name != "construir ActivityValidator" else f"{'':>9}"
+        print(f"{name:<40} {seconds:>7.3f} {rate}")
+
+    print(f"\n{args.per_call} actividades validadas de una en una")
+    for name, seconds in (
+        ("jsonschema.validate", legacy_single),
+        ("ActivityValidator.validate", compiled_single),
+    ):
+        print(f"{name:<40} {seconds:>7.3f} {args.per_call / seconds:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
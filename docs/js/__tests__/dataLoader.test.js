@@ -0,0 +1,53 @@
+/**
+ * dataLoader.test.js - Tests para la carga de actividades según el manifiesto
+ */
+
+import { loadManifest, loadActivitiesForMonth } from '../modules/dataLoader.js';
+
+function mockFetch(manifest) {
+  global.fetch = jest.fn(async (url) => {
+    if (url.startsWith('data/index.json')) {
+      return { ok: true, json: async () => manifest };
+    }
+    return { ok: true, json: async () => ({ url }) };
+  });
+}
+
+function monthManifest(minSource) {
+  return {
+    version: 1,
+    months: [
+      {
+        month: '202601',
+        files: {
+          'actividades.json': { sha256: 'aaaaaaaaaaaaaaaa', bytes: 100 },
+          'actividades.min.json': { sha256: 'bbbbbbbbbbbbbbbb', bytes: 50, source: minSource }
+        }
+      }
+    ]
+  };
+}
+
+describe('dataLoader', () => {
+  afterEach(() => {
+    delete global.fetch;
+  });
+
+  test('debería usar actividades.min.json si se generó del actividades.json actual', async () => {
+    mockFetch(monthManifest('aaaaaaaaaaaaaaaa'));
+    await loadManifest();
+
+    const data = await loadActivitiesForMonth('202601');
+
+    expect(data.url).toBe('data/202601/actividades.min.json?v=bbbbbbbbbbbb');
+  });
+
+  test('debería usar actividades.json si actividades.min.json está desactualizado', async () => {
+    mockFetch(monthManifest('cccccccccccccccc'));
+    await loadManifest();
+
+    const data = await loadActivitiesForMonth('202601');
+
+    expect(data.url).toBe('data/202601/actividades.json?v=aaaaaaaaaaaa');
+  });
+});
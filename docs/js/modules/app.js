@@ -10,6 +10,7 @@ import * as uiRenderer from './uiRenderer.js';
 class App {
   constructor() {
     this.allActivities = [];
+    this.searchIndex = null;
     this.civicosMap = {};
     this.linksMap = {};
     this.availableMonths = [];
@@ -79,8 +80,14 @@ class App {
    * Carga las actividades del mes actual
    */
   async loadCurrentMonth() {
-    const data = await dataLoader.loadActivitiesForMonth(this.currentMonth);
+    const [data, searchIndex] = await Promise.all([
+      dataLoader.loadActivitiesForMonth(this.currentMonth),
+      dataLoader.loadSearchIndex(this.currentMonth)
+    ]);
     this.allActivities = dataLoader.normalizeActivities(data);
+    // El índice solo vale si describe exactamente estas actividades
+    this.searchIndex =
+      searchIndex && searchIndex.count === this.allActivities.length ? searchIndex : null;
     
     // Cargar también los links de PDFs del mes
     this.linksMap = await dataLoader.loadLinksForMonth(this.currentMonth);
@@ -187,7 +194,8 @@ class App {
   applyFilters() {
     const filtered = filterEngine.applyFilters(
       this.allActivities,
-      this.currentFilters
+      this.currentFilters,
+      this.searchIndex
     );
     uiRenderer.renderActivities(filtered, this.civicosMap, this.linksMap);
   }
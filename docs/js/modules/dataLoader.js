@@ -2,11 +2,48 @@
  * dataLoader.js - Módulo para cargar datos desde archivos JSON
  */
 
+// Manifiesto data/index.json (null si no existe o no se pudo cargar)
+let manifest = null;
+
+/**
+ * Carga data/index.json: meses disponibles con conteos y hashes de sus ficheros.
+ * Se revalida siempre (cache: 'no-cache'); es lo único que cambia entre
+ * publicaciones, los ficheros de cada mes se piden versionados por hash.
+ * @returns {Promise<Object|null>} Manifiesto o null si no está disponible
+ */
+export async function loadManifest() {
+  try {
+    const res = await fetch('data/index.json', { cache: 'no-cache' });
+    if (!res.ok) {
+      return null;
+    }
+    manifest = await res.json();
+    return manifest;
+  } catch (err) {
+    return null;
+  }
+}
+
+/**
+ * Entrada del manifiesto para un mes
+ * @param {string} monthStr - Mes en formato YYYYMM
+ * @returns {Object|undefined}
+ */
+export function getMonthInfo(monthStr) {
+  return manifest?.months?.find(m => m.month === monthStr);
+}
+
 /**
  * Obtiene los meses disponibles en /data/
+ * Usa el manifiesto index.json; si no está, prueba los últimos 6 meses.
  * @returns {Promise<string[]>} Array de meses en formato YYYYMM ordenados descendentemente
  */
 export async function getAvailableMonths() {
+  const index = manifest ?? await loadManifest();
+  if (index && Array.isArray(index.months)) {
+    return index.months.map(m => m.month).sort().reverse();
+  }
+
   const months = [];
   const currentDate = new Date();
   const currentYear = currentDate.getFullYear();
@@ -47,13 +84,31 @@ export async function loadCivicos() {
 }
 
 /**
- * Carga las actividades de un mes específico
+ * Carga las actividades de un mes específico.
+ * Usa actividades.min.json (minificado, sin campos null) si existe y si no
+ * el actividades.json completo; los campos ausentes equivalen a null.
+ * Con manifiesto se pide directamente el fichero que existe, versionado por hash,
+ * y actividades.min.json solo si se generó a partir del actividades.json actual.
  * @param {string} monthStr - Mes en formato YYYYMM
  * @returns {Promise<Object>} Objeto con civico_id -> array de actividades
  */
 export async function loadActivitiesForMonth(monthStr) {
   try {
-    const res = await fetch(`data/${monthStr}/actividades.json`);
+    let res;
+    const files = getMonthInfo(monthStr)?.files;
+    if (files) {
+      // El manifiesto dice qué fichero existe; ?v=<hash> permite cachearlo indefinidamente.
+      // Un actividades.min.json de otra versión de actividades.json (guardado sin publicar) se ignora
+      const min = files['actividades.min.json'];
+      const fresh = min && min.source === files['actividades.json']?.sha256;
+      const name = fresh ? 'actividades.min.json' : 'actividades.json';
+      res = await fetch(`data/${monthStr}/${name}?v=${files[name].sha256.slice(0, 12)}`);
+    } else {
+      res = await fetch(`data/${monthStr}/actividades.min.json`);
+      if (!res.ok) {
+        res = await fetch(`data/${monthStr}/actividades.json`);
+      }
+    }
     if (!res.ok) {
       throw new Error(`No encontrado: ${monthStr}`);
     }
@@ -64,6 +119,31 @@ export async function loadActivitiesForMonth(monthStr) {
   }
 }
 
+/**
+ * Carga el índice de búsqueda y facetas de un mes (search.json)
+ * @param {string} monthStr - Mes en formato YYYYMM
+ * @returns {Promise<Object|null>} Índice o null si no existe (se filtra recorriendo)
+ */
+export async function loadSearchIndex(monthStr) {
+  try {
+    const info = getMonthInfo(monthStr)?.files?.['search.json'];
+    const version = info ? `?v=${info.sha256.slice(0, 12)}` : '';
+    const res = await fetch(`data/${monthStr}/search.json${version}`);
+    if (!res.ok) {
+      return null;
+    }
+    const index = await res.json();
+    // Descartar un índice generado a partir de otra versión de actividades.json
+    const source = getMonthInfo(monthStr)?.files?.['actividades.json']?.sha256;
+    if (source && index.source !== source) {
+      return null;
+    }
+    return index;
+  } catch (err) {
+    return null;
+  }
+}
+
 /**
  * Carga los links de PDFs de un mes específico
  * @param {string} monthStr - Mes en formato YYYYMM
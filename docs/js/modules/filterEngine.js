@@ -4,6 +4,96 @@
 
 import { isActivityInDateRange } from './dateUtils.js';
 
+/**
+ * Normaliza texto para buscar: sin tildes y en minúsculas.
+ * Debe coincidir con fold() de src/publish/search_index.py.
+ * @param {string} text
+ * @returns {string}
+ */
+export function normalizeText(text) {
+  return text.normalize('NFD').replace(/[\u0300-\u036f]/g, '').toLowerCase();
+}
+
+/**
+ * Parte un texto normalizado en tokens [a-z0-9]+
+ * @param {string} text
+ * @returns {Array<string>}
+ */
+export function tokenize(text) {
+  return normalizeText(text).split(/[^a-z0-9]+/).filter(Boolean);
+}
+
+/**
+ * Intersección de dos listas de ids ordenadas
+ */
+function intersect(a, b) {
+  const out = [];
+  let i = 0;
+  let j = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] === b[j]) {
+      out.push(a[i]);
+      i++;
+      j++;
+    } else if (a[i] < b[j]) {
+      i++;
+    } else {
+      j++;
+    }
+  }
+  return out;
+}
+
+/**
+ * Ids de actividades cuyo campo contiene todos los tokens de la consulta
+ * (cada token puede aparecer dentro de una palabra, como con includes()).
+ */
+function searchTokens(postingsByToken, query) {
+  let result = null;
+  for (const q of tokenize(query)) {
+    const ids = new Set();
+    for (const token in postingsByToken) {
+      if (token.includes(q)) {
+        postingsByToken[token].forEach(id => ids.add(id));
+      }
+    }
+    const sorted = [...ids].sort((x, y) => x - y);
+    result = result === null ? sorted : intersect(result, sorted);
+    if (result.length === 0) break;
+  }
+  return result;
+}
+
+/**
+ * Filtra usando el índice search.json: intersección de postings
+ * @returns {Array} Actividades filtradas, en el orden original
+ */
+function applyFiltersWithIndex(activities, filters, index) {
+  const postings = [];
+
+  if (filters.civico) {
+    postings.push(index.civicos[filters.civico] || []);
+  }
+  if (filters.fecha) {
+    postings.push(index.fechas[filters.fecha] || []);
+  }
+  if (filters.publico) {
+    const ids = searchTokens(index.tokens.publico, filters.publico);
+    if (ids !== null) postings.push(ids);
+  }
+  if (filters.inscripcion) {
+    postings.push(index.inscripcion[filters.inscripcion] || []);
+  }
+
+  if (postings.length === 0) {
+    return activities.slice();
+  }
+  // Empezar por la lista más corta
+  postings.sort((a, b) => a.length - b.length);
+  const ids = postings.reduce(intersect);
+  return ids.map(id => activities[id]);
+}
+
 /**
  * Aplica filtros a un array de actividades
  * @param {Array} activities - Array de actividades
@@ -12,9 +102,14 @@ import { isActivityInDateRange } from './dateUtils.js';
  * @param {string} filters.fecha - Fecha en formato YYYY-MM-DD
  * @param {string} filters.publico - Texto a buscar en público
  * @param {string} filters.inscripcion - 'true'|'false'|'' (vacío = todos)
+ * @param {Object|null} index - Índice search.json del mes (null = recorrer todas)
  * @returns {Array} Actividades filtradas
  */
-export function applyFilters(activities, filters) {
+export function applyFilters(activities, filters, index = null) {
+  if (index) {
+    return applyFiltersWithIndex(activities, filters, index);
+  }
+
   let filtered = activities.slice();
 
   // Filtro por civico
@@ -29,12 +124,14 @@ export function applyFilters(activities, filters) {
     filtered = filtered.filter(a => isActivityInDateRange(a, selectedDate));
   }
 
-  // Filtro por público
-  if (filters.publico) {
-    const publicoLower = filters.publico.toLowerCase();
-    filtered = filtered.filter(a =>
-      a.publico && a.publico.toLowerCase().includes(publicoLower)
-    );
+  // Filtro por público (mismas reglas que con índice: tokens sin tildes)
+  const queryTokens = filters.publico ? tokenize(filters.publico) : [];
+  if (queryTokens.length > 0) {
+    filtered = filtered.filter(a => {
+      if (!a.publico) return false;
+      const tokens = tokenize(a.publico);
+      return queryTokens.every(q => tokens.some(t => t.includes(q)));
+    });
   }
 
   // Filtro por inscripción
@@ -18,7 +18,7 @@ from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import camelot
+from src.parser.common.camelot_extract import read_pdf_tables
 from src.parser.registry import CIVICOS
 
 
@@ -108,15 +108,16 @@ def inspect_civico_pdfs(month: str, civico_id: Optional[str] = None):
         print(f"Tamaño: {pdf_path.stat().st_size / 1024:.1f} KB")
         
         try:
-            # Leer PDF con Camelot
-            tables = camelot.read_pdf(str(pdf_path), pages="all", flavor="lattice")
+            # Leer PDF con Camelot (o desde la caché de tablas si el PDF no cambió)
+            tables = read_pdf_tables(pdf_path, flavor="lattice")
             print(f"✅ Detectadas {len(tables)} tablas")
             
             # Mostrar análisis de cada tabla
             for table_idx, table in enumerate(tables):
                 print(f"\n  🔸 Tabla {table_idx + 1}:")
                 print(f"     ├─ Dimensiones: {table.shape[0]} filas × {table.shape[1]} columnas")
-                print(f"     ├─ Confianza (Lattice): {table.accuracy:.1%}")
+                if table.accuracy is not None:
+                    print(f"     ├─ Confianza (Lattice): {table.accuracy:.1f}%")
                 
                 # Mostrar primeras filas
                 print(f"     ├─ Primeras filas:")
@@ -135,7 +136,7 @@ def inspect_civico_pdfs(month: str, civico_id: Optional[str] = None):
             # Intenta con stream flavor si lattice no detectó mucho
             if len(tables) == 0:
                 print(f"\n  ⚠️  Probando con flavor='stream'...")
-                tables_stream = camelot.read_pdf(str(pdf_path), pages="all", flavor="stream")
+                tables_stream = read_pdf_tables(pdf_path, flavor="stream")
                 print(f"  ✅ Stream: {len(tables_stream)} tablas")
                 for table_idx, table in enumerate(tables_stream):
                     print(f"     └─ Tabla {table_idx + 1}: {table.shape[0]}x{table.shape[1]}")
@@ -8,6 +8,10 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 SCHEMA_DIR = BASE_DIR / "schemas"
 
+sys.path.insert(0, str(BASE_DIR))
+
+from src.validators.validate_activities import get_activity_validator
+
 
 def load_json(path: Path):
     try:
@@ -17,21 +21,23 @@ def load_json(path: Path):
         raise RuntimeError(f"Error leyendo {path}: {e}")
 
 
-def validate_json(data: dict, schema: dict, label: str):
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
-
-    if errors:
+def report(issues: list, label: str):
+    if issues:
         print(f"\n❌ Errores de validación en {label}:")
-        for err in errors:
-            path = " → ".join(map(str, err.path)) or "(root)"
-            print(f"  - {path}: {err.message}")
+        for path, message in issues:
+            print(f"  - {path}: {message}")
         return False
 
     print(f"✅ {label} válido")
     return True
 
 
+def validate_json(data: dict, schema: dict, label: str):
+    validator = Draft202012Validator(schema)
+    errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
+    return report([(" → ".join(map(str, err.path)) or "(root)", err.message) for err in errors], label)
+
+
 def validate_civicos():
     civicos_path = DATA_DIR / "civicos.json"
     schema_path = SCHEMA_DIR / "civicos.schema.v1.json"
@@ -44,7 +50,7 @@ def validate_civicos():
 
 def validate_actividades():
     schema_path = SCHEMA_DIR / "actividades.schema.v1.json"
-    schema = load_json(schema_path)
+    validator = get_activity_validator(load_json(schema_path))
 
     ok = True
 
@@ -56,7 +62,7 @@ def validate_actividades():
         actividades = load_json(actividades_path)
         label = f"{month_dir.name}/actividades.json"
 
-        if not validate_json(actividades, schema, label):
+        if not report(validator.validate_document(actividades), label):
             ok = False
 
     return ok
@@ -0,0 +1,145 @@
+"""
+Descarga concurrente de todos los PDFs nuevos de un mes.
+
+download_new_links toma la lista de links.json, descarga los que tienen
+is_new=true en un pool de hilos acotado (max_concurrency) con un límite
+adicional de conexiones simultáneas por host, reintenta los fallos
+transitorios con backoff exponencial y devuelve {url: Path} para que el
+orquestador lo consuma antes de empezar a parsear.
+
+Las URLs que fallan tras los reintentos no aparecen en el resultado; el
+orquestador las reintenta una vez al procesar el cívico y registra el error.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from src.downloader.download_pdf import download_pdf
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_MAX_CONCURRENCY = int(os.environ.get("DOWNLOAD_MAX_CONCURRENCY", "8"))
+DOWNLOAD_PER_HOST = int(os.environ.get("DOWNLOAD_PER_HOST", "4"))
+DOWNLOAD_RETRIES = int(os.environ.get("DOWNLOAD_RETRIES", "3"))
+DOWNLOAD_BACKOFF = float(os.environ.get("DOWNLOAD_BACKOFF", "0.5"))
+
+
+def is_retryable(error: Exception) -> bool:
+    """Errores de red, timeouts, 429 y 5xx se reintentan; el resto (404, disco...) no"""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+def backoff_delay(attempt: int, base: float) -> float:
+    """Espera antes del reintento `attempt` (1, 2, ...): base * 2^(attempt-1) con jitter"""
+    return base * (2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+
+
+def download_new_links(
+    links: List[dict],
+    output_dir: Path,
+    *,
+    download_fn: Callable[[str, Path], Path] = download_pdf,
+    max_concurrency: Optional[int] = None,
+    per_host: Optional[int] = None,
+    retries: Optional[int] = None,
+    backoff: Optional[float] = None,
+) -> Dict[str, Path]:
+    """
+    Descarga en paralelo los PDFs de los links con is_new=true.
+
+    Args:
+        links: Lista "links" de links.json
+        output_dir: Directorio pdfs/ del mes
+        download_fn: Función que descarga una URL (por defecto download_pdf)
+        max_concurrency: Descargas simultáneas en total
+        per_host: Descargas simultáneas contra un mismo host
+        retries: Reintentos por URL ante errores transitorios
+        backoff: Espera base (s) del backoff exponencial
+
+    Returns:
+        {url: ruta del PDF} de las descargas correctas
+    """
+    max_concurrency = max_concurrency or DOWNLOAD_MAX_CONCURRENCY
+    per_host = per_host or DOWNLOAD_PER_HOST
+    retries = DOWNLOAD_RETRIES if retries is None else retries
+    backoff = DOWNLOAD_BACKOFF if backoff is None else backoff
+
+    urls = list(dict.fromkeys(link["url"] for link in links if link.get("is_new")))
+    if not urls:
+        return {}
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    host_slots: Dict[str, threading.Semaphore] = {}
+    slots_lock = threading.Lock()
+
+    def _host_slot(url: str) -> threading.Semaphore:
+        host = urlparse(url).netloc
+        with slots_lock:
+            if host not in host_slots:
+                host_slots[host] = threading.Semaphore(per_host)
+            return host_slots[host]
+
+    def _fetch(url: str):
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                with _host_slot(url):
+                    path = download_fn(url, output_dir)
+                return path, attempt, time.perf_counter() - start
+            except Exception as e:
+                if attempt > retries or not is_retryable(e):
+                    raise
+                delay = backoff_delay(attempt, backoff)
+                logger.warning("Descarga fallida (%s), reintento %d/%d en %.1fs: %s", e, attempt, retries, delay, url)
+                time.sleep(delay)
+
+    results: Dict[str, Path] = {}
+    failed = 0
+    busy_seconds = 0.0
+    total_bytes = 0
+    start = time.perf_counter()
+
+    workers = min(max_concurrency, len(urls))
+    logger.info("Descargando %d PDFs (%d en paralelo, %d por host)", len(urls), workers, per_host)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="download") as pool:
+        futures = {pool.submit(_fetch, url): url for url in urls}
+        for done, future in enumerate(as_completed(futures), start=1):
+            url = futures[future]
+            try:
+                path, attempts, seconds = future.result()
+            except Exception as e:
+                failed += 1
+                logger.error("  [%d/%d] ✗ %s: %s", done, len(urls), url, e)
+                continue
+
+            results[url] = path
+            busy_seconds += seconds
+            size = path.stat().st_size if path.exists() else 0
+            total_bytes += size
+            retry_note = f", {attempts} intentos" if attempts > 1 else ""
+            logger.info("  [%d/%d] ✓ %s (%d KB, %.2fs%s)", done, len(urls), path.name, size // 1024, seconds, retry_note)
+
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "Descargas: %d correctas, %d fallidas, %.1f MB en %.2fs (%.2fs en serie)",
+        len(results), failed, total_bytes / (1024 * 1024), elapsed, busy_seconds,
+    )
+    return results
@@ -1,6 +1,15 @@
+import hashlib
+import json
 import logging
+import os
+import tempfile
+import time
 import requests
 from pathlib import Path
+from typing import Optional, Tuple
+
+from src.utils import metrics
+from src.utils.atomic_write import atomic_write_json
 
 logger = logging.getLogger(__name__)
 
@@ -12,19 +21,147 @@ HEADERS = {
     )
 }
 
+# (conexión, lectura) en segundos
+DOWNLOAD_TIMEOUT = (
+    float(os.environ.get("DOWNLOAD_CONNECT_TIMEOUT", "10")),
+    float(os.environ.get("DOWNLOAD_TIMEOUT", "60")),
+)
+CHUNK_SIZE = 64 * 1024
+
+# Junto a cada PDF: <filename>.meta.json con url, sha256, ETag y Last-Modified
+META_SUFFIX = ".meta.json"
+
+# La misma métrica que fetch_page (el registro devuelve la existente)
+DOWNLOAD_SECONDS = metrics.histogram(
+    "download_seconds", "Duración de las descargas (s)", labels=("kind",)
+)
+PDF_DOWNLOADS = metrics.counter(
+    "pdf_downloads_total", "Descargas de PDF por resultado", labels=("result",)
+)
+
+
+def _meta_path(path: Path) -> Path:
+    return path.with_name(path.name + META_SUFFIX)
+
+
+def _read_meta(path: Path) -> dict:
+    try:
+        return json.loads(_meta_path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_meta(path: Path, meta: dict) -> None:
+    try:
+        atomic_write_json(_meta_path(path), meta)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning("No se pudieron guardar los metadatos de %s: %s", path.name, e)
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
 
-def download_pdf(url: str, output_dir: Path) -> Path:
+
+def _find_identical(output_dir: Path, sha256: str, path: Path) -> Optional[Path]:
+    """Busca en output_dir un PDF ya descargado con el mismo contenido"""
+    if path.exists():
+        known = _read_meta(path).get("sha256")
+        if (known or _sha256_file(path)) == sha256:
+            return path
+    for meta_file in output_dir.glob(f"*{META_SUFFIX}"):
+        try:
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        candidate = output_dir / meta.get("file", "")
+        if meta.get("sha256") == sha256 and candidate.is_file():
+            return candidate
+    return None
+
+
+def download_pdf(url: str, output_dir: Path, *, timeout=DOWNLOAD_TIMEOUT) -> Path:
+    """
+    Descarga un PDF a output_dir y devuelve su ruta.
+
+    - Si hay una descarga previa de la misma URL, envía If-None-Match /
+      If-Modified-Since y un 304 reutiliza el fichero existente
+    - El cuerpo se escribe por bloques a un temporal mientras se calcula su
+      SHA-256; si ya hay un PDF idéntico en output_dir se descarta el
+      temporal y se devuelve el existente
+    - El PDF final aparece con un rename atómico: nunca queda a medias
+    """
+    start = time.perf_counter()
+    result = "error"
+    try:
+        path, result = _download(url, output_dir, timeout)
+        return path
+    finally:
+        DOWNLOAD_SECONDS.observe(time.perf_counter() - start, kind="pdf")
+        PDF_DOWNLOADS.inc(result=result)
+
+
+def _download(url: str, output_dir: Path, timeout) -> Tuple[Path, str]:
+    """Cuerpo de download_pdf: devuelve la ruta y el resultado (nuevo, sin_cambios, duplicado)"""
     output_dir.mkdir(parents=True, exist_ok=True)
 
     filename = url.split("/")[-2] or "document.pdf"
     path = output_dir / filename
 
+    headers = dict(HEADERS)
+    meta = _read_meta(path)
+    stored = output_dir / meta["file"] if meta.get("file") else None
+    if meta.get("url") == url and stored is not None and stored.is_file():
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
     logger.info("Descargando PDF: %s", filename)
 
-    r = requests.get(url, headers=HEADERS)
-    r.raise_for_status()
+    with requests.get(url, headers=headers, stream=True, timeout=timeout) as r:
+        if r.status_code == 304:
+            logger.info("PDF sin cambios (304): %s", filename)
+            return stored, "sin_cambios"
+
+        r.raise_for_status()
+
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp = tempfile.mkstemp(dir=output_dir, prefix=f".{filename}.", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in r.iter_content(CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+
+            sha256 = digest.hexdigest()
+            target = _find_identical(output_dir, sha256, path)
+            if target is not None:
+                logger.info("PDF idéntico ya descargado: %s", target.name)
+                result = "duplicado"
+            else:
+                os.replace(tmp, path)
+                target = path
+                result = "nuevo"
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
 
-    path.write_bytes(r.content)
+        _write_meta(path, {
+            "url": url,
+            "file": target.name,
+            "sha256": sha256,
+            "size": size,
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+            "downloaded_at": time.time(),
+        })
 
-    logger.debug("PDF guardado en %s (%d bytes)", path, path.stat().st_size)
-    return path
+    logger.debug("PDF guardado en %s (%d bytes)", target, size)
+    return target, result
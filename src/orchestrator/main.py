@@ -1,13 +1,26 @@
 import json
 import logging
+import multiprocessing
+import time
 from pathlib import Path
 from typing import Callable
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 from src.parser.registry import get_parser
+from src.parser.ai_parser import OLLAMA_MAX_WORKERS, configure_llm_cache, get_client
+from src.parser.hybrid import format_routing_report, routing_report
+from src.parser.common.camelot_extract import configure_table_cache, table_cache_settings
 from src.downloader.download_pdf import download_pdf
-from src.validators.validate_activities import validate_activities
+from src.downloader.bulk_download import download_new_links
+from src.validators.validate_activities import get_activity_validator
 from src.utils.logging_config import setup_logging
+from src.utils.atomic_write import atomic_write_json
+from src.orchestrator.storage import MonthStorage
+from src.publish.main import publish_month
+from src.utils.warning_logger import configure_warning_logger, flush_warning_loggers, close_warning_loggers
+from src.utils.timing import RunReport, activate
+from src.utils import metrics
 
 SCHEMA_PATH = Path(__file__).resolve().parents[2] / "schemas" / "actividades.schema.v1.json"
 
@@ -15,20 +28,46 @@ logger = logging.getLogger(__name__)
 
 DATA_DIR = Path("docs/data")
 
+ACTIVITIES = metrics.gauge("activities", "Actividades guardadas por mes y cívico", labels=("month", "civico"))
+CIVICOS_FAILED = metrics.gauge("civicos_failed", "Cívicos con errores en la última ejecución", labels=("month",))
+
+
+def _init_extract_worker(table_cache: tuple, log_level: int) -> None:
+    """
+    Inicializa un proceso del pool de extracción. Se crean con "spawn", así
+    que no heredan la configuración del proceso principal: se repiten la
+    caché de tablas (--no-table-cache) y el log de consola.
+    """
+    configure_table_cache(*table_cache)
+    logging.basicConfig(level=log_level, format="[%(levelname).1s] %(name)s - %(message)s")
+
+
+def _extract_with_metrics(extract_raw, pdf_path: Path):
+    """
+    extract_raw en un proceso del pool: devuelve también las métricas que
+    registró (Camelot), para sumarlas en el proceso principal.
+    """
+    metrics.REGISTRY.reset()
+    raw = extract_raw(pdf_path)
+    return raw, metrics.REGISTRY.snapshot()
+
 def run_orchestrator(
     month: str,
     *,
     base_data_path: Path | None = None,
     download_fn=None,
     parsers: dict | None = None,
+    jobs: int = 1,
+    shards: bool = False,
+    trace: bool = False,
 ):
     """
     Orquesta la descarga, parseo y validación de actividades para un mes.
     
     Flujo:
-    1. Lee links.json
+    1. Lee links.json y descarga en paralelo todos los PDFs con is_new=true
     2. Para cada link con is_new=true:
-       - Descarga PDF
+       - Toma el PDF descargado (o reintenta la descarga si falló)
        - Extrae raw
        - Parsea actividades
        - Agrega a actividades.json
@@ -36,11 +75,61 @@ def run_orchestrator(
     3. Valida schema
     4. Guarda actividades.json actualizado
     5. Guarda links.json actualizado
+
+    Con jobs > 1 los cívicos se procesan en paralelo: LLM en hilos,
+    extracción Camelot en un pool de procesos. Los pasos 3-5 los hace siempre
+    un único escritor (el hilo principal) a medida que terminan los cívicos,
+    así que el guardado incremental y la lista de errores se mantienen.
+
+    Todas las escrituras son atómicas. Con shards=True cada cívico se guarda
+    en actividades/<civico>.json y actividades.json se regenera una vez al
+    final (ver MonthStorage).
+
+    Cada etapa (descarga, extracción, parseo, llamadas al LLM, validación y
+    guardado) se mide por cívico y se escribe en <mes>/run_report.json; con
+    trace=True también <mes>/run_trace.json para un visor de trazas (ver
+    src/utils/timing.py).
     """
 
     if base_data_path is None:
         base_data_path = Path("docs/data")
 
+    report = RunReport(month, jobs=jobs)
+    with activate(report):
+        result = _process_month(
+            month,
+            base_data_path=base_data_path,
+            download_fn=download_fn,
+            parsers=parsers,
+            jobs=jobs,
+            shards=shards,
+            report=report,
+        )
+
+    if report.spans:
+        try:
+            path = report.write(base_data_path / month, trace=trace)
+            logger.info("Informe de la ejecución: %s", path)
+        except OSError as e:
+            logger.warning(f"⚠ No se pudo guardar el informe de la ejecución: {e}")
+    return result
+
+
+def _process_month(
+    month: str,
+    *,
+    base_data_path: Path,
+    download_fn=None,
+    parsers: dict | None = None,
+    jobs: int = 1,
+    shards: bool = False,
+    report: RunReport,
+):
+    """Cuerpo de run_orchestrator; registra sus etapas en `report`"""
+
+    # Los warnings de los parsers van a <base_data_path>/<mes>/warnings.log
+    configure_warning_logger(base_data_path)
+
     if download_fn is None:
         from src.downloader.download_pdf import download_pdf
         download_fn = download_pdf
@@ -54,8 +143,9 @@ def run_orchestrator(
             return parsers[cid]
 
     month_dir = base_data_path / month
-    links_file = month_dir / "links.json"
-    actividades_file = month_dir / "actividades.json"
+    storage = MonthStorage(month_dir, sharded=shards)
+    links_file = storage.links_file
+    actividades_file = storage.actividades_file
     pdfs_dir = month_dir / "pdfs"
 
     if not links_file.exists():
@@ -67,137 +157,218 @@ def run_orchestrator(
     links = links_data["links"]
 
     # Cargar actividades.json existentes (para agregar nuevas)
-    if actividades_file.exists():
-        all_activities = json.loads(actividades_file.read_text(encoding="utf-8"))
+    if actividades_file.exists() or storage.shards_dir.is_dir():
+        all_activities = storage.load_activities()
         logger.info("Cargadas %d cívicos de actividades.json existente", len(all_activities))
     else:
         all_activities = {}
         logger.info("Creando actividades.json nuevo para %s", month)
 
-    # Cargar schema
+    # Cargar schema (validador compilado una vez para todos los cívicos)
     with SCHEMA_PATH.open(encoding="utf-8") as f:
         ACTIVITIES_SCHEMA = json.load(f)
+    validator = get_activity_validator(ACTIVITIES_SCHEMA)
 
     # Filtrar links nuevos
     new_links = [link for link in links if link.get("is_new")]
     
     if not new_links:
         logger.info("No hay PDFs nuevos que procesar")
+        storage.finalize(all_activities)
         return all_activities
 
     logger.info("Procesando %d cívicos nuevos", len(new_links))
+    report.civicos = len(new_links)
+
+    civico_by_url = {link["url"]: link["civico_id"] for link in new_links}
+
+    def timed_download(url, output_dir):
+        with report.span("download", civico=civico_by_url.get(url, "")) as span:
+            pdf_path = download_fn(url, output_dir)
+            # Un download_fn inyectado puede devolver una ruta que aún no existe
+            span["bytes"] = pdf_path.stat().st_size if pdf_path.exists() else 0
+            return pdf_path
+
+    # Descargar todos los PDFs nuevos antes de empezar a parsear
+    downloaded = download_new_links(new_links, pdfs_dir, download_fn=timed_download)
 
-    # Procesar cada link nuevo - guardar e actualizar tras CADA cívico
     errors = []
-    for link in new_links:
+
+    def _prepare(link, extract_pool=None):
+        """
+        Descarga, extrae y parsea un cívico (sin tocar actividades.json ni links.json).
+
+        Returns:
+            (actividades, None) o (None, mensaje de error)
+        """
         civico_id = link["civico_id"]
         url = link["url"]
 
+        logger.info("Procesando %s → %s", civico_id, url)
+
+        # Crear directorio de PDFs
+        pdfs_dir.mkdir(parents=True, exist_ok=True)
+
+        # PDF ya descargado en bloque; si falló, un último intento aquí
+        try:
+            pdf_path = downloaded.get(url) or timed_download(url, pdfs_dir)
+        except Exception as e:
+            logger.error(f"  ✗ Error descargando PDF: {e}")
+            return None, f"Descarga: {e}"
+
+        # Obtener parser para este cívico
+        try:
+            parser = _get_parser(civico_id)
+        except Exception as e:
+            logger.error(f"  ✗ Error obteniendo parser: {e}")
+            return None, f"Parser: {e}"
+        
+        # Extraer raw (en el pool de procesos si lo hay: Camelot es CPU)
+        try:
+            pdf_bytes = pdf_path.stat().st_size if pdf_path.exists() else 0
+            with report.span("extract", civico=civico_id, pdf_bytes=pdf_bytes) as span:
+                if extract_pool is not None:
+                    raw, worker_metrics = extract_pool.submit(
+                        _extract_with_metrics, parser["extract_raw"], pdf_path
+                    ).result()
+                    metrics.REGISTRY.merge(worker_metrics)
+                else:
+                    raw = parser["extract_raw"](pdf_path)
+                span["rows"] = len(raw or [])
+            if not raw:
+                logger.warning(f"  ⚠ extract_raw devolvió lista vacía para {civico_id}")
+                return None, "extract_raw vacío"
+        except Exception as e:
+            logger.error(f"  ✗ Error en extract_raw: {e}")
+            return None, f"extract_raw: {e}"
+
+        # Guardar raw para debugging
+        raw_path = month_dir / f"actividades_raw_{civico_id}.json"
+        try:
+            with report.span("save_raw", civico=civico_id):
+                atomic_write_json(raw_path, raw)
+        except Exception as e:
+            logger.warning(f"  ⚠ No se pudo guardar raw: {e}")
+
+        # Parsear actividades
         try:
-            logger.info("Procesando %s → %s", civico_id, url)
-
-            # Crear directorio de PDFs
-            pdfs_dir.mkdir(parents=True, exist_ok=True)
-
-            # Descargar PDF
-            try:
-                pdf_path = download_fn(url, pdfs_dir)
-            except Exception as e:
-                logger.error(f"  ✗ Error descargando PDF: {e}")
-                errors.append((civico_id, f"Descarga: {e}"))
-                continue
-
-            # Obtener parser para este cívico
-            try:
-                parser = _get_parser(civico_id)
-            except Exception as e:
-                logger.error(f"  ✗ Error obteniendo parser: {e}")
-                errors.append((civico_id, f"Parser: {e}"))
-                continue
-            
-            # Extraer raw
-            try:
-                raw = parser["extract_raw"](pdf_path)
-                if not raw:
-                    logger.warning(f"  ⚠ extract_raw devolvió lista vacía para {civico_id}")
-                    errors.append((civico_id, "extract_raw vacío"))
-                    continue
-            except Exception as e:
-                logger.error(f"  ✗ Error en extract_raw: {e}")
-                errors.append((civico_id, f"extract_raw: {e}"))
-                continue
-
-            # Guardar raw para debugging
-            raw_path = month_dir / f"actividades_raw_{civico_id}.json"
-            try:
-                raw_path.write_text(
-                    json.dumps(raw, ensure_ascii=False, indent=2),
-                    encoding="utf-8"
-                )
-            except Exception as e:
-                logger.warning(f"  ⚠ No se pudo guardar raw: {e}")
-
-            # Parsear actividades
-            try:
+            with report.span("parse", civico=civico_id, rows=len(raw)) as span:
                 activities = parser["parse_raw"](raw, month=month, civico=civico_id)
-                if not activities:
-                    logger.warning(f"  ⚠ parse_raw devolvió lista vacía para {civico_id}")
-                    activities = []
-            except Exception as e:
-                logger.error(f"  ✗ Error en parse_raw: {e}")
-                errors.append((civico_id, f"parse_raw: {e}"))
-                continue
-
-            logger.info(f"  ✓ {len(activities)} actividades parseadas para {civico_id}")
-
-            # Agregar a diccionario (crea lista si no existe)
-            if civico_id not in all_activities:
-                all_activities[civico_id] = []
-            
-            all_activities[civico_id].extend(activities)
-
-            # Validar este cívico antes de guardar
-            civico_data = {civico_id: all_activities[civico_id]}
-            try:
-                validate_activities(civico_data, ACTIVITIES_SCHEMA)
-            except Exception as e:
-                logger.error(f"  ✗ Error de validación para {civico_id}: {e}")
-                errors.append((civico_id, f"Schema: {e}"))
-                # Remover las actividades inválidas
-                del all_activities[civico_id]
-                continue
-
-            # Guardar actividades.json actualizado (incremental)
-            try:
-                actividades_file.write_text(
-                    json.dumps(all_activities, ensure_ascii=False, indent=2),
-                    encoding="utf-8"
-                )
-                logger.info(f"  ✓ Guardado en {actividades_file}")
-            except Exception as e:
-                logger.error(f"  ✗ Error guardando actividades.json: {e}")
-                errors.append((civico_id, f"Guardar JSON: {e}"))
-                continue
-
-            # Marcar este link como procesado
-            try:
-                link["is_new"] = False
-                links_data["links"] = links
-                links_file.write_text(
-                    json.dumps(links_data, ensure_ascii=False, indent=2),
-                    encoding="utf-8"
-                )
-                logger.info(f"  ✓ Marcado is_new=false en links.json")
-            except Exception as e:
-                logger.error(f"  ✗ Error actualizando links.json: {e}")
-                errors.append((civico_id, f"Actualizar links: {e}"))
+                span["activities"] = len(activities or [])
+            if not activities:
+                logger.warning(f"  ⚠ parse_raw devolvió lista vacía para {civico_id}")
+                activities = []
+        except Exception as e:
+            logger.error(f"  ✗ Error en parse_raw: {e}")
+            return None, f"parse_raw: {e}"
+
+        logger.info(f"  ✓ {len(activities)} actividades parseadas para {civico_id}")
+        logger.info(report.progress_line())
+        return activities, None
+
+    def _commit(link, activities):
+        """Valida y guarda un cívico (único escritor de actividades.json y links.json)"""
+        civico_id = link["civico_id"]
 
+        # Validar solo las actividades nuevas antes de guardar
+        with report.span("validate", civico=civico_id, activities=len(activities)) as span:
+            issues = validator.validate_batch(
+                activities, civico=civico_id, start=len(all_activities.get(civico_id, []))
+            )
+            span["invalid"] = len(issues)
+        if issues:
+            logger.error(f"  ✗ Error de validación para {civico_id}: {len(issues)} errores")
+            for path, message in issues[:10]:
+                logger.error(f"    - {path}: {message}")
+            errors.append((civico_id, f"Schema: {issues[0][0]}: {issues[0][1]}"))
+            return
+
+        # Agregar a diccionario (crea lista si no existe)
+        if civico_id not in all_activities:
+            all_activities[civico_id] = []
+        
+        all_activities[civico_id].extend(activities)
+
+        # Guardar el cívico (actividades.json completo o solo su shard)
+        try:
+            with report.span("save", civico=civico_id) as span:
+                saved_path = storage.save_civico(civico_id, all_activities)
+                span["bytes"] = saved_path.stat().st_size
+            logger.info(f"  ✓ Guardado en {saved_path}")
+        except Exception as e:
+            logger.error(f"  ✗ Error guardando actividades.json: {e}")
+            errors.append((civico_id, f"Guardar JSON: {e}"))
+            return
+
+        # Marcar este link como procesado
+        try:
+            link["is_new"] = False
+            links_data["links"] = links
+            with report.span("save_links", civico=civico_id):
+                storage.save_links(links_data)
+            logger.info(f"  ✓ Marcado is_new=false en links.json")
+        except Exception as e:
+            logger.error(f"  ✗ Error actualizando links.json: {e}")
+            errors.append((civico_id, f"Actualizar links: {e}"))
+
+    def _handle(link, prepare):
+        civico_id = link["civico_id"]
+        try:
+            activities, error = prepare()
+            if error is not None:
+                errors.append((civico_id, error))
+                return
+            _commit(link, activities)
         except Exception as e:
             logger.error(f"❌ Error inesperado procesando {civico_id}: {e}")
             errors.append((civico_id, f"Inesperado: {e}"))
 
+    if jobs <= 1 or len(new_links) == 1:
+        # Procesar cada link nuevo - guardar e actualizar tras CADA cívico
+        for link in new_links:
+            _handle(link, lambda: _prepare(link))
+    else:
+        workers = min(jobs, len(new_links))
+        logger.info("Procesando en paralelo con %d trabajos", workers)
+        # Cada cívico en paralelo puede tener OLLAMA_MAX_WORKERS peticiones en vuelo
+        get_client().ensure_pool_size(workers * max(OLLAMA_MAX_WORKERS, 1))
+        # "spawn": los workers se crean desde los hilos de io_pool, con hilos de descarga y
+        # de Ollama vivos; un fork heredaría sus locks (logging, pool de urllib3) tomados
+        extract_context = multiprocessing.get_context("spawn")
+        extract_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=extract_context,
+            initializer=_init_extract_worker,
+            initargs=(table_cache_settings(), logging.getLogger().getEffectiveLevel()),
+        )
+        with extract_pool, \
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix="civico") as io_pool:
+            futures = {
+                io_pool.submit(_prepare, link, extract_pool): link
+                for link in new_links
+            }
+            # Guardar a medida que cada cívico termina
+            for future in as_completed(futures):
+                _handle(futures[future], future.result)
+
+    flush_warning_loggers()
+
+    # Con shards: un único actividades.json fusionado al final
+    try:
+        with report.span("finalize"):
+            storage.finalize(all_activities)
+    except Exception as e:
+        logger.error(f"✗ Error regenerando actividades.json: {e}")
+        errors.append(("*", f"Fusionar shards: {e}"))
+
+    for civico_id, civico_activities in all_activities.items():
+        ACTIVITIES.set(len(civico_activities), month=month, civico=civico_id)
+    CIVICOS_FAILED.set(len(errors), month=month)
+
     # Resumen final
     logger.info("✅ Orquestrador completado")
+    if routing_report(month)["cells"]:
+        logger.info(format_routing_report(month))
     if errors:
         logger.warning(f"⚠ {len(errors)} cívicos con errores:")
         for civico, error in errors:
@@ -220,18 +391,71 @@ def main():
         default="docs/data",
         help="Ruta base de datos (por defecto: docs/data/)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Cívicos a procesar en paralelo (por defecto: 1, secuencial)",
+    )
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="No reutilizar respuestas del LLM guardadas en caché (fuerza llamar a Ollama)",
+    )
+    parser.add_argument(
+        "--no-table-cache",
+        action="store_true",
+        help="No reutilizar tablas de Camelot guardadas en caché (fuerza reextraer los PDFs)",
+    )
+    parser.add_argument(
+        "--no-publish",
+        action="store_true",
+        help="No generar actividades.min.json (+ .gz/.br) para la web al terminar",
+    )
+    parser.add_argument(
+        "--shards",
+        action="store_true",
+        help="Guardar cada cívico en actividades/<civico>.json y fusionar actividades.json al final",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Guardar también run_trace.json (formato trace event de Chrome) junto a run_report.json",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        help="Fichero .prom para el textfile collector de Prometheus "
+        "(por defecto: $METRICS_TEXTFILE_DIR/burgos_civicos_orchestrator.prom si está definida)",
+    )
 
     args = parser.parse_args()
 
+    if args.no_llm_cache:
+        configure_llm_cache(enabled=False)
+    if args.no_table_cache:
+        configure_table_cache(enabled=False)
+
     # Configurar logging: INFO a consola, WARNING a archivo
     month_dir = Path(args.data_path) / args.month
     month_dir.mkdir(parents=True, exist_ok=True)
     setup_logging(log_file=month_dir / "warnings.log")
 
-    run_orchestrator(
-        month=args.month,
-        base_data_path=Path(args.data_path),
-    )
+    started = time.time()
+    success = False
+    try:
+        run_orchestrator(
+            month=args.month,
+            base_data_path=Path(args.data_path),
+            jobs=args.jobs,
+            shards=args.shards,
+            trace=args.trace,
+        )
+        if not args.no_publish:
+            publish_month(month_dir)
+        success = True
+    finally:
+        close_warning_loggers()
+        metrics.finish_run("orchestrator", started=started, success=success, path=args.metrics_file)
 
 
 if __name__ == "__main__":
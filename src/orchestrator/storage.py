@@ -0,0 +1,84 @@
+"""
+Almacenamiento de un mes: actividades.json y links.json.
+
+Todas las escrituras son atómicas (temporal + os.replace). Con sharded=True
+cada cívico se guarda en actividades/<civico>.json, de modo que tras cada
+cívico solo se reescribe su fichero, y actividades.json (el que consume la
+web) se regenera una sola vez en finalize().
+
+Los shards hacen de registro intermedio: si el proceso muere a mitad, la
+siguiente ejecución los lee por encima de actividades.json y no se pierde
+nada de lo ya guardado. finalize() los borra tras escribir el fichero final.
+
+Cada vez que se reescribe actividades.json se actualiza también la entrada
+del mes en el manifiesto docs/data/index.json (ver src.publish.manifest).
+"""
+
+import json
+import logging
+from pathlib import Path
+
+from src.publish.manifest import update_manifest
+from src.utils.atomic_write import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+SHARDS_DIR = "actividades"
+
+
+class MonthStorage:
+    def __init__(self, month_dir: Path, *, sharded: bool = False):
+        self.month_dir = Path(month_dir)
+        self.sharded = sharded
+        self.actividades_file = self.month_dir / "actividades.json"
+        self.links_file = self.month_dir / "links.json"
+        self.shards_dir = self.month_dir / SHARDS_DIR
+
+    def _shard_path(self, civico_id: str) -> Path:
+        return self.shards_dir / f"{civico_id}.json"
+
+    def load_activities(self) -> dict:
+        """actividades.json más los shards pendientes de una ejecución anterior"""
+        if self.actividades_file.exists():
+            activities = json.loads(self.actividades_file.read_text(encoding="utf-8"))
+        else:
+            activities = {}
+
+        if self.shards_dir.is_dir():
+            for shard in sorted(self.shards_dir.glob("*.json")):
+                activities[shard.stem] = json.loads(shard.read_text(encoding="utf-8"))
+                logger.info("Recuperado shard pendiente: %s", shard.name)
+
+        return activities
+
+    def save_civico(self, civico_id: str, all_activities: dict) -> Path:
+        """Guarda las actividades de un cívico; devuelve el fichero escrito"""
+        if self.sharded:
+            path = self._shard_path(civico_id)
+            atomic_write_json(path, all_activities[civico_id], indent=None)
+        else:
+            path = self.actividades_file
+            atomic_write_json(path, all_activities)
+            self._update_manifest()
+        return path
+
+    def _update_manifest(self) -> None:
+        update_manifest(self.month_dir.parent, [self.month_dir.name])
+
+    def save_links(self, links_data: dict) -> None:
+        atomic_write_json(self.links_file, links_data)
+
+    def finalize(self, all_activities: dict) -> None:
+        """Regenera actividades.json a partir de los shards (no-op sin shards)"""
+        if not self.sharded and not self.shards_dir.is_dir():
+            return
+
+        atomic_write_json(self.actividades_file, all_activities)
+        self._update_manifest()
+        for shard in self.shards_dir.glob("*.json"):
+            shard.unlink()
+        try:
+            self.shards_dir.rmdir()
+        except OSError:
+            pass
+        logger.info("✓ actividades.json regenerado (%d cívicos)", len(all_activities))
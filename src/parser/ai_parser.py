@@ -18,24 +18,72 @@ Flujo:
 
 import json
 import logging
+import os
 import requests
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+
+from src.parser.llm_cache import LLMCache, cache_key
+from src.utils import metrics, timing
 
 logger = logging.getLogger(__name__)
 
-# Configuración de Ollama
-OLLAMA_BASE_URL = "http://localhost:11434"
-OLLAMA_MODEL = "mistral"  # Cambiar a "llama2" si prefieres
+# Configuración de Ollama (sobrescribible por variables de entorno)
+OLLAMA_BASE_URL = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434")
+OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL", "mistral")  # Cambiar a "llama2" si prefieres
+OLLAMA_TIMEOUT = float(os.environ.get("OLLAMA_TIMEOUT", "300"))  # 5 minutos para primera carga y procesamiento
+OLLAMA_CONNECT_TIMEOUT = float(os.environ.get("OLLAMA_CONNECT_TIMEOUT", "5"))
+# Segundos durante los que se reutiliza un health check correcto
+OLLAMA_HEALTH_TTL = float(os.environ.get("OLLAMA_HEALTH_TTL", "60"))
 
-# Prompt que instruye al modelo cómo extraer datos estructurados
-ACTIVITY_EXTRACTION_PROMPT = """Eres un parser JSON de actividades. DEVUELVE SOLO JSON VÁLIDO.
+# Peticiones simultáneas a Ollama en parse_raw_ai (1 = secuencial).
+# Para que Ollama las atienda en paralelo, arrancarlo con OLLAMA_NUM_PARALLEL >= este valor.
+OLLAMA_MAX_WORKERS = int(os.environ.get("OLLAMA_MAX_WORKERS", "1"))
+OLLAMA_TEMPERATURE = 0.2  # Bajo para respuestas consistentes
 
-INSTRUCCIONES:
-1. DEVUELVE UN ARRAY DE JSON (incluso si es una sola actividad)
-2. CADA JSON DEBE TENER: nombre, descripcion, fecha, fecha_fin, hora, hora_fin, requiere_inscripcion, lugar, publico, edad_minima, edad_maxima, precio
+# Celdas por petición en parse_raw_ai (1 = una petición por celda) y
+# presupuesto de caracteres de texto por lote para no desbordar el contexto
+OLLAMA_BATCH_SIZE = int(os.environ.get("OLLAMA_BATCH_SIZE", "1"))
+OLLAMA_BATCH_MAX_CHARS = int(os.environ.get("OLLAMA_BATCH_MAX_CHARS", "4000"))
+
+# Consumir la respuesta de Ollama en streaming (NDJSON) y cortar la generación en
+# cuanto se cierra el array JSON. Solo aplica al prompt individual, no a los lotes.
+OLLAMA_STREAM = os.environ.get("OLLAMA_STREAM", "") in ("1", "true")
+
+# Caché de respuestas del LLM (ver llm_cache.py). Desactivable con --no-llm-cache
+_llm_cache_enabled = os.environ.get("LLM_CACHE_DISABLED", "") not in ("1", "true")
+_llm_cache: Optional[LLMCache] = None
+
+LLM_REQUEST_SECONDS = metrics.histogram("llm_request_seconds", "Latencia de las peticiones a Ollama (s)", labels=("model",))
+LLM_PROMPT_TOKENS = metrics.histogram(
+    "llm_prompt_tokens", "Tokens del prompt por petición", labels=("model",), buckets=metrics.TOKEN_BUCKETS
+)
+LLM_EVAL_TOKENS = metrics.histogram(
+    "llm_eval_tokens", "Tokens generados por petición", labels=("model",), buckets=metrics.TOKEN_BUCKETS
+)
+LLM_REQUESTS = metrics.counter("llm_requests_total", "Peticiones a Ollama por resultado", labels=("model", "result"))
+LLM_CACHE_HITS = metrics.counter("llm_cache_hits_total", "Peticiones servidas por la caché LLM")
+JSON_RECOVERY = metrics.counter(
+    "json_recovery_total",
+    "JSON del LLM por estrategia de parse_json_with_recovery (directo, la que lo recuperó o fallido)",
+    labels=("strategy",),
+)
+ROWS = metrics.counter(
+    "rows_total", "Filas raw por cívico, parser (llm/rules) y resultado (parsed/discarded)",
+    labels=("civico", "parser", "result"),
+)
+ACTIVITIES_DISCARDED = metrics.counter(
+    "activities_discarded_total", "Actividades descartadas por la validación final", labels=("civico",)
+)
+
+# Reglas de formato comunes a los prompts individual y por lotes
+ACTIVITY_EXTRACTION_RULES = """2. CADA JSON DEBE TENER: nombre, descripcion, fecha, fecha_fin, hora, hora_fin, requiere_inscripcion, lugar, publico, edad_minima, edad_maxima, precio
 3. DEVUELVE SOLO JSON VÁLIDO - sin markdown, sin explicación, sin comentarios
 4. USO DE COMILLAS CORRECTAS: todas las cadenas en COMILLAS DOBLES, nunca comillas simples o caracteres especiales
 5. Limpiar asteriscos: quitar "(*)" o "*)" del inicio del nombre
@@ -45,22 +93,171 @@ INSTRUCCIONES:
 9. publico: NUNCA null ni vacío, extraer qué público es. Ejemplos: "adultos", "infantil", "familiar", "juvenil"
 10. edades: números (1-120) o null. IMPORTANTE: "18 meses" = edad_minima: 1, NO 18. Los "meses" se convierten dividiendo por 12.
 11. precio: número (float) o null. Buscar: "€", "euros", "€ precio", "12,00€" → 12.0
+"""
+
+_EXAMPLE_ACTIVITY = (
+    '{{"nombre": "Yoga", "descripcion": "Clase de yoga", "fecha": "17/01/2026", "fecha_fin": null, '
+    '"hora": "19:00", "hora_fin": "20:00", "requiere_inscripcion": true, "lugar": "Sala A", '
+    '"publico": "adultos", "edad_minima": null, "edad_maxima": null, "precio": null}}'
+)
+
+# Prompt que instruye al modelo cómo extraer datos estructurados
+ACTIVITY_EXTRACTION_PROMPT = """Eres un parser JSON de actividades. DEVUELVE SOLO JSON VÁLIDO.
 
+INSTRUCCIONES:
+1. DEVUELVE UN ARRAY DE JSON (incluso si es una sola actividad)
+""" + ACTIVITY_EXTRACTION_RULES + """
 Día: {day}
 Mes/Año: {month_year}
 Texto: {text}
 
 RESPUESTA VÁLIDA EJEMPLO:
-[{{"nombre": "Yoga", "descripcion": "Clase de yoga", "fecha": "17/01/2026", "fecha_fin": null, "hora": "19:00", "hora_fin": "20:00", "requiere_inscripcion": true, "lugar": "Sala A", "publico": "adultos", "edad_minima": null, "edad_maxima": null, "precio": null}}]
+[""" + _EXAMPLE_ACTIVITY + """]
 
 AHORA DEVUELVE EL JSON VÁLIDO PARA EL TEXTO ARRIBA (SIN MARKDOWN, SOLO JSON):"""
 
+# Prompt por lotes: varias celdas [día, texto] en una sola petición.
+# Cada fila lleva una clave (r0, r1, ...) y la respuesta es un objeto con un array por clave.
+ACTIVITY_BATCH_EXTRACTION_PROMPT = """Eres un parser JSON de actividades. DEVUELVE SOLO JSON VÁLIDO.
+
+INSTRUCCIONES:
+1. DEVUELVE UN OBJETO JSON CON UNA CLAVE POR FILA ("r0", "r1", ...) Y COMO VALOR EL ARRAY DE ACTIVIDADES DE ESA FILA (incluso si es una sola actividad)
+""" + ACTIVITY_EXTRACTION_RULES + """
+Mes/Año: {month_year}
+Filas:
+{rows}
+
+RESPUESTA VÁLIDA EJEMPLO:
+{{"r0": [""" + _EXAMPLE_ACTIVITY + """], "r1": [...]}}
+
+AHORA DEVUELVE EL OBJETO JSON VÁLIDO PARA TODAS LAS FILAS ARRIBA (SIN MARKDOWN, SOLO JSON):"""
+
+# Formato de cada fila dentro del prompt por lotes
+BATCH_ROW_TEMPLATE = "{key} | Día: {day} | Texto: {text}"
+
+
+class OllamaClient:
+    """
+    Cliente HTTP para Ollama con conexiones persistentes.
+    
+    Usa un requests.Session con un pool de conexiones keep-alive del tamaño
+    de la concurrencia, así que las peticiones sucesivas reutilizan la
+    conexión TCP en lugar de abrir una nueva por celda. El resultado de
+    /api/tags se guarda durante health_ttl segundos.
+    """
+    
+    def __init__(
+        self,
+        base_url: str = None,
+        *,
+        timeout: float = None,
+        connect_timeout: float = None,
+        pool_size: int = None,
+        health_ttl: float = None,
+    ):
+        self.base_url = (base_url or OLLAMA_BASE_URL).rstrip("/")
+        self.timeout = timeout or OLLAMA_TIMEOUT
+        self.connect_timeout = connect_timeout or OLLAMA_CONNECT_TIMEOUT
+        self.health_ttl = OLLAMA_HEALTH_TTL if health_ttl is None else health_ttl
+        self.pool_size = 0
+        self.session = requests.Session()
+        self._lock = threading.Lock()
+        self._tags = None
+        self._tags_at = 0.0
+        self.ensure_pool_size(pool_size or max(OLLAMA_MAX_WORKERS, 1))
+    
+    def ensure_pool_size(self, size: int) -> None:
+        """Amplía el pool si la concurrencia pedida supera el tamaño actual"""
+        with self._lock:
+            if size <= self.pool_size:
+                return
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+            self.pool_size = size
+    
+    def tags(self, *, max_age: Optional[float] = None) -> dict:
+        """
+        GET /api/tags, reutilizando la última respuesta si tiene menos de max_age segundos.
+        
+        Raises:
+            requests.exceptions.RequestException: si falla la petición
+        """
+        max_age = self.health_ttl if max_age is None else max_age
+        with self._lock:
+            if self._tags is not None and time.monotonic() - self._tags_at < max_age:
+                return self._tags
+        
+        response = self.session.get(f"{self.base_url}/api/tags", timeout=(self.connect_timeout, 5))
+        response.raise_for_status()
+        tags = response.json()
+        with self._lock:
+            self._tags, self._tags_at = tags, time.monotonic()
+        return tags
+    
+    def generate(self, prompt: str, model: str, *, stream: bool = False) -> requests.Response:
+        """
+        POST /api/generate. Con stream=True el cuerpo queda sin leer (usar con `with`).
+        
+        Raises:
+            requests.exceptions.RequestException: si falla la petición
+        """
+        response = self.session.post(
+            f"{self.base_url}/api/generate",
+            json={
+                "model": model,
+                "prompt": prompt,
+                "stream": stream,
+                "temperature": OLLAMA_TEMPERATURE,
+            },
+            stream=stream,
+            timeout=(self.connect_timeout, self.timeout),
+        )
+        response.raise_for_status()
+        return response
+    
+    def close(self) -> None:
+        self.session.close()
+
+
+_client: Optional[OllamaClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> OllamaClient:
+    """Devuelve el cliente Ollama compartido (creándolo la primera vez)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = OllamaClient()
+        return _client
+
+
+def configure_client(client: Optional[OllamaClient] = None, **kwargs) -> OllamaClient:
+    """
+    Sustituye el cliente compartido (ej: otra base_url o timeouts).
+    
+    Acepta los mismos argumentos que OllamaClient, o un cliente ya
+    construido en `client` (ej: uno que solo reproduce la caché).
+    """
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = client if client is not None else OllamaClient(**kwargs)
+        return _client
+
 
-def check_ollama_health() -> bool:
-    """Verifica si Ollama está disponible y el modelo está cargado"""
+def check_ollama_health(force: bool = False) -> bool:
+    """
+    Verifica si Ollama está disponible y el modelo está cargado.
+    
+    Un resultado correcto se reutiliza durante OLLAMA_HEALTH_TTL segundos
+    salvo que force=True.
+    """
     try:
-        response = requests.get(f"{OLLAMA_BASE_URL}/api/tags", timeout=2)
-        return response.status_code == 200
+        get_client().tags(max_age=0 if force else None)
+        return True
     except Exception as e:
         logger.error(f"Ollama no disponible: {e}")
         return False
@@ -69,163 +266,423 @@ def check_ollama_health() -> bool:
 def get_available_models() -> List[str]:
     """Obtiene lista de modelos disponibles en Ollama"""
     try:
-        response = requests.get(f"{OLLAMA_BASE_URL}/api/tags", timeout=5)
-        data = response.json()
+        data = get_client().tags()
         return [m.get("name", "").split(":")[0] for m in data.get("models", [])]
     except Exception as e:
         logger.error(f"Error obteniendo modelos: {e}")
         return []
 
 
-def parse_activity_with_ai(
+def configure_llm_cache(enabled: bool = True, cache_dir: Optional[Path] = None, **cache_kwargs) -> None:
+    """
+    Activa/desactiva la caché en disco de respuestas del LLM.
+    
+    Args:
+        enabled: False equivale a --no-llm-cache (siempre se llama a Ollama)
+        cache_dir: Directorio de la caché (por defecto LLM_CACHE_DIR)
+        cache_kwargs: Se pasan a LLMCache junto con cache_dir (max_bytes, max_age_seconds)
+    """
+    global _llm_cache, _llm_cache_enabled
+    _llm_cache_enabled = enabled
+    if not enabled:
+        _llm_cache = None
+    elif cache_dir is None:
+        _llm_cache = LLMCache(**cache_kwargs)
+    else:
+        _llm_cache = LLMCache(cache_dir, **cache_kwargs)
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Devuelve la caché activa (creándola la primera vez) o None si está desactivada"""
+    global _llm_cache
+    if not _llm_cache_enabled:
+        return None
+    if _llm_cache is None:
+        _llm_cache = LLMCache()
+    return _llm_cache
+
+
+def _build_prompt(day: str, text: str, month_year: str) -> str:
+    """Formatea ACTIVITY_EXTRACTION_PROMPT para una celda"""
+    year = int(month_year[:4])
+    month = int(month_year[4:])
+    month_year_formatted = f"{month:02d}/{year}"
+    
+    return ACTIVITY_EXTRACTION_PROMPT.format(
+        day=day,
+        month_year=month_year_formatted,
+        text=text
+    )
+
+
+def _generate(prompt: str, model: str) -> Optional[str]:
+    """
+    Llama a /api/generate y devuelve el texto generado.
+    
+    Raises:
+        requests.exceptions.RequestException: si falla la petición
+    """
+    start = time.perf_counter()
+    timing.add_counts(requests=1, prompt_chars=len(prompt))
+    try:
+        response = get_client().generate(prompt, model)
+        result = response.json()
+    except Exception:
+        LLM_REQUESTS.inc(model=model, result="error")
+        raise
+    finally:
+        LLM_REQUEST_SECONDS.observe(time.perf_counter() - start, model=model)
+    LLM_REQUESTS.inc(model=model, result="ok")
+    _observe_llm_tokens(result, model)
+    
+    if "response" not in result:
+        logger.error("Respuesta sin 'response' key")
+        return None
+    
+    return result["response"].strip()
+
+
+def _observe_llm_tokens(result: dict, model: str) -> None:
+    """Tokens de una respuesta completa (la última línea en streaming)"""
+    if "prompt_eval_count" in result:
+        LLM_PROMPT_TOKENS.observe(result["prompt_eval_count"], model=model)
+    if "eval_count" in result:
+        LLM_EVAL_TOKENS.observe(result["eval_count"], model=model)
+    timing.add_counts(
+        prompt_tokens=result.get("prompt_eval_count", 0),
+        eval_tokens=result.get("eval_count", 0),
+    )
+
+
+def _generate_stream(prompt: str, model: str):
+    """
+    Generador de fragmentos de texto de /api/generate con stream=True.
+    
+    Cerrar el generador cierra la conexión, y Ollama aborta la generación.
+    Es el caso normal (se corta al cerrarse el array JSON): la petición
+    cuenta con result="cutoff" y sin tokens, que solo llegan al final.
+    
+    Raises:
+        requests.exceptions.RequestException: si falla la petición
+    """
+    start = time.perf_counter()
+    timing.add_counts(requests=1, prompt_chars=len(prompt))
+    result = "ok"
+    try:
+        with get_client().generate(prompt, model, stream=True) as response:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if chunk.get("response"):
+                    yield chunk["response"]
+                if chunk.get("done"):
+                    _observe_llm_tokens(chunk, model)
+                    return
+    except GeneratorExit:
+        result = "cutoff"
+        raise
+    except Exception:
+        result = "error"
+        raise
+    finally:
+        LLM_REQUESTS.inc(model=model, result=result)
+        LLM_REQUEST_SECONDS.observe(time.perf_counter() - start, model=model)
+
+
+class JsonArrayStream:
+    """
+    Parser incremental de un array JSON de nivel superior.
+    
+    Ignora lo que haya antes del primer "[" (markdown, texto) y va
+    devolviendo el texto de cada elemento objeto/array en cuanto se cierra.
+    `closed` pasa a True al cerrarse el array, y lo que venga después se ignora.
+    """
+    
+    def __init__(self):
+        self.started = False
+        self.closed = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._current = []
+    
+    def feed(self, chunk: str) -> List[str]:
+        completed = []
+        for ch in chunk:
+            if self.closed:
+                break
+            if not self.started:
+                if ch == "[":
+                    self.started = True
+                    self._depth = 1
+                continue
+            
+            if self._depth > 1:
+                self._current.append(ch)
+            
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                if self._depth == 1:
+                    self._current = [ch]
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 1:
+                    completed.append("".join(self._current))
+                    self._current = []
+                elif self._depth == 0:
+                    self.closed = True
+        return completed
+
+
+def _stream_activities(prompt: str, day: str, month_year: str, model: str, raw_parts: Optional[list] = None):
+    """
+    Genera las actividades normalizadas y válidas a medida que el modelo cierra cada objeto.
+    
+    Si raw_parts es una lista, se le añaden los fragmentos de texto recibidos.
+    """
+    parser = JsonArrayStream()
+    chunks = _generate_stream(prompt, model)
+    try:
+        for chunk in chunks:
+            if raw_parts is not None:
+                raw_parts.append(chunk)
+            for element in parser.feed(chunk):
+                obj, strategy = parse_json_with_recovery(element)
+                if obj is None:
+                    logger.warning(f"Elemento JSON inválido de IA en día {day}: {element[:100]}")
+                    continue
+                if strategy:
+                    logger.info(f"JSON recuperado usando estrategia: {strategy}")
+                validated, _ = _normalize_activities(obj, day, month_year)
+                yield from validated
+            if parser.closed:
+                logger.debug(f"Array JSON cerrado en día {day}: cortando generación")
+                break
+    finally:
+        chunks.close()
+    
+    if not parser.started:
+        logger.warning(f"No se encontró JSON en respuesta: {''.join(raw_parts or [])[:100]}")
+    elif not parser.closed:
+        logger.warning(f"Respuesta IA terminó sin cerrar el array JSON en día {day}")
+
+
+def iter_activities_streaming(
     day: str,
     text: str,
     month_year: str,
     model: str = OLLAMA_MODEL,
     civico: str = ""
+):
+    """
+    Como parse_activity_with_ai, pero en streaming: genera cada actividad
+    en cuanto el modelo cierra su objeto JSON y corta la generación al
+    cerrarse el array (sin pasar por la caché LLM).
+    
+    Raises:
+        requests.exceptions.RequestException: si falla la petición
+    """
+    civico_str = f" [{civico}]" if civico else ""
+    logger.info(f"Enviando a IA en streaming (modelo: {model}){civico_str}: día={day}")
+    yield from _stream_activities(_build_prompt(day, text, month_year), day, month_year, model)
+
+
+def parse_json_with_recovery(json_str: str):
+    """
+    Intenta parsear JSON con varias estrategias de recuperación.
+    
+    Returns:
+        (objeto, estrategia) si alguna funciona (estrategia None = parseo directo)
+        (None, primer_error) si todas fallan
+    """
+    obj, strategy = _parse_json_strategies(json_str)
+    if strategy is None:
+        JSON_RECOVERY.inc(strategy="directo")
+    elif isinstance(strategy, str):
+        JSON_RECOVERY.inc(strategy=strategy)
+    else:
+        JSON_RECOVERY.inc(strategy="fallido")
+    return obj, strategy
+
+
+def _parse_json_strategies(json_str: str):
+    # Estrategia 1: Parseo directo
+    try:
+        return json.loads(json_str), None
+    except json.JSONDecodeError as e:
+        first_error = e
+    
+    # Estrategia 2: Reemplazar comillas simples por dobles
+    try:
+        json_str_cleaned = json_str.replace("'", '"')
+        return json.loads(json_str_cleaned), "reemplazar comillas simples"
+    except json.JSONDecodeError:
+        pass
+    
+    # Estrategia 3: Eliminar comas finales
+    try:
+        json_str_cleaned = json_str.replace(",]", "]").replace(",}", "}")
+        return json.loads(json_str_cleaned), "eliminar comas finales"
+    except json.JSONDecodeError:
+        pass
+    
+    # Estrategia 4: Escapar newlines y tabs dentro de strings
+    try:
+        # Reemplazar \n y \t literales dentro de strings por espacios
+        json_str_cleaned = json_str.replace("\\n", " ").replace("\\t", " ")
+        return json.loads(json_str_cleaned), "escapar newlines/tabs"
+    except json.JSONDecodeError:
+        pass
+    
+    # Estrategia 5: Procesar escapes inválidos (ej: \P, \C, etc)
+    try:
+        # Encontrar todos los escapes inválidos y reemplazarlos por espacio
+        json_str_cleaned = re.sub(r'\\[^"\\\n\r\t/bfntu]', ' ', json_str)
+        return json.loads(json_str_cleaned), "escapar caracteres inválidos"
+    except json.JSONDecodeError:
+        pass
+    
+    # Si todas las estrategias fallan
+    return None, first_error
+
+
+def _activities_from_response(raw_response: str, day: str, month_year: str) -> Optional[List[Dict]]:
+    """
+    Extrae, normaliza y valida las actividades de la respuesta del modelo.
+    
+    Returns:
+        Lista de actividades válidas o None si no hay ninguna
+    """
+    logger.debug(f"Respuesta IA: {raw_response[:200]}...")
+    
+    # Extrae JSON de la respuesta (puede estar envuelto en markdown)
+    json_start = raw_response.find("[")
+    json_end = raw_response.rfind("]") + 1
+    
+    if json_start == -1 or json_end <= json_start:
+        logger.warning(f"No se encontró JSON en respuesta: {raw_response[:100]}")
+        return None
+    
+    json_str = raw_response[json_start:json_end]
+    
+    activities, strategy = parse_json_with_recovery(json_str)
+    
+    if activities is None:
+        logger.error(f"JSON inválido de IA en día {day}")
+        logger.debug(f"JSON inválido (primeros 300 chars): {json_str[:300]}")
+        logger.debug(f"JSON inválido (últimos 300 chars): {json_str[-300:]}")
+        return None
+    
+    if strategy:
+        logger.info(f"JSON recuperado usando estrategia: {strategy}")
+    
+    validated, _ = _normalize_activities(activities, day, month_year)
+    return validated if validated else None
+
+
+def _normalize_activities(activities, day: str, month_year: str) -> tuple[List[Dict], bool]:
+    """
+    Normaliza y valida las actividades devueltas por el modelo para una celda.
+    
+    Returns:
+        (actividades válidas, True si ninguna se descartó)
+    """
+    # Asegurar que es una lista
+    if not isinstance(activities, list):
+        activities = [activities]
+    
+    # Normalizar y validar cada actividad
+    validated = []
+    for act in activities:
+        if not isinstance(act, dict):
+            logger.warning(f"Actividad no es dict: {act}")
+            continue
+        
+        # Verificar campos mínimos antes de normalizar
+        if not all(k in act for k in ["nombre", "fecha", "requiere_inscripcion", "publico"]):
+            logger.warning(f"Campos mínimos faltantes en: {act}")
+            continue
+        
+        # Normalizar
+        act = _normalize_activity(act, day, int(month_year[4:]), int(month_year[:4]))
+        
+        # Validar después de normalizar
+        is_valid, error_msg = _validate_normalized_activity(act)
+        if is_valid:
+            validated.append(act)
+        else:
+            logger.warning(f"Validación fallida: {error_msg} - {act.get('nombre', 'sin nombre')}")
+    
+    return validated, len(validated) == len(activities)
+
+
+def parse_activity_with_ai(
+    day: str,
+    text: str,
+    month_year: str,
+    model: str = OLLAMA_MODEL,
+    civico: str = "",
+    stream: Optional[bool] = None,
 ) -> Optional[List[Dict]]:
     """
     Usa Ollama para parsear una actividad/celda.
     
+    Si la caché LLM está activa y el mismo prompt ya se resolvió con el
+    mismo modelo y temperatura, devuelve las actividades guardadas sin
+    llamar a Ollama.
+    
     Args:
         day: Día del mes (ej: "17")
         text: Texto bruto de la actividad
         month_year: Mes y año (ej: "202512")
         model: Modelo de Ollama a usar
         civico: ID del civico para logging (opcional)
+        stream: Consumir la respuesta en streaming y cortar al cerrarse
+            el array JSON (por defecto OLLAMA_STREAM)
     
     Returns:
         Lista de actividades parseadas o None si falla
     """
+    prompt = _build_prompt(day, text, month_year)
+    civico_str = f" [{civico}]" if civico else ""
     
-    # Formatear fecha para el prompt
-    year = int(month_year[:4])
-    month = int(month_year[4:])
-    month_year_formatted = f"{month:02d}/{year}"
-    
-    prompt = ACTIVITY_EXTRACTION_PROMPT.format(
-        day=day,
-        month_year=month_year_formatted,
-        text=text
-    )
+    cache = get_llm_cache()
+    key = cache_key(model=model, prompt=prompt, temperature=OLLAMA_TEMPERATURE)
+    if cache is not None:
+        entry = cache.get(key)
+        if entry is not None:
+            logger.debug(f"Caché LLM{civico_str}: día={day}")
+            timing.add_counts(cache_hits=1)
+            LLM_CACHE_HITS.inc()
+            return entry["activities"]
     
     try:
-        civico_str = f" [{civico}]" if civico else ""
         logger.info(f"Enviando a IA (modelo: {model}){civico_str}: día={day}")
         
-        response = requests.post(
-            f"{OLLAMA_BASE_URL}/api/generate",
-            json={
-                "model": model,
-                "prompt": prompt,
-                "stream": False,
-                "temperature": 0.2,  # Bajo para respuestas consistentes
-            },
-            timeout=300  # 5 minutos para primera carga y procesamiento
-        )
-        
-        response.raise_for_status()
-        result = response.json()
-        
-        if "response" not in result:
-            logger.error("Respuesta sin 'response' key")
-            return None
-        
-        raw_response = result["response"].strip()
-        logger.debug(f"Respuesta IA: {raw_response[:200]}...")
-        
-        # Extrae JSON de la respuesta (puede estar envuelto en markdown)
-        json_start = raw_response.find("[")
-        json_end = raw_response.rfind("]") + 1
-        
-        if json_start == -1 or json_end <= json_start:
-            logger.warning(f"No se encontró JSON en respuesta: {raw_response[:100]}")
-            return None
-        
-        json_str = raw_response[json_start:json_end]
-        
-        # Función auxiliar para recuperar JSON con múltiples estrategias
-        def parse_json_with_recovery(json_str):
-            """Intenta parsear JSON con varias estrategias de recuperación"""
-            
-            # Estrategia 1: Parseo directo
-            try:
-                return json.loads(json_str), None
-            except json.JSONDecodeError as e:
-                first_error = e
-            
-            # Estrategia 2: Reemplazar comillas simples por dobles
-            try:
-                json_str_cleaned = json_str.replace("'", '"')
-                return json.loads(json_str_cleaned), "reemplazar comillas simples"
-            except json.JSONDecodeError:
-                pass
-            
-            # Estrategia 3: Eliminar comas finales
-            try:
-                json_str_cleaned = json_str.replace(",]", "]").replace(",}", "}")
-                return json.loads(json_str_cleaned), "eliminar comas finales"
-            except json.JSONDecodeError:
-                pass
-            
-            # Estrategia 4: Escapar newlines y tabs dentro de strings
-            try:
-                # Reemplazar \n y \t literales dentro de strings por espacios
-                json_str_cleaned = json_str.replace("\\n", " ").replace("\\t", " ")
-                return json.loads(json_str_cleaned), "escapar newlines/tabs"
-            except json.JSONDecodeError:
-                pass
-            
-            # Estrategia 5: Procesar escapes inválidos (ej: \P, \C, etc)
-            try:
-                # Encontrar todos los escapes inválidos y reemplazarlos por espacio
-                json_str_cleaned = re.sub(r'\\[^"\\\n\r\t/bfntu]', ' ', json_str)
-                return json.loads(json_str_cleaned), "escapar caracteres inválidos"
-            except json.JSONDecodeError:
-                pass
-            
-            # Si todas las estrategias fallan
-            return None, first_error
-        
-        activities, strategy = parse_json_with_recovery(json_str)
-        
-        if activities is None:
-            logger.error(f"JSON inválido de IA en día {day}")
-            logger.debug(f"JSON inválido (primeros 300 chars): {json_str[:300]}")
-            logger.debug(f"JSON inválido (últimos 300 chars): {json_str[-300:]}")
-            return None
-        
-        if strategy:
-            logger.info(f"JSON recuperado usando estrategia: {strategy}")
-        
-        
-        # Asegurar que es una lista
-        if not isinstance(activities, list):
-            activities = [activities]
+        if OLLAMA_STREAM if stream is None else stream:
+            raw_parts = []
+            validated = list(_stream_activities(prompt, day, month_year, model, raw_parts)) or None
+            raw_response = "".join(raw_parts)
+        else:
+            raw_response = _generate(prompt, model)
+            if raw_response is None:
+                return None
+            validated = _activities_from_response(raw_response, day, month_year)
         
-        # Normalizar y validar cada actividad
-        validated = []
-        for act in activities:
-            if not isinstance(act, dict):
-                logger.warning(f"Actividad no es dict: {act}")
-                continue
-            
-            # Verificar campos mínimos antes de normalizar
-            if not all(k in act for k in ["nombre", "fecha", "requiere_inscripcion", "publico"]):
-                logger.warning(f"Campos mínimos faltantes en: {act}")
-                continue
-            
-            # Normalizar
-            act = _normalize_activity(act, day, int(month_year[4:]), int(month_year[:4]))
-            
-            # Validar después de normalizar
-            is_valid, error_msg = _validate_normalized_activity(act)
-            if is_valid:
-                validated.append(act)
-            else:
-                logger.warning(f"Validación fallida: {error_msg} - {act.get('nombre', 'sin nombre')}")
+        if validated and cache is not None:
+            cache.put(key, model=model, raw_response=raw_response, activities=validated)
         
-        return validated if validated else None
+        return validated
         
     except requests.exceptions.RequestException as e:
         logger.error(f"Error llamando a Ollama: {e}")
@@ -238,6 +695,131 @@ def parse_activity_with_ai(
         return None
 
 
+def _build_batch_prompt(cells: List[tuple], month_year: str) -> str:
+    """Formatea ACTIVITY_BATCH_EXTRACTION_PROMPT para varias celdas (día, texto)"""
+    year = int(month_year[:4])
+    month = int(month_year[4:])
+    rows = "\n".join(
+        BATCH_ROW_TEMPLATE.format(key=f"r{i}", day=day, text=text.replace("\n", " "))
+        for i, (day, text) in enumerate(cells)
+    )
+    return ACTIVITY_BATCH_EXTRACTION_PROMPT.format(month_year=f"{month:02d}/{year}", rows=rows)
+
+
+def _pack_batches(cells: List[tuple], batch_size: int, max_chars: int) -> List[List[tuple]]:
+    """
+    Agrupa celdas consecutivas en lotes de como máximo batch_size filas
+    y max_chars caracteres de texto (una celda más larga va sola).
+    """
+    batches = []
+    current = []
+    current_chars = 0
+    for cell in cells:
+        size = len(cell[1])
+        if current and (len(current) >= batch_size or current_chars + size > max_chars):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(cell)
+        current_chars += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def parse_batch_with_ai(
+    cells: List[tuple],
+    month_year: str,
+    model: str = OLLAMA_MODEL,
+    civico: str = ""
+) -> List[Optional[List[Dict]]]:
+    """
+    Parsea varias celdas (día, texto) con una sola petición a Ollama.
+    
+    Las filas cuya sub-respuesta falta, está vacía o contiene alguna actividad
+    que no pasa _validate_normalized_activity se reintentan individualmente
+    con parse_activity_with_ai.
+    
+    Args:
+        cells: Lista de (día, texto)
+        month_year: Mes y año (ej: "202512")
+        model: Modelo de Ollama a usar
+        civico: ID del civico para logging (opcional)
+    
+    Returns:
+        Una entrada por celda, en el mismo orden: lista de actividades o None
+    """
+    if len(cells) == 1:
+        day, text = cells[0]
+        return [parse_activity_with_ai(day, text, month_year, model=model, civico=civico)]
+    
+    prompt = _build_batch_prompt(cells, month_year)
+    civico_str = f" [{civico}]" if civico else ""
+    days = ",".join(day for day, _ in cells)
+    
+    cache = get_llm_cache()
+    key = cache_key(model=model, prompt=prompt, temperature=OLLAMA_TEMPERATURE)
+    if cache is not None:
+        entry = cache.get(key)
+        if entry is not None:
+            logger.debug(f"Caché LLM{civico_str}: días={days}")
+            timing.add_counts(cache_hits=1)
+            LLM_CACHE_HITS.inc()
+            return [entry["activities"].get(f"r{i}") for i in range(len(cells))]
+    
+    by_row = {}
+    try:
+        logger.info(f"Enviando lote a IA (modelo: {model}){civico_str}: días={days}")
+        raw_response = _generate(prompt, model)
+        by_row = _batch_rows_from_response(raw_response, len(cells)) if raw_response else {}
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Error llamando a Ollama: {e}")
+    except Exception as e:
+        logger.error(f"Error inesperado: {e}")
+    
+    results = []
+    fallbacks = 0
+    for i, (day, text) in enumerate(cells):
+        items = by_row.get(f"r{i}")
+        validated, all_valid = _normalize_activities(items, day, month_year) if items else ([], False)
+        if not validated or not all_valid:
+            # Reintento individual para esta fila
+            fallbacks += 1
+            validated = parse_activity_with_ai(day, text, month_year, model=model, civico=civico)
+        results.append(validated or None)
+    
+    if fallbacks:
+        logger.info(f"Lote{civico_str}: {fallbacks}/{len(cells)} filas reintentadas individualmente")
+    elif cache is not None:
+        cache.put(
+            key,
+            model=model,
+            raw_response=raw_response,
+            activities={f"r{i}": acts for i, acts in enumerate(results)},
+        )
+    
+    return results
+
+
+def _batch_rows_from_response(raw_response: str, n_rows: int) -> Dict[str, list]:
+    """Extrae el objeto {"r0": [...], ...} de la respuesta por lotes"""
+    json_start = raw_response.find("{")
+    json_end = raw_response.rfind("}") + 1
+    
+    if json_start == -1 or json_end <= json_start:
+        logger.warning(f"No se encontró JSON en respuesta por lotes: {raw_response[:100]}")
+        return {}
+    
+    obj, strategy = parse_json_with_recovery(raw_response[json_start:json_end])
+    if not isinstance(obj, dict):
+        logger.warning(f"Respuesta por lotes no es un objeto JSON ({n_rows} filas)")
+        return {}
+    
+    if strategy:
+        logger.info(f"JSON recuperado usando estrategia: {strategy}")
+    
+    return obj
+
+
 def _validate_normalized_activity(activity: dict) -> tuple[bool, str]:
     """
     Valida que una actividad normalizada cumpla con nuestro esquema esperado.
@@ -517,7 +1099,14 @@ def _normalize_activity(activity: dict, day: str, month: int, year: int) -> dict
     return activity
 
 
-def parse_raw_ai(raw_rows: List[List[str]], *, month: str, civico: str = "") -> List[Dict]:
+def parse_raw_ai(
+    raw_rows: List[List[str]],
+    *,
+    month: str,
+    civico: str = "",
+    max_workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
+) -> List[Dict]:
     """
     Parsea filas raw usando IA.
     
@@ -525,11 +1114,16 @@ def parse_raw_ai(raw_rows: List[List[str]], *, month: str, civico: str = "") ->
         raw_rows: Lista de [día, texto] extraído del PDF
         month: Mes en formato YYYYMM
         civico: ID del civico para logging (opcional)
+        max_workers: Peticiones simultáneas a Ollama (por defecto OLLAMA_MAX_WORKERS).
+            Los resultados se recogen en el orden original de las filas.
+        batch_size: Celdas por petición (por defecto OLLAMA_BATCH_SIZE). Con más
+            de 1 se usa el prompt por lotes, limitado a OLLAMA_BATCH_MAX_CHARS.
     
     Returns:
         Lista de actividades estructuradas
     """
     actividades = []
+    civico_str = f" [{civico}]" if civico else ""
     
     # Verificar Ollama disponible
     if not check_ollama_health():
@@ -537,9 +1131,12 @@ def parse_raw_ai(raw_rows: List[List[str]], *, month: str, civico: str = "") ->
         logger.error(f"Descarga un modelo: ollama pull {OLLAMA_MODEL}")
         return []
     
+    # Preparar celdas (día, texto) a enviar
+    cells = []
     for row in raw_rows:
         if len(row) < 2:
             logger.warning(f"Fila inválida: {row}")
+            ROWS.inc(civico=civico, parser="llm", result="discarded")
             continue
         
         day_cell = row[0].strip()
@@ -551,39 +1148,64 @@ def parse_raw_ai(raw_rows: List[List[str]], *, month: str, civico: str = "") ->
             day_parts = day_cell.split()
             day_num = day_parts[-1]  # Último elemento es el día
         except Exception as e:
-            civico_str = f" [{civico}]" if civico else ""
             logger.warning(f"No se pudo extraer día{civico_str} de '{day_cell}': {e}")
+            ROWS.inc(civico=civico, parser="llm", result="discarded")
             continue
         
-        # Llamar a IA
-        parsed_activities = parse_activity_with_ai(
-            day=day_num,
-            text=text_cell,
-            month_year=month,
-            civico=civico
-        )
-        
+        cells.append((day_num, text_cell))
+    
+    # Llamar a IA por lotes (en paralelo si max_workers > 1)
+    batches = _pack_batches(cells, batch_size or OLLAMA_BATCH_SIZE, OLLAMA_BATCH_MAX_CHARS)
+    
+    def _parse_batch(batch):
+        # Un span por petición (con sus reintentos individuales) para el informe de la ejecución
+        with timing.span("llm", civico=civico, rows=len(batch)):
+            return parse_batch_with_ai(batch, month_year=month, civico=civico)
+    
+    workers = max_workers or OLLAMA_MAX_WORKERS
+    get_client().ensure_pool_size(workers)
+    batch_results = _map_ordered(_parse_batch, batches, workers)
+    results = [parsed for batch in batch_results for parsed in batch]
+    
+    for (_, text_cell), parsed_activities in zip(cells, results):
         if parsed_activities:
             actividades.extend(parsed_activities)
+            ROWS.inc(civico=civico, parser="llm", result="parsed")
         else:
-            civico_str = f" [{civico}]" if civico else ""
             logger.warning(f"IA no pudo parsear{civico_str}: {text_cell[:50]}")
+            ROWS.inc(civico=civico, parser="llm", result="discarded")
     
     # Validar y filtrar actividades con validación completa
     valid_activities = []
-    civico_str = f" [{civico}]" if civico else ""
     for act in actividades:
         is_valid, error_msg = _validate_normalized_activity(act)
         if is_valid:
             valid_activities.append(act)
         else:
             logger.warning(f"Actividad descartada{civico_str}: {error_msg} - {act.get('nombre', 'sin nombre')}")
+            ACTIVITIES_DISCARDED.inc(civico=civico)
     
     # Ordenar por fecha
     valid_activities.sort(key=_sort_key)
     return valid_activities
 
 
+def _map_ordered(fn, items: list, max_workers: int) -> list:
+    """
+    Aplica fn a cada elemento con como máximo max_workers llamadas en vuelo.
+    
+    Devuelve los resultados en el mismo orden que items.
+    """
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)),
+        thread_name_prefix="ollama",
+    ) as executor:
+        return list(executor.map(fn, items))
+
+
 def _sort_key(activity: dict):
     """Clave de ordenamiento por fecha y hora"""
     try:
@@ -614,11 +1236,11 @@ def extract_raw_ai(pdf_path: Path) -> List[List[str]]:
     Para ahora, reutiliza la lógica de Gamonal, pero en el futuro
     podría usar OCR u otro método.
     """
-    import camelot
+    from src.parser.common.camelot_extract import read_pdf_tables
     
     logger.info(f"Extrayendo tablas (Camelot): {pdf_path.name}")
     
-    tables = camelot.read_pdf(str(pdf_path), pages="all")
+    tables = read_pdf_tables(pdf_path)
     
     if not tables:
         logger.warning(f"No se detectaron tablas en {pdf_path.name}")
@@ -0,0 +1,12 @@
+"""
+Parser de Centro Cívico Capiscol.
+"""
+
+PLUGIN = {
+    "id": "capiscol",
+    "title": "Centro Cívico Capiscol",
+    "title_pattern": r"capiscol",
+    "flavor": "stream",
+    "extract_raw": "src.parser.capiscol.extract_raw:extract_raw_capiscol",
+    "parse_raw": "src.parser.ai_parser:parse_raw_ai",
+}
@@ -1,5 +1,6 @@
 import logging
-import camelot
+from src.parser.common.camelot_extract import read_pdf_tables
+from src.parser.capiscol import PLUGIN
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +15,8 @@ def process_pdf_capiscol(pdf_path):
     """
     logger.info("Extrayendo tablas (Camelot - stream): %s", pdf_path.name)
 
-    # Usa stream flavor para detectar la estructura correcta
-    tables = camelot.read_pdf(str(pdf_path), pages="all", flavor="stream")
+    # Usa stream flavor (declarado en PLUGIN) para detectar la estructura correcta
+    tables = read_pdf_tables(pdf_path, flavor=PLUGIN["flavor"])
 
     if not tables:
         logger.warning("No se detectaron tablas en %s", pdf_path.name)
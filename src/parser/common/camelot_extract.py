@@ -0,0 +1,231 @@
+"""
+Extracción de tablas con Camelot repartiendo las páginas entre procesos.
+
+camelot.read_pdf(pages="all") procesa las páginas una detrás de otra en un
+único proceso, y es el paso más caro del pipeline. read_pdf_tables divide el
+PDF en rangos de páginas contiguos, ejecuta Camelot sobre cada rango en un
+ProcessPoolExecutor y junta las tablas en orden de página.
+
+Los workers devuelven solo las celdas de cada tabla (un Table de Camelot
+serializado pesa cientos de KB por la geometría que arrastra), y el proceso
+principal las envuelve en ExtractedTable, que expone lo que usan los
+process_pdf_*: `.df` y `.page`.
+
+Esas mismas celdas se guardan en la caché de tablas (table_cache), indexada
+por el hash del PDF, la versión de Camelot y las opciones de extracción:
+reprocesar un PDF sin cambios no vuelve a ejecutar Camelot.
+
+Camelot y pandas se importan solo al extraer (o al pedir `.df`): importar
+este módulo, o el registry que lo alcanza, no carga ninguno de los dos, y
+un acierto de la caché tampoco (la versión de la clave sale de los
+metadatos del paquete).
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache, cached_property
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.parser.common.table_cache import TableCache, file_sha256, table_cache_key
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+# Procesos para extraer un PDF (0 → uno por CPU)
+CAMELOT_WORKERS = int(os.environ.get("CAMELOT_WORKERS", "0")) or (os.cpu_count() or 1)
+
+CAMELOT_PAGE_SECONDS = metrics.histogram(
+    "camelot_page_seconds", "Tiempo de extracción de Camelot por página (s)", labels=("flavor",)
+)
+
+_table_cache_enabled = os.environ.get("TABLE_CACHE_DISABLED", "") not in ("1", "true")
+_table_cache: Optional[TableCache] = None
+
+
+class ExtractedTable:
+    """Tabla extraída por Camelot: número de página, celdas como DataFrame y accuracy"""
+
+    def __init__(self, page: int, cells: List[List[str]], accuracy: Optional[float] = None):
+        self.page = page
+        self.cells = cells
+        self.accuracy = accuracy
+
+    @cached_property
+    def df(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.cells)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.df.shape
+
+    def __repr__(self) -> str:
+        return f"<ExtractedTable page={self.page} shape={self.shape}>"
+
+
+def configure_table_cache(enabled: bool = True, cache_dir: Optional[Path] = None) -> None:
+    """
+    Activa/desactiva la caché en disco de tablas extraídas por Camelot.
+
+    Args:
+        enabled: False para extraer siempre con Camelot
+        cache_dir: Directorio alternativo (por defecto TABLE_CACHE_DIR)
+    """
+    global _table_cache, _table_cache_enabled
+    _table_cache_enabled = enabled
+    _table_cache = TableCache(cache_dir) if enabled and cache_dir else None
+
+
+def table_cache_settings() -> Tuple[bool, Optional[Path]]:
+    """(enabled, cache_dir) actuales, para repetir configure_table_cache en otro proceso"""
+    return _table_cache_enabled, _table_cache.cache_dir if _table_cache is not None else None
+
+
+def get_table_cache() -> Optional[TableCache]:
+    """Devuelve la caché activa (creándola la primera vez) o None si está desactivada"""
+    global _table_cache
+    if not _table_cache_enabled:
+        return None
+    if _table_cache is None:
+        _table_cache = TableCache()
+    return _table_cache
+
+
+@cache
+def camelot_version() -> str:
+    """Versión de Camelot instalada, sin importarlo (pandas, cv2, pdfminer...)"""
+    try:
+        return version("camelot-py")
+    except PackageNotFoundError:
+        import camelot
+
+        return camelot.__version__
+
+
+def _extract_pages(pdf_path: str, pages: str, flavor: str, kwargs: Dict[str, Any]) -> List[dict]:
+    """Ejecuta Camelot sobre `pages` y devuelve [{"page", "accuracy", "cells"}, ...]"""
+    import camelot
+
+    tables = camelot.read_pdf(pdf_path, pages=pages, flavor=flavor, **kwargs)
+    return [
+        {
+            "page": int(table.page),
+            "accuracy": getattr(table, "accuracy", None),
+            "cells": table.df.values.tolist(),
+        }
+        for table in tables
+    ]
+
+
+def _timed_extract_pages(pdf_path: str, pages: str, flavor: str, kwargs: Dict[str, Any]) -> Tuple[List[dict], float]:
+    """_extract_pages más su duración, medida en el proceso que la ejecuta"""
+    start = time.perf_counter()
+    tables = _extract_pages(pdf_path, pages, flavor, kwargs)
+    return tables, time.perf_counter() - start
+
+
+def _observe_pages(tables: List[dict], seconds: float, flavor: str) -> None:
+    """Reparte la duración de un rango entre sus páginas con tablas (al menos una)"""
+    n_pages = len({t["page"] for t in tables}) or 1
+    for _ in range(n_pages):
+        CAMELOT_PAGE_SECONDS.observe(seconds / n_pages, flavor=flavor)
+
+
+def _page_numbers(pdf_path: str, pages: str, password: Optional[str]) -> List[int]:
+    """Resuelve la especificación de páginas de Camelot ("all", "1,3-5"...) a números"""
+    from camelot.handlers import PDFHandler
+
+    return list(PDFHandler(pdf_path, pages=pages, password=password).pages)
+
+
+def split_pages(page_numbers: List[int], n_chunks: int) -> List[str]:
+    """
+    Reparte las páginas en `n_chunks` rangos contiguos de tamaño similar,
+    en el formato de `pages` de Camelot ("1,2,3").
+    """
+    n_chunks = max(1, min(n_chunks, len(page_numbers)))
+    size, extra = divmod(len(page_numbers), n_chunks)
+    chunks = []
+    start = 0
+    for i in range(n_chunks):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(",".join(str(p) for p in page_numbers[start:end]))
+        start = end
+    return chunks
+
+
+def read_pdf_tables(
+    pdf_path: Path,
+    *,
+    pages: str = "all",
+    flavor: str = "lattice",
+    workers: Optional[int] = None,
+    **kwargs,
+) -> List[ExtractedTable]:
+    """
+    Equivalente a camelot.read_pdf(pdf_path, pages=..., flavor=...) con las
+    páginas repartidas entre procesos.
+
+    Si ya se está dentro de un proceso worker (p.ej. orchestrator --jobs) o
+    solo hay un rango que procesar, extrae en el proceso actual sin abrir
+    un pool anidado. Antes de extraer consulta la caché de tablas.
+
+    Args:
+        pdf_path: Ruta al PDF
+        pages: Páginas a procesar, en el formato de Camelot
+        flavor: "lattice" o "stream"
+        workers: Máximo de procesos (por defecto CAMELOT_WORKERS)
+        **kwargs: Resto de opciones de camelot.read_pdf
+
+    Returns:
+        Lista de ExtractedTable en orden de página
+    """
+    path = str(pdf_path)
+    workers = workers or CAMELOT_WORKERS
+
+    cache = get_table_cache()
+    if cache is not None:
+        pdf_sha256 = file_sha256(pdf_path)
+        key = table_cache_key(
+            pdf_sha256=pdf_sha256,
+            camelot_version=camelot_version(),
+            pages=pages,
+            flavor=flavor,
+            options=kwargs,
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            logger.debug("Caché Camelot: %s (%d tablas)", Path(path).name, len(cached))
+            return [ExtractedTable(t["page"], t["cells"], t.get("accuracy")) for t in cached]
+
+    if workers > 1 and multiprocessing.parent_process() is None:
+        try:
+            page_numbers = _page_numbers(path, pages, kwargs.get("password"))
+        except Exception as e:
+            logger.debug("No se pudieron contar las páginas de %s: %s", path, e)
+            page_numbers = []
+        chunks = split_pages(page_numbers, workers) if page_numbers else [pages]
+    else:
+        chunks = [pages]
+
+    if len(chunks) == 1:
+        timed = [_timed_extract_pages(path, chunks[0], flavor, kwargs)]
+    else:
+        logger.debug("Camelot: %d páginas de %s en %d procesos", len(page_numbers), path, len(chunks))
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            futures = [pool.submit(_timed_extract_pages, path, chunk, flavor, kwargs) for chunk in chunks]
+            timed = [future.result() for future in futures]
+
+    for result, seconds in timed:
+        _observe_pages(result, seconds, flavor)
+    tables = [table for result, _ in timed for table in result]
+    if cache is not None:
+        cache.put(key, pdf_sha256=pdf_sha256, camelot_version=camelot_version(), flavor=flavor, tables=tables)
+
+    return [ExtractedTable(t["page"], t["cells"], t["accuracy"]) for t in tables]
@@ -0,0 +1,71 @@
+"""
+Caché persistente en disco de las tablas extraídas por Camelot.
+
+Cada entrada se direcciona por el SHA-256 de (hash del PDF, versión de
+Camelot, páginas, flavor, opciones), así que un PDF con otros bytes, otra
+versión de Camelot u otras opciones de extracción generan una clave
+distinta y nunca se reutilizan tablas obsoletas.
+
+Estructura en disco:
+    <cache_dir>/<2 primeros hex>/<sha256>.json
+    {
+      "key": "...",
+      "pdf_sha256": "...",
+      "camelot": "2.0.0",
+      "flavor": "lattice",
+      "created_at": 1767000000.0,
+      "tables": [{"page": 1, "accuracy": 99.1, "cells": [["LUNES 1", "..."], ...]}, ...]
+    }
+
+Las entradas ocupan unos pocos KB por PDF; las que llevan más de
+max_age_seconds sin usarse se descartan al leerlas (DiskCache).
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.utils.disk_cache import DiskCache
+
+TABLE_CACHE_DIR = Path(os.environ.get("TABLE_CACHE_DIR", ".cache/camelot"))
+TABLE_CACHE_MAX_AGE_DAYS = float(os.environ.get("TABLE_CACHE_MAX_AGE_DAYS", "365"))
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 del contenido del fichero, leído por bloques"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def table_cache_key(*, pdf_sha256: str, camelot_version: str, pages: str, flavor: str, options: Dict[str, Any]) -> str:
+    """Hash estable de todo lo que determina las tablas extraídas"""
+    payload = json.dumps(
+        [pdf_sha256, camelot_version, pages, flavor, options],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=repr,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TableCache(DiskCache):
+    name = "Camelot"
+
+    def __init__(
+        self,
+        cache_dir: Path = TABLE_CACHE_DIR,
+        *,
+        max_age_seconds: float = TABLE_CACHE_MAX_AGE_DAYS * 86400,
+    ):
+        super().__init__(cache_dir, max_age_seconds=max_age_seconds)
+
+    def _unpack(self, entry: dict) -> List[dict]:
+        return entry["tables"]
+
+    def put(self, key: str, *, pdf_sha256: str, camelot_version: str, flavor: str, tables: List[dict]) -> None:
+        self._put(key, {"pdf_sha256": pdf_sha256, "camelot": camelot_version, "flavor": flavor, "tables": tables})
@@ -0,0 +1,325 @@
+"""
+Evaluación de parsers contra meses verificados.
+
+Reproduce las filas de docs/data/<mes>/actividades_raw_<civico>.json con uno
+o varios parse_raw y compara el resultado con las actividades verificadas a
+mano de docs/data/<mes>/actividades.json:
+
+- Precisión/recall por campo (fecha, hora, publico, lugar, edades, precio).
+  Las actividades se emparejan por nombre parecido, prefiriendo misma fecha
+  y hora; un valor predicho cuenta como acierto si coincide (sin tildes,
+  mayúsculas ni espacios extra) con el de su pareja. Los valores nulos no
+  cuentan: un valor predicho de más baja la precisión y uno que falta baja
+  el recall.
+- Filas/s y latencia p50/p95 por fila y cívico. Cada fila se parsea en una
+  llamada propia a parse_raw, así que no se mide el efecto de los lotes ni
+  del paralelismo (eso lo cubren los benchmarks). Con --batched cada cívico
+  se parsea en una sola llamada (parse_raw_ai arma los mismos lotes que en
+  el pipeline) y solo se mide filas/s.
+
+Parsers (--parser, repetible): "registry" (el parse_raw registrado de cada
+cívico), "ai" (parse_raw_ai) o cualquier ruta "modulo:funcion".
+
+Para el parser IA sin Ollama real:
+- --ollama-url apunta a otro servidor (ej: un Ollama simulado)
+- --cassette DIR reproduce solo respuestas ya guardadas en una caché LLM
+  (las que faltan cuentan como filas sin actividades). Con OLLAMA_BATCH_SIZE
+  > 1 la caché guarda lotes, no filas sueltas, así que --cassette activa
+  --batched: fila a fila no se acertaría ninguna clave.
+
+Uso:
+    python -m src.parser.evaluate 202601 202602
+    python -m src.parser.evaluate 202601 --civico gamonal_norte --parser registry --parser ai --cassette .cache/llm
+    python -m src.parser.evaluate 202601 --json .cache/eval_202601.json
+"""
+
+import argparse
+import json
+import logging
+import math
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from src.publish.search_index import fold
+from src.utils.atomic_write import atomic_write_json
+from src.utils.logging_config import setup_logging
+from src.utils.timing import percentile
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("fecha", "hora", "publico", "lugar", "edad_minima", "edad_maxima", "precio")
+PARSER_ALIASES = {
+    "ai": "src.parser.ai_parser:parse_raw_ai",
+}
+# Similitud mínima de nombres para emparejar dos actividades
+MATCH_THRESHOLD = 0.6
+SAME_DATE_BONUS = 0.2
+SAME_HOUR_BONUS = 0.05
+
+
+def raw_path(month_dir: Path, civico: str) -> Path:
+    return month_dir / f"actividades_raw_{civico}.json"
+
+
+def normalize_value(value):
+    """Valor comparable: texto sin tildes/mayúsculas/espacios extra; vacío = None"""
+    if isinstance(value, str):
+        value = " ".join(fold(value).split())
+        return value or None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def match_activities(predicted: List[dict], expected: List[dict]) -> List[Tuple[int, int]]:
+    """
+    Empareja actividades predichas y verificadas (índices), de la pareja más
+    parecida a la menos, cada actividad como mucho una vez.
+    """
+    names = [fold(a.get("nombre") or "") for a in expected]
+    candidates = []
+    for i, activity in enumerate(predicted):
+        name = fold(activity.get("nombre") or "")
+        for j, other in enumerate(expected):
+            matcher = SequenceMatcher(None, name, names[j], autojunk=False)
+            if matcher.quick_ratio() < MATCH_THRESHOLD:
+                continue
+            ratio = matcher.ratio()
+            if ratio < MATCH_THRESHOLD:
+                continue
+            score = ratio
+            if activity.get("fecha") == other.get("fecha"):
+                score += SAME_DATE_BONUS
+            if activity.get("hora") == other.get("hora"):
+                score += SAME_HOUR_BONUS
+            candidates.append((score, i, j))
+
+    candidates.sort(key=lambda c: (-c[0], c[1], c[2]))
+    used_predicted, used_expected, pairs = set(), set(), []
+    for _, i, j in candidates:
+        if i in used_predicted or j in used_expected:
+            continue
+        used_predicted.add(i)
+        used_expected.add(j)
+        pairs.append((i, j))
+    return sorted(pairs)
+
+
+def field_scores(predicted: List[dict], expected: List[dict], fields: Iterable[str] = FIELDS) -> dict:
+    """
+    Precisión y recall por campo, más las de las actividades en sí.
+
+    Returns:
+        {"activities": {...}, "fields": {campo: {...}}} donde cada entrada
+        tiene tp, predicted, expected, precision y recall (None sin datos)
+    """
+    pairs = match_activities(predicted, expected)
+
+    def scores(tp, n_predicted, n_expected):
+        return {
+            "tp": tp,
+            "predicted": n_predicted,
+            "expected": n_expected,
+            "precision": tp / n_predicted if n_predicted else None,
+            "recall": tp / n_expected if n_expected else None,
+        }
+
+    result = {"activities": scores(len(pairs), len(predicted), len(expected)), "fields": {}}
+    for field in fields:
+        tp = sum(
+            1 for i, j in pairs
+            if normalize_value(predicted[i].get(field)) is not None
+            and normalize_value(predicted[i].get(field)) == normalize_value(expected[j].get(field))
+        )
+        n_predicted = sum(1 for a in predicted if normalize_value(a.get(field)) is not None)
+        n_expected = sum(1 for a in expected if normalize_value(a.get(field)) is not None)
+        result["fields"][field] = scores(tp, n_predicted, n_expected)
+    return result
+
+
+def replay(
+    parse_raw: Callable, raw_rows: List[list], *, month: str, civico: str, batched: bool = False
+) -> Tuple[List[dict], List[float]]:
+    """
+    Parsea fila a fila; devuelve las actividades y la latencia de cada fila.
+    Con batched, todas las filas en una llamada (una sola latencia).
+    """
+    activities, latencies = [], []
+    for rows in [raw_rows] if batched else ([row] for row in raw_rows):
+        start = time.perf_counter()
+        try:
+            parsed = parse_raw(rows, month=month, civico=civico) or []
+        except Exception as e:
+            logger.warning("parse_raw falló [%s] en %r: %s", civico, rows[0][:1], e)
+            parsed = []
+        latencies.append(time.perf_counter() - start)
+        activities.extend(parsed)
+    return activities, latencies
+
+
+def resolve_parser(spec: str, civico: str) -> Callable:
+    from src.parser.registry import get_parser, resolve
+
+    if spec == "registry":
+        return get_parser(civico)["parse_raw"]
+    return resolve(PARSER_ALIASES.get(spec, spec))
+
+
+def evaluate_civico(
+    parse_raw: Callable, month_dir: Path, civico: str, expected: List[dict], *, batched: bool = False
+) -> dict:
+    """Métricas de un parser sobre un cívico de un mes"""
+    raw_rows = json.loads(raw_path(month_dir, civico).read_text(encoding="utf-8"))
+    if not raw_rows:
+        batched = False  # Nada que parsear: ni una llamada
+    predicted, latencies = replay(parse_raw, raw_rows, month=month_dir.name, civico=civico, batched=batched)
+    total = sum(latencies)
+    if batched:
+        latencies = []  # Una latencia por cívico, no por fila
+    return {
+        **field_scores(predicted, expected),
+        "rows": len(raw_rows),
+        "seconds": total,
+        "rows_per_second": len(raw_rows) / total if total else None,
+        "p50_ms": None if not latencies else percentile(latencies, 50) * 1000,
+        "p95_ms": None if not latencies else percentile(latencies, 95) * 1000,
+    }
+
+
+def evaluate(
+    data_dir: Path,
+    months: List[str],
+    *,
+    parsers: List[str] = ("registry",),
+    civicos: Optional[List[str]] = None,
+    batched: bool = False,
+) -> List[dict]:
+    """
+    Evalúa cada parser sobre cada cívico con raw y actividades verificadas
+    (con batched, cada cívico en una sola llamada a parse_raw).
+
+    Returns:
+        Una entrada por (mes, parser, cívico) con las métricas de evaluate_civico
+    """
+    results = []
+    for month in months:
+        month_dir = data_dir / month
+        expected_by_civic = json.loads((month_dir / "actividades.json").read_text(encoding="utf-8"))
+        for civico in sorted(civicos or expected_by_civic):
+            if not raw_path(month_dir, civico).exists():
+                logger.warning("Sin %s; se omite", raw_path(month_dir, civico))
+                continue
+            for spec in parsers:
+                metrics = evaluate_civico(
+                    resolve_parser(spec, civico),
+                    month_dir,
+                    civico,
+                    expected_by_civic.get(civico, []),
+                    batched=batched,
+                )
+                results.append({"month": month, "parser": spec, "civico": civico, **metrics})
+    return results
+
+
+def format_results(results: List[dict]) -> str:
+    def pct(value):
+        return "   -" if value is None else f"{100 * value:>3.0f}%"
+
+    def num(value, fmt):
+        return "-" if value is None else format(value, fmt)
+
+    columns = ("actividades",) + FIELDS
+    header = f"{'mes':<7} {'parser':<12} {'cívico':<14} " + " ".join(f"{c[:11]:>11}" for c in columns)
+    header += f" {'filas/s':>8} {'p50 ms':>8} {'p95 ms':>8}"
+    lines = [header, " " * 35 + " ".join(f"{'P   R':>11}" for _ in columns)]
+    for r in results:
+        scores = [r["activities"]] + [r["fields"][f] for f in FIELDS]
+        cells = " ".join(f"{pct(s['precision'])} {pct(s['recall'])}".rjust(11) for s in scores)
+        lines.append(
+            f"{r['month']:<7} {r['parser'][:12]:<12} {r['civico'][:14]:<14} {cells} "
+            f"{num(r['rows_per_second'], '.1f'):>8} {num(r['p50_ms'], '.1f'):>8} {num(r['p95_ms'], '.1f'):>8}"
+        )
+    return "\n".join(lines)
+
+
+class CassetteClient:
+    """Cliente Ollama sin red: las respuestas salen de la caché LLM y los fallos son errores"""
+
+    def ensure_pool_size(self, size: int) -> None:
+        pass
+
+    def tags(self, *, max_age: Optional[float] = None) -> dict:
+        return {"models": []}
+
+    def generate(self, prompt: str, model: str, *, stream: bool = False):
+        import requests
+
+        raise requests.exceptions.ConnectionError("prompt sin respuesta grabada en el cassette")
+
+    def close(self) -> None:
+        pass
+
+
+def configure_llm(*, ollama_url: Optional[str] = None, cassette: Optional[Path] = None) -> bool:
+    """
+    Apunta el parser IA a otro servidor o a una caché grabada sin red.
+
+    Returns:
+        True si hay que reproducir por cívico (batched): el cassette se grabó
+        con lotes de OLLAMA_BATCH_SIZE filas y fila a fila no coincidiría
+    """
+    if ollama_url is None and cassette is None:
+        return False
+    from src.parser import ai_parser
+
+    if ollama_url is not None:
+        ai_parser.configure_client(base_url=ollama_url)
+    if cassette is None:
+        return False
+    ai_parser.configure_llm_cache(True, Path(cassette), max_age_seconds=math.inf)
+    ai_parser.configure_client(client=CassetteClient())
+    return ai_parser.OLLAMA_BATCH_SIZE > 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evalúa parsers contra meses verificados")
+    parser.add_argument("months", nargs="+", help="Meses YYYYMM con actividades.json verificado")
+    parser.add_argument("--data-path", default="docs/data", help="Ruta base de datos (por defecto: docs/data/)")
+    parser.add_argument(
+        "--parser",
+        action="append",
+        dest="parsers",
+        help='"registry" (por defecto), "ai" o "modulo:funcion"; repetible para comparar',
+    )
+    parser.add_argument("--civico", action="append", dest="civicos", help="Limitar a estos cívicos")
+    parser.add_argument("--ollama-url", help="Servidor Ollama (o simulado) para el parser IA")
+    parser.add_argument("--cassette", help="Caché LLM a reproducir sin llamar a Ollama")
+    parser.add_argument(
+        "--batched",
+        action="store_true",
+        help="Parsear cada cívico en una sola llamada (los lotes de parse_raw_ai); sin latencias por fila",
+    )
+    parser.add_argument("--json", help="Guardar los resultados en este fichero")
+    args = parser.parse_args()
+
+    setup_logging()
+    batched = args.batched
+    if configure_llm(ollama_url=args.ollama_url, cassette=args.cassette) and not batched:
+        logger.info("OLLAMA_BATCH_SIZE > 1: el cassette guarda lotes, se parsea cada cívico en una llamada")
+        batched = True
+    results = evaluate(
+        Path(args.data_path),
+        args.months,
+        parsers=args.parsers or ["registry"],
+        civicos=args.civicos,
+        batched=batched,
+    )
+    print(format_results(results))
+    if args.json:
+        atomic_write_json(Path(args.json), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+"""
+Parser de Centro Cívico Gamonal Norte.
+"""
+
+PLUGIN = {
+    "id": "gamonal_norte",
+    "title": "Centro Cívico Gamonal Norte",
+    "title_pattern": r"gamonal\s+norte",
+    "flavor": "lattice",
+    "extract_raw": "src.parser.gamonal_norte.extract_raw:extract_raw_gamonal",
+    "parse_raw": "src.parser.gamonal_norte.parse_raw:parse_raw_gamonal_hybrid",
+}
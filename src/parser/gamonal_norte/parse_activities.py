@@ -2,6 +2,7 @@ import re
 import logging
 from datetime import datetime
 
+from src.parser.common.map_to_schema import map_activity_to_schema
 from src.utils.warning_logger import get_warning_logger
 
 logger = logging.getLogger(__name__)
@@ -71,11 +72,11 @@ def split_cell_into_activities(cell_text: str) -> list[str]:
 
 
 def normalize_hour(h: str) -> str:
-    """Convierte 19, 19., 19.00, 19:00 en 19:00"""
+    """Convierte 19, 19., 19.00, 19:00 en 19:00 (y 9 en 09:00)"""
     h = h.replace(".", ":")
     if ":" not in h:
         h = f"{h}:00"
-    return h
+    return h.zfill(5)
 
 def parse_activity(
     *,
@@ -83,18 +84,29 @@ def parse_activity(
     day_num: int,
     default_year: int,
     default_month: int,
+    issues: list | None = None,
 ):
+    """
+    Parsea el texto de una actividad con reglas.
 
+    Si se pasa `issues`, además de registrar los avisos en el log del mes se
+    añaden a esa lista (el parser híbrido los usa para puntuar la actividad).
+    """
     text = activity_text.strip()
 
     month_str = f"{default_year:04d}{default_month:02d}"
     warning_logger = get_warning_logger(month_str)
 
+    def warn(msg, *args):
+        warning_logger.warning(msg, *args)
+        if issues is not None:
+            issues.append(msg % args)
+
     # Fecha base
     try:
         fecha_dt = datetime(default_year, default_month, day_num)
     except ValueError:
-        warning_logger.warning("Fecha inválida: día=%s mes=%s", day_num, default_month)
+        warn("Fecha inválida: día=%s mes=%s", day_num, default_month)
         return None
 
     fecha = fecha_dt.strftime("%d/%m/%Y")
@@ -133,7 +145,7 @@ def parse_activity(
             hora = normalize_hour(msingle.group(1))
             text = text.replace(msingle.group(0), "").strip()
         else:
-            warning_logger.warning("Sin hora: %s", activity_text)
+            warn("Sin hora: %s", activity_text)
 
     # Público
     publico = None
@@ -145,7 +157,7 @@ def parse_activity(
         publico = text.split(":")[-1].strip()
 
     if not publico:
-        warning_logger.warning("Sin público: %s", activity_text)
+        warn("Sin público: %s", activity_text)
 
     # Edad
     edad_min = None
@@ -173,7 +185,7 @@ def parse_activity(
         nombre = text
 
     if not lugar:
-        warning_logger.warning("Lugar no detectado (%s)", activity_text)
+        warn("Lugar no detectado (%s)", activity_text)
 
     return {
         "fecha": fecha,
@@ -252,3 +264,30 @@ def parse_activities_gamonal(raw_rows, *, month):
 
     actividades.sort(key=sort_key)
     return actividades
+
+
+def parse_cell_gamonal(day_cell: str, text_cell: str, *, month: str):
+    """
+    Parsea una celda [día, texto] con reglas para el parser híbrido.
+
+    Devuelve [(actividad en el schema, avisos), ...]. Una actividad con fecha
+    inválida se devuelve como None para que la celda no se dé por buena.
+
+    Raises:
+        ValueError: si no se reconoce el día de la celda
+    """
+    _, day_num = day_cell.replace("\n", "").strip().split()
+    day_num = int(day_num)
+
+    parsed = []
+    for block in split_cell_into_activities(text_cell):
+        issues = []
+        act = parse_activity(
+            activity_text=block,
+            day_num=day_num,
+            default_year=int(month[:4]),
+            default_month=int(month[4:]),
+            issues=issues,
+        )
+        parsed.append((map_activity_to_schema(act) if act else None, issues))
+    return parsed
@@ -1,7 +1,13 @@
-from src.parser.gamonal_norte.parse_activities import parse_activities_gamonal
+from src.parser.gamonal_norte.parse_activities import parse_activities_gamonal, parse_cell_gamonal
 from src.parser.common.map_to_schema import map_activity_to_schema
+from src.parser.hybrid import parse_raw_hybrid
 
 
 def parse_raw_gamonal(raw, *, month, civico=""):
     parsed = parse_activities_gamonal(raw, month=month)
     return [map_activity_to_schema(a) for a in parsed]
+
+
+def parse_raw_gamonal_hybrid(raw, *, month, civico="", **kwargs):
+    """Reglas de Gamonal Norte; las celdas con poca confianza van a parse_raw_ai"""
+    return parse_raw_hybrid(raw, month=month, civico=civico, parse_cell=parse_cell_gamonal, **kwargs)
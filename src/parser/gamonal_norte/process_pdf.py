@@ -1,5 +1,6 @@
 import logging
-import camelot
+from src.parser.common.camelot_extract import read_pdf_tables
+from src.parser.gamonal_norte import PLUGIN
 import re
 
 logger = logging.getLogger(__name__)
@@ -17,7 +18,7 @@ def process_pdf_gamonal(pdf_path):
     """
     logger.info("Extrayendo tablas (Camelot): %s", pdf_path.name)
 
-    tables = camelot.read_pdf(str(pdf_path), pages="all")
+    tables = read_pdf_tables(pdf_path, flavor=PLUGIN["flavor"])
 
     if not tables:
         logger.warning("No se detectaron tablas en %s", pdf_path.name)
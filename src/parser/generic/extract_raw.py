@@ -5,36 +5,37 @@ Usa Camelot para extraer tablas del PDF.
 Formato output: [[día, texto_actividades], ...]
 """
 
+from importlib.util import find_spec
 from pathlib import Path
 from typing import List
 import logging
 
-try:
-    import camelot
-except ImportError:
-    camelot = None
+from src.parser.common.camelot_extract import read_pdf_tables
 
 logger = logging.getLogger(__name__)
 
 
-def extract_raw_generic(pdf_path: Path) -> List[List[str]]:
+def extract_raw_generic(pdf_path: Path, *, flavor: str = "lattice", **camelot_kwargs) -> List[List[str]]:
     """
     Extrae filas raw desde un PDF usando Camelot.
     
     Args:
         pdf_path: Ruta al PDF
+        flavor: Flavor de Camelot (el registry pasa el del PLUGIN del cívico)
+        **camelot_kwargs: Resto de opciones de camelot.read_pdf (camelot_options del PLUGIN)
     
     Returns:
         Lista de [día, texto_actividades]
     """
-    if camelot is None:
+    # Camelot se importa dentro de read_pdf_tables; aquí solo se comprueba que esté
+    if find_spec("camelot") is None:
         logger.error("Camelot no está disponible. Instala con: pip install camelot-py")
         return []
     
     logger.info(f"Extrayendo tablas (Camelot): {pdf_path.name}")
     
     try:
-        tables = camelot.read_pdf(str(pdf_path), pages="all")
+        tables = read_pdf_tables(pdf_path, flavor=flavor, **camelot_kwargs)
     except Exception as e:
         logger.error(f"Error extrayendo tablas con Camelot: {e}")
         return []
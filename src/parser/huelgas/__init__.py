@@ -0,0 +1,12 @@
+"""
+Parser de Centro Cívico Huelgas - El Pilar.
+"""
+
+PLUGIN = {
+    "id": "huelgas",
+    "title": "Centro Cívico Huelgas - El Pilar",
+    "title_pattern": r"huelgas|el\s+pilar",
+    "flavor": "lattice",
+    "extract_raw": "src.parser.huelgas.extract_raw:extract_raw_huelgas",
+    "parse_raw": "src.parser.ai_parser:parse_raw_ai",
+}
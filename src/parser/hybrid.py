@@ -0,0 +1,198 @@
+"""
+Parser híbrido: reglas primero, LLM solo para las celdas dudosas.
+
+Cada celda [día, texto] pasa antes por un parser de reglas del cívico
+(microsegundos). Cada actividad resultante recibe una puntuación de
+confianza (score_activity): cumple el schema, tiene hora válida, lugar, un
+nombre razonable y el parser no emitió avisos. Si todas las actividades de
+la celda superan HYBRID_MIN_CONFIDENCE se aceptan tal cual; si no, la celda
+entera se manda a parse_raw_ai junto con las demás dudosas (en una sola
+llamada, para conservar lotes y paralelismo).
+
+Por mes se acumulan las celdas resueltas por reglas y las enviadas al LLM,
+con sus tiempos; routing_report(month) da la fracción que se salta el LLM y
+una estimación del tiempo ahorrado (celdas por reglas × latencia media por
+celda medida en el LLM ese mes).
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.utils import metrics
+from src.validators.validate_activities import get_activity_validator
+
+logger = logging.getLogger(__name__)
+
+HYBRID_MIN_CONFIDENCE = float(os.environ.get("HYBRID_MIN_CONFIDENCE", "0.7"))
+
+# Penalizaciones de score_activity
+PENALTY_NO_HOUR = 0.3
+PENALTY_BAD_HOUR = 0.3
+PENALTY_NO_PLACE = 0.2
+PENALTY_SHORT_NAME = 0.3
+PENALTY_PER_ISSUE = 0.15
+
+# parse_cell(día, texto, month=...) → [(actividad en el schema o None, avisos), ...]
+CellParser = Callable[..., List[Tuple[Optional[dict], List[str]]]]
+
+# Misma métrica que parse_raw_ai, que cuenta las celdas que van al LLM
+ROWS = metrics.counter(
+    "rows_total", "Filas raw por cívico, parser (llm/rules) y resultado (parsed/discarded)",
+    labels=("civico", "parser", "result"),
+)
+
+_stats: Dict[str, dict] = {}
+_lock = threading.Lock()
+
+
+def _valid_hour(hora: str) -> bool:
+    h, m = hora.split(":")
+    return int(h) < 24 and int(m) < 60
+
+
+def score_activity(activity: Optional[dict], issues: Sequence[str] = ()) -> float:
+    """Confianza (0-1) en una actividad producida por reglas"""
+    if activity is None or not get_activity_validator().is_valid(activity):
+        return 0.0
+
+    score = 1.0
+    hora, hora_fin = activity.get("hora"), activity.get("hora_fin")
+    if hora is None:
+        score -= PENALTY_NO_HOUR
+    elif not _valid_hour(hora) or (hora_fin is not None and (not _valid_hour(hora_fin) or hora_fin <= hora)):
+        score -= PENALTY_BAD_HOUR
+    if not activity.get("lugar"):
+        score -= PENALTY_NO_PLACE
+    if len(activity["nombre"].strip()) < 3:
+        score -= PENALTY_SHORT_NAME
+    score -= PENALTY_PER_ISSUE * len(issues)
+    return max(score, 0.0)
+
+
+def score_cell(parsed: List[Tuple[Optional[dict], List[str]]]) -> float:
+    """Confianza de una celda: la de su peor actividad (0 si no salió ninguna)"""
+    if not parsed:
+        return 0.0
+    return min(score_activity(activity, issues) for activity, issues in parsed)
+
+
+def _record(month: str, **deltas) -> None:
+    with _lock:
+        stats = _stats.setdefault(
+            month, {"cells": 0, "rule_cells": 0, "llm_cells": 0, "rule_seconds": 0.0, "llm_seconds": 0.0}
+        )
+        for key, value in deltas.items():
+            stats[key] += value
+
+
+def routing_report(month: str) -> dict:
+    """
+    Resumen del enrutado de un mes:
+    cells, rule_cells, llm_cells, bypass_fraction, rule_seconds, llm_seconds,
+    llm_seconds_per_cell y saved_seconds (None si no hubo celdas en el LLM
+    con las que medir su latencia)
+    """
+    with _lock:
+        stats = dict(_stats.get(month) or {
+            "cells": 0, "rule_cells": 0, "llm_cells": 0, "rule_seconds": 0.0, "llm_seconds": 0.0,
+        })
+    per_cell = stats["llm_seconds"] / stats["llm_cells"] if stats["llm_cells"] else None
+    stats["bypass_fraction"] = stats["rule_cells"] / stats["cells"] if stats["cells"] else 0.0
+    stats["llm_seconds_per_cell"] = per_cell
+    stats["saved_seconds"] = (
+        stats["rule_cells"] * per_cell - stats["rule_seconds"] if per_cell is not None else None
+    )
+    return stats
+
+
+def format_routing_report(month: str) -> str:
+    report = routing_report(month)
+    saved = (
+        f"~{max(report['saved_seconds'], 0.0):.1f}s ahorrados "
+        f"({report['llm_seconds_per_cell']:.2f}s/celda en el LLM)"
+        if report["saved_seconds"] is not None else "ahorro sin medir (ninguna celda fue al LLM)"
+    )
+    return (
+        f"Enrutado híbrido {month}: {report['rule_cells']}/{report['cells']} celdas por reglas "
+        f"({100 * report['bypass_fraction']:.0f}% sin LLM), {report['llm_cells']} al LLM; {saved}"
+    )
+
+
+def reset_routing_stats(month: Optional[str] = None) -> None:
+    with _lock:
+        if month is None:
+            _stats.clear()
+        else:
+            _stats.pop(month, None)
+
+
+def parse_raw_hybrid(
+    raw_rows: List[List[str]],
+    *,
+    month: str,
+    civico: str = "",
+    parse_cell: CellParser,
+    llm_parse_raw: Optional[Callable] = None,
+    min_confidence: Optional[float] = None,
+    **llm_kwargs,
+) -> List[Dict]:
+    """
+    Parsea filas raw con `parse_cell` y manda al LLM solo las celdas con
+    confianza menor que `min_confidence` (por defecto HYBRID_MIN_CONFIDENCE).
+
+    Args:
+        raw_rows: Lista de [día, texto] extraído del PDF
+        month: Mes en formato YYYYMM
+        civico: ID del civico para logging (opcional)
+        parse_cell: Parser de reglas de una celda
+        llm_parse_raw: Parser LLM para las celdas dudosas (por defecto parse_raw_ai)
+        llm_kwargs: Se pasan a llm_parse_raw (max_workers, batch_size...)
+
+    Returns:
+        Lista de actividades estructuradas, ordenadas por fecha y hora
+    """
+    from src.parser.ai_parser import _sort_key
+
+    if llm_parse_raw is None:
+        from src.parser.ai_parser import parse_raw_ai as llm_parse_raw
+    threshold = HYBRID_MIN_CONFIDENCE if min_confidence is None else min_confidence
+    civico_str = f" [{civico}]" if civico else ""
+
+    accepted: List[Dict] = []
+    doubtful: List[List[str]] = []
+
+    start = time.perf_counter()
+    for row in raw_rows:
+        if len(row) < 2:
+            doubtful.append(row)
+            continue
+        try:
+            parsed = parse_cell(row[0], row[1], month=month)
+        except (ValueError, IndexError) as e:
+            logger.debug("Reglas sin resultado%s para %r: %s", civico_str, row[0], e)
+            parsed = []
+        if score_cell(parsed) >= threshold:
+            accepted.extend(activity for activity, _ in parsed)
+        else:
+            doubtful.append(row)
+    rule_seconds = time.perf_counter() - start
+
+    cells = len(raw_rows)
+    rule_cells = cells - len(doubtful)
+    _record(month, cells=cells, rule_cells=rule_cells, rule_seconds=rule_seconds)
+    ROWS.inc(rule_cells, civico=civico, parser="rules", result="parsed")
+    logger.info(
+        "Reglas%s: %d/%d celdas con confianza ≥ %.2f; %d al LLM",
+        civico_str, rule_cells, cells, threshold, len(doubtful),
+    )
+
+    if doubtful:
+        start = time.perf_counter()
+        accepted.extend(llm_parse_raw(doubtful, month=month, civico=civico, **llm_kwargs))
+        _record(month, llm_cells=len(doubtful), llm_seconds=time.perf_counter() - start)
+
+    accepted.sort(key=_sort_key)
+    return accepted
@@ -0,0 +1,56 @@
+"""
+Caché persistente en disco de respuestas del LLM.
+
+Cada entrada se direcciona por el SHA-256 de (modelo, temperatura, prompt
+formateado), así que cualquier cambio en el prompt, el texto de la celda,
+el día o el modelo genera una clave distinta y nunca se reutiliza una
+respuesta obsoleta.
+
+Estructura en disco:
+    <cache_dir>/<2 primeros hex>/<sha256>.json
+    {
+      "key": "...",
+      "model": "mistral",
+      "created_at": 1767000000.0,
+      "raw_response": "[{...}]",
+      "activities": [...]
+    }
+
+Desalojo (DiskCache):
+- Entradas sin usar desde hace más de max_age_seconds se descartan al
+  leerlas o al podar (cada lectura actualiza el mtime del fichero)
+- Si el tamaño total supera max_bytes se borran las menos usadas
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from src.utils.disk_cache import DiskCache
+
+LLM_CACHE_DIR = Path(os.environ.get("LLM_CACHE_DIR", ".cache/llm"))
+LLM_CACHE_MAX_BYTES = int(os.environ.get("LLM_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+LLM_CACHE_MAX_AGE_DAYS = float(os.environ.get("LLM_CACHE_MAX_AGE_DAYS", "180"))
+
+
+def cache_key(*, model: str, prompt: str, temperature: float) -> str:
+    """Hash estable del payload que determina la respuesta del modelo"""
+    payload = json.dumps([model, temperature, prompt], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache(DiskCache):
+    name = "LLM"
+
+    def __init__(
+        self,
+        cache_dir: Path = LLM_CACHE_DIR,
+        *,
+        max_bytes: int = LLM_CACHE_MAX_BYTES,
+        max_age_seconds: float = LLM_CACHE_MAX_AGE_DAYS * 86400,
+    ):
+        super().__init__(cache_dir, max_age_seconds=max_age_seconds, max_bytes=max_bytes)
+
+    def put(self, key: str, *, model: str, raw_response: str, activities) -> None:
+        self._put(key, {"model": model, "raw_response": raw_response, "activities": activities})
@@ -0,0 +1,205 @@
+"""
+Descubrimiento de parsers de cívicos.
+
+Cada parser se declara con un dict PLUGIN:
+
+    PLUGIN = {
+        "id": "capiscol",
+        "title": "Capiscol",
+        "title_pattern": r"capiscol",          # regex sobre el título del PDF en minúsculas
+        "flavor": "stream",                    # flavor de Camelot (por defecto lattice)
+        "camelot_options": {"row_tol": 10},    # resto de opciones de camelot.read_pdf (opcional)
+        "extract_raw": "src.parser.capiscol.extract_raw:extract_raw_capiscol",
+        "parse_raw": "src.parser.ai_parser:parse_raw_ai",
+    }
+
+Fuentes, por orden:
+1. Paquetes de src/parser/<civico>/ con PLUGIN en su __init__.py. Se lee
+   sin importar el paquete (ast.literal_eval), así que debe ser un literal
+2. Plugins de terceros: entry points del grupo "burgos_civicos.parsers" que
+   apunten a un dict con el mismo formato (extract_raw/parse_raw pueden ser
+   funciones o rutas "modulo:funcion"). Un id ya declarado no se sobrescribe.
+
+Solo id y title_pattern son obligatorios: sin extract_raw/parse_raw el
+cívico usa el parser genérico (Camelot + IA), que recibe el flavor y las
+camelot_options del PLUGIN (ver registry.get_parser).
+
+    [project.entry-points."burgos_civicos.parsers"]
+    mi_civico = "mi_paquete.parser:PLUGIN"
+
+Los plugins se descubren la primera vez que se piden (get_plugins), no al
+importar. El resultado se guarda en PARSER_PLUGINS_CACHE (por defecto
+.cache/parser_plugins.json en la raíz del repositorio, sea cual sea el
+directorio actual) junto con una huella de los __init__.py de src/parser y
+de los directorios site-packages de sys.path (su mtime cambia al instalar o
+desinstalar paquetes). Mientras la huella coincida, arrancar no importa
+ningún plugin ni recorre los metadatos de los paquetes instalados.
+"""
+
+import ast
+import json
+import logging
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.utils.atomic_write import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "burgos_civicos.parsers"
+PARSER_DIR = Path(__file__).resolve().parent
+PLUGINS_CACHE = Path(
+    os.environ.get("PARSER_PLUGINS_CACHE") or PARSER_DIR.parents[1] / ".cache" / "parser_plugins.json"
+)
+CACHE_VERSION = 2
+
+DEFAULT_FLAVOR = "lattice"
+# Sin extract_raw/parse_raw propios se usa el parser genérico (Camelot + IA)
+DEFAULT_EXTRACT_RAW = "src.parser.generic.extract_raw:extract_raw_generic"
+DEFAULT_PARSE_RAW = "src.parser.ai_parser:parse_raw_ai"
+REQUIRED_KEYS = ("id", "title_pattern")
+
+_plugins: Optional[Dict[str, dict]] = None
+
+
+def _entry_point_string(value) -> str:
+    if isinstance(value, str):
+        return value
+    return f"{value.__module__}:{value.__qualname__}"
+
+
+def normalize_plugin(declaration: dict, source: str) -> dict:
+    """
+    Valida una declaración PLUGIN y la deja en forma serializable.
+
+    Raises:
+        ValueError: si falta algún campo o el patrón no es una regex válida
+    """
+    missing = [key for key in REQUIRED_KEYS if not declaration.get(key)]
+    if missing:
+        raise ValueError(f"{source}: faltan campos en PLUGIN: {', '.join(missing)}")
+    try:
+        re.compile(declaration["title_pattern"])
+    except re.error as e:
+        raise ValueError(f"{source}: title_pattern no válido: {e}") from e
+
+    return {
+        "id": declaration["id"],
+        "title": declaration.get("title", declaration["id"]),
+        "title_pattern": declaration["title_pattern"],
+        "flavor": declaration.get("flavor", DEFAULT_FLAVOR),
+        "camelot_options": dict(declaration.get("camelot_options") or {}),
+        "extract_raw": _entry_point_string(declaration.get("extract_raw", DEFAULT_EXTRACT_RAW)),
+        "parse_raw": _entry_point_string(declaration.get("parse_raw", DEFAULT_PARSE_RAW)),
+        "source": source,
+    }
+
+
+def _builtin_packages() -> List[Path]:
+    return sorted(p.parent for p in PARSER_DIR.glob("*/__init__.py"))
+
+
+def fingerprint() -> dict:
+    """Huella barata (solo stat) de lo que puede cambiar el resultado del descubrimiento"""
+    def stamp(path: Path):
+        try:
+            st = path.stat()
+            return [st.st_mtime_ns, st.st_size]
+        except OSError:
+            return None
+
+    return {
+        "builtin": {p.name: stamp(p / "__init__.py") for p in _builtin_packages()},
+        "site_packages": {
+            entry: stamp(Path(entry))
+            for entry in sys.path
+            if os.path.basename(entry) in ("site-packages", "dist-packages")
+        },
+    }
+
+
+def read_builtin_plugin(package: Path) -> Optional[dict]:
+    """PLUGIN literal del __init__.py de un paquete, sin importarlo"""
+    tree = ast.parse((package / "__init__.py").read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "PLUGIN" for target in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    return None
+
+
+def _entry_points():
+    from importlib.metadata import entry_points
+
+    return entry_points(group=ENTRY_POINT_GROUP)
+
+
+def scan_plugins() -> Dict[str, dict]:
+    """Lee los PLUGIN de src/parser y carga los entry points"""
+    plugins: Dict[str, dict] = {}
+
+    for package in _builtin_packages():
+        declaration = read_builtin_plugin(package)
+        if declaration is None:
+            continue
+        plugin = normalize_plugin(declaration, f"src.parser.{package.name}")
+        plugins[plugin["id"]] = plugin
+
+    for entry_point in _entry_points():
+        source = f"{entry_point.name} = {entry_point.value}"
+        try:
+            plugin = normalize_plugin(entry_point.load(), source)
+        except Exception as e:
+            logger.warning("Plugin de parser ignorado (%s): %s", source, e)
+            continue
+        if plugin["id"] in plugins:
+            logger.warning(
+                "Plugin de parser ignorado (%s): el cívico %s ya lo declara %s",
+                source, plugin["id"], plugins[plugin["id"]]["source"],
+            )
+            continue
+        plugins[plugin["id"]] = plugin
+
+    return plugins
+
+
+def discover_plugins(*, cache_path: Optional[Path] = None, refresh: bool = False) -> Dict[str, dict]:
+    """
+    Plugins de parser por id de cívico, usando la caché si la huella coincide.
+
+    Args:
+        cache_path: Fichero de caché (por defecto PLUGINS_CACHE)
+        refresh: True para ignorar la caché y volver a escanear
+    """
+    cache_path = Path(cache_path or PLUGINS_CACHE)
+    current = fingerprint()
+
+    if not refresh:
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if cached.get("version") == CACHE_VERSION and cached.get("fingerprint") == current:
+                return cached["plugins"]
+        except (OSError, ValueError):
+            pass
+
+    plugins = scan_plugins()
+    try:
+        atomic_write_json(
+            cache_path, {"version": CACHE_VERSION, "fingerprint": current, "plugins": plugins}, indent=None
+        )
+    except OSError as e:
+        logger.debug("No se pudo guardar la caché de plugins (%s): %s", cache_path, e)
+    logger.debug("Plugins de parser descubiertos: %s", ", ".join(sorted(plugins)))
+    return plugins
+
+
+def get_plugins() -> Dict[str, dict]:
+    """Plugins del proceso (se descubren una vez)"""
+    global _plugins
+    if _plugins is None:
+        _plugins = discover_plugins()
+    return _plugins
@@ -1,83 +1,87 @@
-from src.parser.gamonal_norte.extract_raw import extract_raw_gamonal
-from src.parser.gamonal_norte.parse_raw import parse_raw_gamonal
-from src.parser.rio_vena.extract_raw import extract_raw_rio_vena
-from src.parser.vista_alegre.extract_raw import extract_raw_vista_alegre
-from src.parser.capiscol.extract_raw import extract_raw_capiscol
-from src.parser.san_agustin.extract_raw import extract_raw_san_agustin
-from src.parser.huelgas.extract_raw import extract_raw_huelgas
-from src.parser.san_juan.extract_raw import extract_raw_san_juan
-from src.parser.generic.extract_raw import extract_raw_generic
-from src.parser.ai_parser import parse_raw_ai
-
-# Lista de todos los cívicos
-CIVICOS = {
-    "rio_vena",
-    "vista_alegre",
-    "capiscol",
-    "san_agustin",
-    "huelgas",
-    "gamonal_norte",
-    "san_juan",
-}
-
-# Parsers específicos por cívico (si existen)
-_PARSERS = {
-    "gamonal_norte": {
-        "extract_raw": extract_raw_gamonal,
-        "parse_raw": parse_raw_ai,
-    },
-    "rio_vena": {
-        "extract_raw": extract_raw_rio_vena,
-        "parse_raw": parse_raw_ai,
-    },
-    "vista_alegre": {
-        "extract_raw": extract_raw_vista_alegre,
-        "parse_raw": parse_raw_ai,
-    },
-    "capiscol": {
-        "extract_raw": extract_raw_capiscol,
-        "parse_raw": parse_raw_ai,
-    },
-    "san_agustin": {
-        "extract_raw": extract_raw_san_agustin,
-        "parse_raw": parse_raw_ai,
-    },
-    "huelgas": {
-        "extract_raw": extract_raw_huelgas,
-        "parse_raw": parse_raw_ai,
-    },
-    "san_juan": {
-        "extract_raw": extract_raw_san_juan,
-        "parse_raw": parse_raw_ai,
-    },
-}
-
-# Parser genérico (AI) como fallback para todos los cívicos
-_DEFAULT_PARSER = {
-    "extract_raw": extract_raw_generic,
-    "parse_raw": parse_raw_ai,
-}
+"""
+Registro de parsers por cívico.
+
+Los cívicos y sus parsers salen del descubrimiento de plugins
+(src/parser/plugins.py): paquetes de src/parser/<civico>/ con un dict PLUGIN
+y plugins de terceros por entry points. Añadir un cívico no requiere tocar
+este módulo.
+
+Cada parser se declara como rutas "modulo:funcion" que se importan la primera
+vez que get_parser las pide: importar el registry (orquestador, scraper,
+tests) no arrastra Camelot, pandas ni requests hasta que de verdad se va a
+procesar un PDF. Tampoco descubre los plugins: eso pasa al pedir CIVICOS o
+el primer parser.
+"""
+
+import importlib
+import threading
+from functools import partial
+from typing import Callable, Dict
+
+from src.parser.plugins import DEFAULT_EXTRACT_RAW, get_plugins
+
+
+def __getattr__(name):
+    # CIVICOS (lista de todos los cívicos) se calcula al pedirlo
+    if name == "CIVICOS":
+        return set(get_plugins())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_resolved: Dict[str, Dict[str, Callable]] = {}
+_lock = threading.Lock()
+
+
+def resolve(entry_point: str) -> Callable:
+    """Importa "paquete.modulo:funcion" y devuelve la función"""
+    module_name, _, attr = entry_point.partition(":")
+    target = importlib.import_module(module_name)
+    for part in attr.split("."):
+        target = getattr(target, part)
+    return target
+
+
+def get_plugin(civico_id: str) -> dict:
+    """Declaración PLUGIN del cívico (title, title_pattern, flavor, ...)"""
+    plugins = get_plugins()
+    if civico_id not in plugins:
+        raise ValueError(f"Cívico no registrado: {civico_id}. Opciones: {set(plugins)}")
+    return plugins[civico_id]
+
+
+def _resolve_parser(plugin: dict) -> Dict[str, Callable]:
+    parser = {name: resolve(plugin[name]) for name in ("extract_raw", "parse_raw")}
+    if plugin["extract_raw"] == DEFAULT_EXTRACT_RAW:
+        # El extractor genérico no lee ningún PLUGIN: recibe el flavor y las opciones
+        # de Camelot del cívico (partial de una función de módulo: sigue siendo picklable)
+        parser["extract_raw"] = partial(
+            parser["extract_raw"], flavor=plugin["flavor"], **plugin.get("camelot_options", {})
+        )
+    return parser
 
 
 def get_parser(civico_id: str):
     """
     Obtiene el parser para un cívico.
-    
-    Si existe parser específico, lo usa.
+
+    Si el plugin del cívico declara parser específico, lo usa.
     En caso contrario, usa el parser genérico basado en IA.
-    
+    Los módulos del parser se importan en la primera llamada.
+
     Args:
         civico_id: ID del cívico (ej: "gamonal_norte")
-    
+
     Returns:
         Dict con extract_raw y parse_raw
-    
+
     Raises:
         ValueError: Si el cívico no existe
     """
-    if civico_id not in CIVICOS:
-        raise ValueError(f"Cívico no registrado: {civico_id}. Opciones: {CIVICOS}")
-    
-    # Usar parser específico si existe, sino usar genérico
-    return _PARSERS.get(civico_id, _DEFAULT_PARSER)
+    plugin = get_plugin(civico_id)
 
+    with _lock:
+        parser = _resolved.get(civico_id)
+        if parser is None:
+            parser = _resolve_parser(plugin)
+            _resolved[civico_id] = parser
+        return parser
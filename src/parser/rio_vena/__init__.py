@@ -0,0 +1,12 @@
+"""
+Parser de Centro Cívico Río Vena.
+"""
+
+PLUGIN = {
+    "id": "rio_vena",
+    "title": "Centro Cívico Río Vena",
+    "title_pattern": r"r[ií]o\s+vena",
+    "flavor": "lattice",
+    "extract_raw": "src.parser.rio_vena.extract_raw:extract_raw_rio_vena",
+    "parse_raw": "src.parser.ai_parser:parse_raw_ai",
+}
@@ -0,0 +1,12 @@
+"""
+Parser de Centro Cívico San Agustín.
+"""
+
+PLUGIN = {
+    "id": "san_agustin",
+    "title": "Centro Cívico San Agustín",
+    "title_pattern": r"san\s+agust[ií]n",
+    "flavor": "lattice",
+    "extract_raw": "src.parser.san_agustin.extract_raw:extract_raw_san_agustin",
+    "parse_raw": "src.parser.ai_parser:parse_raw_ai",
+}
@@ -0,0 +1,12 @@
+"""
+Parser de Centro Cívico San Juan.
+"""
+
+PLUGIN = {
+    "id": "san_juan",
+    "title": "Centro Cívico San Juan",
+    "title_pattern": r"san\s+juan",
+    "flavor": "lattice",
+    "extract_raw": "src.parser.san_juan.extract_raw:extract_raw_san_juan",
+    "parse_raw": "src.parser.ai_parser:parse_raw_ai",
+}
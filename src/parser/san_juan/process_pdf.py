@@ -1,5 +1,6 @@
 import logging
-import camelot
+from src.parser.common.camelot_extract import read_pdf_tables
+from src.parser.san_juan import PLUGIN
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +12,7 @@ def process_pdf_san_juan(pdf_path):
     """
     logger.info("Extrayendo tablas (Camelot): %s", pdf_path.name)
 
-    tables = camelot.read_pdf(str(pdf_path), pages="all")
+    tables = read_pdf_tables(pdf_path, flavor=PLUGIN["flavor"])
 
     if not tables:
         logger.warning("No se detectaron tablas en %s", pdf_path.name)
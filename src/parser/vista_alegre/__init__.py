@@ -0,0 +1,12 @@
+"""
+Parser de Centro Cívico Vista Alegre.
+"""
+
+PLUGIN = {
+    "id": "vista_alegre",
+    "title": "Centro Cívico Vista Alegre",
+    "title_pattern": r"vista\s+alegre",
+    "flavor": "lattice",
+    "extract_raw": "src.parser.vista_alegre.extract_raw:extract_raw_vista_alegre",
+    "parse_raw": "src.parser.ai_parser:parse_raw_ai",
+}
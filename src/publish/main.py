@@ -0,0 +1,143 @@
+"""
+Publicación de los datos para la web.
+
+A partir de docs/data/<YYYYMM>/actividades.json (indentado, con campos a
+null) genera junto a él:
+
+    actividades.min.json      JSON minificado sin los campos a null
+    actividades.min.json.gz   gzip -9 (determinista: mtime=0)
+    actividades.min.json.br   brotli (solo si el paquete brotli está instalado)
+    search.json               índice de búsqueda y facetas (ver search_index.py)
+
+Los ficheros solo se reescriben si cambia su contenido, así que volver a
+publicar un mes sin cambios no genera diffs. Después se actualiza la
+entrada del mes en el manifiesto index.json (con los hashes de los nuevos
+ficheros).
+
+Uso:
+    python -m src.publish.main                 # Todos los meses
+    python -m src.publish.main 202601 202602   # Meses concretos
+"""
+
+import argparse
+import gzip
+import json
+import logging
+from pathlib import Path
+from typing import List, Optional
+
+from src.publish.manifest import update_manifest
+from src.publish.search_index import INDEX_NAME, encode_search_index
+from src.utils.atomic_write import atomic_write_bytes
+from src.utils.logging_config import setup_logging
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path("docs/data")
+SOURCE_NAME = "actividades.json"
+MIN_NAME = "actividades.min.json"
+
+
+def elide_nulls(activities_by_civic: dict) -> dict:
+    """Quita de cada actividad los campos con valor null"""
+    return {
+        civico: [{k: v for k, v in act.items() if v is not None} for act in activities]
+        for civico, activities in activities_by_civic.items()
+    }
+
+
+def minify(activities_by_civic: dict) -> bytes:
+    return json.dumps(
+        elide_nulls(activities_by_civic), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    if path.exists() and path.read_bytes() == data:
+        return False
+    atomic_write_bytes(path, data)
+    return True
+
+
+def publish_month(month_dir: Path) -> Optional[dict]:
+    """
+    Genera los artefactos minificados/comprimidos de un mes.
+
+    Returns:
+        Informe de tamaños en bytes, o None si el mes no tiene actividades.json
+    """
+    source = month_dir / SOURCE_NAME
+    if not source.exists():
+        return None
+
+    raw = source.read_bytes()
+    minified = minify(json.loads(raw))
+    artifacts = {MIN_NAME: minified, f"{MIN_NAME}.gz": gzip.compress(minified, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        artifacts[f"{MIN_NAME}.br"] = brotli.compress(minified, quality=11)
+    else:
+        logger.debug("brotli no instalado: se omite %s.br", MIN_NAME)
+    artifacts[INDEX_NAME] = encode_search_index(raw)
+
+    written = [name for name, data in artifacts.items() if _write_if_changed(month_dir / name, data)]
+    update_manifest(month_dir.parent, [month_dir.name])
+
+    report = {
+        "month": month_dir.name,
+        "original": len(raw),
+        "min": len(minified),
+        "gz": len(artifacts[f"{MIN_NAME}.gz"]),
+        "br": len(artifacts[f"{MIN_NAME}.br"]) if brotli is not None else None,
+        "search": len(artifacts[INDEX_NAME]),
+        "written": written,
+    }
+    best = report["br"] or report["gz"]
+    logger.info(
+        "%s: %d → %d B minificado (-%.0f%%), %d B gzip, %s brotli (-%.0f%% total)",
+        report["month"], report["original"], report["min"],
+        100 * (1 - report["min"] / report["original"]), report["gz"],
+        f"{report['br']} B" if report["br"] is not None else "sin",
+        100 * (1 - best / report["original"]),
+    )
+    return report
+
+
+def publish_all(data_dir: Path = DATA_DIR, months: Optional[List[str]] = None) -> List[dict]:
+    """Publica los meses indicados (o todos los YYYYMM de data_dir)"""
+    if months:
+        month_dirs = [data_dir / m for m in months]
+    else:
+        month_dirs = sorted(data_dir.glob("[0-9][0-9][0-9][0-9][0-9][0-9]"))
+    return [r for r in (publish_month(d) for d in month_dirs) if r is not None]
+
+
+def format_report(reports: List[dict]) -> str:
+    lines = [f"{'mes':<8} {'original':>9} {'min':>8} {'gzip':>7} {'brotli':>7} {'ahorro':>7} {'índice':>7}"]
+    for r in reports:
+        best = r["br"] or r["gz"]
+        br = str(r["br"]) if r["br"] is not None else "-"
+        lines.append(
+            f"{r['month']:<8} {r['original']:>9} {r['min']:>8} {r['gz']:>7} {br:>7} "
+            f"{100 * (1 - best / r['original']):>6.1f}% {r['search']:>7}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera los JSON minificados y comprimidos para la web")
+    parser.add_argument("months", nargs="*", help="Meses YYYYMM (por defecto todos)")
+    parser.add_argument("--data-path", default="docs/data", help="Ruta base de datos (por defecto: docs/data/)")
+    args = parser.parse_args()
+
+    setup_logging()
+    reports = publish_all(Path(args.data_path), args.months)
+    print(format_report(reports))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Manifiesto de meses publicados: docs/data/index.json
+
+La web lo descarga en una sola petición para saber qué meses hay (en vez de
+probar las URLs de los últimos meses una a una) y usa los hashes como
+versión en las URLs de datos, lo que permite cachearlas a largo plazo.
+
+    {
+      "version": 1,
+      "updated_at": "2026-02-28T10:00:00+00:00",
+      "months": [
+        {
+          "month": "202603",
+          "activities": 312,
+          "civicos": {"capiscol": 40, "gamonal_norte": 55, ...},
+          "files": {
+            "actividades.json": {"sha256": "...", "bytes": 54372},
+            "actividades.min.json": {"sha256": "...", "bytes": 27291, "source": "<sha256 de actividades.json>"}
+          },
+          "updated_at": "2026-02-28T10:00:00+00:00"
+        },
+        ...
+      ]
+    }
+
+Los ficheros derivados (actividades.min.json, search.json) llevan en
+"source" el hash del actividades.json a partir del que se generaron. Si no
+corresponden al actividades.json actual (se guardó sin volver a publicar,
+o se editó a mano) no se listan, y la web usa actividades.json.
+
+Los meses van de más reciente a más antiguo. El updated_at de un mes solo
+cambia cuando cambia alguno de sus hashes, así que regenerar el manifiesto
+sin cambios en los datos deja index.json idéntico.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+from src.utils.atomic_write import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "index.json"
+MANIFEST_VERSION = 1
+SOURCE_NAME = "actividades.json"
+DERIVED_FILES = ("actividades.min.json", "search.json")
+
+_lock = threading.Lock()
+
+
+def _file_entry(data: bytes) -> dict:
+    return {"sha256": hashlib.sha256(data).hexdigest(), "bytes": len(data)}
+
+
+def _built_from(name: str, data: bytes, activities: dict, source_sha256: str) -> Optional[str]:
+    """Hash del actividades.json del que sale un fichero derivado (None si no es el actual)"""
+    if name == "search.json":
+        try:
+            return json.loads(data).get("source")
+        except ValueError:
+            return None
+    # actividades.min.json no guarda su origen: es determinista, se compara con el que saldría ahora
+    from src.publish.main import minify
+
+    return source_sha256 if data == minify(activities) else None
+
+
+def month_entry(month_dir: Path) -> Optional[dict]:
+    """Entrada del manifiesto para un mes, o None si no tiene actividades.json"""
+    source = month_dir / SOURCE_NAME
+    if not source.exists():
+        return None
+
+    raw = source.read_bytes()
+    activities = json.loads(raw)
+    civicos = {civico: len(items) for civico, items in sorted(activities.items())}
+    files = {SOURCE_NAME: _file_entry(raw)}
+    source_sha256 = files[SOURCE_NAME]["sha256"]
+    for name in DERIVED_FILES:
+        path = month_dir / name
+        if not path.exists():
+            continue
+        data = path.read_bytes()
+        if _built_from(name, data, activities, source_sha256) != source_sha256:
+            logger.info("%s/%s no corresponde al %s actual: no se publica", month_dir.name, name, SOURCE_NAME)
+            continue
+        files[name] = {**_file_entry(data), "source": source_sha256}
+    return {
+        "month": month_dir.name,
+        "activities": sum(civicos.values()),
+        "civicos": civicos,
+        "files": files,
+    }
+
+
+def load_manifest(data_dir: Path) -> dict:
+    try:
+        manifest = json.loads((data_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        if manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {"version": MANIFEST_VERSION, "updated_at": None, "months": []}
+
+
+def update_manifest(data_dir: Path, months: Optional[Iterable[str]] = None) -> dict:
+    """
+    Recalcula las entradas de `months` (por defecto todos los YYYYMM de
+    data_dir) y reescribe index.json de forma atómica si algo cambió.
+
+    Returns:
+        El manifiesto resultante
+    """
+    data_dir = Path(data_dir)
+    with _lock:
+        manifest = load_manifest(data_dir)
+        entries = {entry["month"]: entry for entry in manifest["months"]}
+
+        if months is None:
+            months = [d.name for d in data_dir.glob("[0-9][0-9][0-9][0-9][0-9][0-9]") if d.is_dir()]
+            # Meses borrados del disco
+            for missing in set(entries) - set(months):
+                del entries[missing]
+
+        now = datetime.now(timezone.utc).isoformat()
+        changed = False
+        for month in months:
+            entry = month_entry(data_dir / month)
+            previous = entries.get(month)
+            if entry is None:
+                changed |= entries.pop(month, None) is not None
+                continue
+            if previous is not None and {k: v for k, v in previous.items() if k != "updated_at"} == entry:
+                continue
+            entry["updated_at"] = now
+            entries[month] = entry
+            changed = True
+
+        if not changed and (data_dir / MANIFEST_NAME).exists():
+            return manifest
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "updated_at": max((e["updated_at"] for e in entries.values()), default=None),
+            "months": [entries[m] for m in sorted(entries, reverse=True)],
+        }
+        atomic_write_json(data_dir / MANIFEST_NAME, manifest)
+        logger.info("✓ %s actualizado (%d meses)", MANIFEST_NAME, len(entries))
+        return manifest
@@ -0,0 +1,109 @@
+"""
+Índice de búsqueda y facetas de un mes: docs/data/<YYYYMM>/search.json
+
+Los ids de actividad son posiciones en la lista plana que construye la web
+(dataLoader.normalizeActivities: cívicos en el orden del fichero y, dentro
+de cada uno, sus actividades en orden). Todas las listas de ids (postings)
+están ordenadas, así que la web filtra intersecándolas en vez de recorrer
+todas las actividades en cada pulsación.
+
+    {
+      "version": 1,
+      "source": "<sha256 de actividades.json>",
+      "count": 144,
+      "tokens": {"nombre": {"yoga": [3, 17]}, "publico": {...}, "lugar": {...}},
+      "fechas": {"2026-03-02": [0, 5, 9], ...},
+      "civicos": {"capiscol": [0, 1, ...], ...},
+      "inscripcion": {"true": [...], "false": [...]}
+    }
+
+Los tokens se normalizan como en filterEngine.js (normalizeText): sin
+tildes, en minúsculas y partidos por todo lo que no sea [a-z0-9].
+"""
+
+import hashlib
+import json
+import re
+import unicodedata
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+INDEX_NAME = "search.json"
+INDEX_VERSION = 1
+TEXT_FIELDS = ("nombre", "publico", "lugar")
+
+# Tope de días que se expanden por actividad (protege de fecha_fin erróneas)
+MAX_RANGE_DAYS = 366
+
+_TOKEN_SPLIT = re.compile(r"[^a-z0-9]+")
+
+
+def fold(text: str) -> str:
+    """Minúsculas sin tildes ni diacríticos ("Niñ@s Pequeños" → "nin@s pequenos")"""
+    decomposed = unicodedata.normalize("NFD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    return [token for token in _TOKEN_SPLIT.split(fold(text)) if token]
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    try:
+        return datetime.strptime(value, "%d/%m/%Y").date()
+    except (TypeError, ValueError):
+        return None
+
+
+def activity_days(activity: dict) -> Iterable[str]:
+    """Días (YYYY-MM-DD) que abarca la actividad, de fecha a fecha_fin"""
+    start = _parse_date(activity.get("fecha"))
+    if start is None:
+        return []
+    end = _parse_date(activity.get("fecha_fin")) or start
+    days = min(max((end - start).days, 0), MAX_RANGE_DAYS)
+    return [(start + timedelta(days=offset)).isoformat() for offset in range(days + 1)]
+
+
+def _sorted_postings(postings: Dict[str, set]) -> Dict[str, List[int]]:
+    return {key: sorted(ids) for key, ids in sorted(postings.items())}
+
+
+def build_search_index(activities_by_civic: dict, *, source_sha256: Optional[str] = None) -> dict:
+    tokens = {field: defaultdict(set) for field in TEXT_FIELDS}
+    fechas = defaultdict(set)
+    civicos = defaultdict(set)
+    inscripcion = defaultdict(set)
+
+    activity_id = 0
+    for civico, activities in activities_by_civic.items():
+        civicos[civico]  # Cívicos sin actividades también aparecen, con lista vacía
+        for activity in activities:
+            for field in TEXT_FIELDS:
+                for token in tokenize(activity.get(field)):
+                    tokens[field][token].add(activity_id)
+            for day in activity_days(activity):
+                fechas[day].add(activity_id)
+            civicos[civico].add(activity_id)
+            if activity.get("requiere_inscripcion") is not None:
+                inscripcion[str(bool(activity["requiere_inscripcion"])).lower()].add(activity_id)
+            activity_id += 1
+
+    return {
+        "version": INDEX_VERSION,
+        "source": source_sha256,
+        "count": activity_id,
+        "tokens": {field: _sorted_postings(postings) for field, postings in tokens.items()},
+        "fechas": _sorted_postings(fechas),
+        "civicos": {civico: sorted(ids) for civico, ids in civicos.items()},
+        "inscripcion": _sorted_postings(inscripcion),
+    }
+
+
+def encode_search_index(raw_activities: bytes) -> bytes:
+    """search.json (minificado) a partir del contenido de actividades.json"""
+    index = build_search_index(json.loads(raw_activities), source_sha256=hashlib.sha256(raw_activities).hexdigest())
+    return json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -1,5 +1,7 @@
 import requests
 
+from src.utils import metrics
+
 HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -11,7 +13,13 @@ HEADERS = {
     "Connection": "keep-alive",
 }
 
+DOWNLOAD_SECONDS = metrics.histogram(
+    "download_seconds", "Duración de las descargas (s)", labels=("kind",)
+)
+
+
 def fetch_page(url: str) -> str:
-    response = requests.get(url, headers=HEADERS, timeout=30)
+    with DOWNLOAD_SECONDS.time(kind="page"):
+        response = requests.get(url, headers=HEADERS, timeout=30)
     response.raise_for_status()
     return response.text
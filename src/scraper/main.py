@@ -1,19 +1,25 @@
 from pathlib import Path
 from datetime import datetime, timezone
+import argparse
 import json
 import logging
+import time
 
 from src.scraper.fetch_page import fetch_page
 from src.scraper.parse_links import extract_pdf_links
 from src.utils.detect_month import detect_month
 from src.scraper.compare_links import mark_new_links
 from src.utils.logging_config import setup_logging
+from src.utils.atomic_write import atomic_write_json
+from src.utils import metrics
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://www.aytoburgos.es/es/servicios-y-programas/-/asset_publisher/rCUegBWr9yud/content/agendacivicos"
 DATA_DIR = Path("docs/data")
 
+LINKS = metrics.gauge("scraper_links", "Enlaces a PDFs en la página de agendas por estado", labels=("state",))
+
 
 def run_scraper() -> dict:
     html = fetch_page(BASE_URL)
@@ -48,10 +54,11 @@ def run_scraper() -> dict:
         "links": links,
     }
 
-    links_path.write_text(
-        json.dumps(payload, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    atomic_write_json(links_path, payload)
+
+    new_count = sum(1 for l in links if l.get("is_new"))
+    LINKS.set(new_count, state="new")
+    LINKS.set(len(links) - new_count, state="known")
 
     return {
         "month": month,
@@ -63,7 +70,21 @@ def run_scraper() -> dict:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Detecta los PDFs de agendas de los centros cívicos")
+    parser.add_argument(
+        "--metrics-file",
+        help="Fichero .prom para el textfile collector de Prometheus "
+        "(por defecto: $METRICS_TEXTFILE_DIR/burgos_civicos_scraper.prom si está definida)",
+    )
+    args = parser.parse_args()
+
     setup_logging()
 
-    result = run_scraper()
+    started = time.time()
+    success = False
+    try:
+        result = run_scraper()
+        success = True
+    finally:
+        metrics.finish_run("scraper", started=started, success=success, path=args.metrics_file)
     logger.info("Resultado: %s", result)
@@ -0,0 +1,257 @@
+"""
+Almacén en memoria de las actividades de todos los meses.
+
+Carga docs/data/<YYYYMM>/actividades.json y guarda cada campo como una
+columna NumPy (una posición por actividad):
+
+    start, end        fecha y fecha_fin como ordinal (date.toordinal());
+                      end = start si no hay fecha_fin
+    start_min, end_min  hora y hora_fin en minutos desde medianoche (-1 = sin hora)
+    civico            código entero; ActivityStore.civicos[código] es el id
+    month             mes YYYYMM del fichero de origen
+    requiere_inscripcion  bool
+    edad_minima, edad_maxima  -1 = sin dato
+    precio            NaN = sin dato
+
+Las fechas se parsean una sola vez al cargar. Las consultas por rango usan
+un índice ordenado por fecha de inicio (búsqueda binaria) y el resto de
+filtros son máscaras vectorizadas sobre los candidatos:
+
+    store = ActivityStore.load(Path("docs/data"))
+    idx = store.query(start=hoy, end=hoy + timedelta(days=14), publico="famil")
+    for activity in store.records(idx):
+        ...
+"""
+
+import json
+import logging
+from collections import Counter
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.publish.search_index import fold
+
+logger = logging.getLogger(__name__)
+
+NO_VALUE = -1
+TEXT_FIELDS = ("nombre", "publico", "lugar")
+
+DateLike = Union[date, int]
+
+
+def date_ordinal(value: Optional[str]) -> int:
+    """"DD/MM/YYYY" → date.toordinal(); NO_VALUE si falta o no es válida"""
+    try:
+        return date(int(value[6:10]), int(value[3:5]), int(value[0:2])).toordinal()
+    except (TypeError, ValueError):
+        return NO_VALUE
+
+
+def minute_of_day(value: Optional[str]) -> int:
+    """"HH:MM" → minutos desde medianoche; NO_VALUE si falta o no es válida"""
+    try:
+        hours, minutes = value.split(":")
+        return int(hours) * 60 + int(minutes)
+    except (AttributeError, ValueError):
+        return NO_VALUE
+
+
+def _ordinal(value: DateLike) -> int:
+    return value.toordinal() if isinstance(value, date) else int(value)
+
+
+class ActivityStore:
+    """Tabla columnar de actividades de varios meses"""
+
+    def __init__(self, rows: Iterable[Tuple[str, str, dict]]):
+        """
+        Args:
+            rows: (mes YYYYMM, civico_id, actividad) en cualquier orden
+        """
+        self.activities: List[dict] = []
+        months, civico_codes, self.civicos = [], [], []
+        codes = {}
+        start, end, start_min, end_min = [], [], [], []
+        inscripcion, edad_min, edad_max, precio = [], [], [], []
+        texts = {field: [] for field in TEXT_FIELDS}
+
+        skipped = 0
+        for month, civico, activity in rows:
+            first = date_ordinal(activity.get("fecha"))
+            if first == NO_VALUE:
+                skipped += 1
+                continue
+            last = date_ordinal(activity.get("fecha_fin"))
+
+            if civico not in codes:
+                codes[civico] = len(self.civicos)
+                self.civicos.append(civico)
+
+            self.activities.append({**activity, "civico": civico, "month": month})
+            months.append(int(month))
+            civico_codes.append(codes[civico])
+            start.append(first)
+            end.append(max(last, first))
+            start_min.append(minute_of_day(activity.get("hora")))
+            end_min.append(minute_of_day(activity.get("hora_fin")))
+            inscripcion.append(bool(activity.get("requiere_inscripcion")))
+            edad_min.append(NO_VALUE if activity.get("edad_minima") is None else activity["edad_minima"])
+            edad_max.append(NO_VALUE if activity.get("edad_maxima") is None else activity["edad_maxima"])
+            precio.append(np.nan if activity.get("precio") is None else activity["precio"])
+            for field in TEXT_FIELDS:
+                texts[field].append(fold(activity.get(field) or ""))
+
+        if skipped:
+            logger.warning("%d actividades sin fecha válida no se han cargado", skipped)
+
+        self.month = np.array(months, dtype=np.int32)
+        self.civico = np.array(civico_codes, dtype=np.int16)
+        self.start = np.array(start, dtype=np.int32)
+        self.end = np.array(end, dtype=np.int32)
+        self.start_min = np.array(start_min, dtype=np.int16)
+        self.end_min = np.array(end_min, dtype=np.int16)
+        self.requiere_inscripcion = np.array(inscripcion, dtype=bool)
+        self.edad_minima = np.array(edad_min, dtype=np.int16)
+        self.edad_maxima = np.array(edad_max, dtype=np.int16)
+        self.precio = np.array(precio, dtype=np.float64)
+        # Texto sin tildes y en minúsculas, para búsquedas por subcadena
+        self.text = {field: np.array(values, dtype=str) for field, values in texts.items()}
+
+        # Índice por fecha de inicio (y hora): orden cronológico de toda la tabla
+        self.by_start = np.lexsort((self.start_min, self.start)).astype(np.int64)
+        self.sorted_start = self.start[self.by_start]
+        # Duración máxima: acota hacia atrás la búsqueda de actividades en curso
+        self.max_span = int((self.end - self.start).max()) if len(self) else 0
+
+    @classmethod
+    def load(cls, data_dir: Path, months: Optional[Sequence[str]] = None) -> "ActivityStore":
+        """Carga los meses indicados (o todos los YYYYMM de data_dir)"""
+        if months:
+            month_dirs = [Path(data_dir) / m for m in months]
+        else:
+            month_dirs = sorted(Path(data_dir).glob("[0-9][0-9][0-9][0-9][0-9][0-9]"))
+
+        def rows():
+            for month_dir in month_dirs:
+                source = month_dir / "actividades.json"
+                if not source.exists():
+                    continue
+                data = json.loads(source.read_text(encoding="utf-8"))
+                for civico, activities in data.items():
+                    for activity in activities:
+                        yield month_dir.name, civico, activity
+
+        store = cls(rows())
+        logger.info("Cargadas %d actividades de %d meses", len(store), len(set(store.month.tolist())))
+        return store
+
+    def __len__(self) -> int:
+        return len(self.activities)
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def in_range(self, start: DateLike, end: Optional[DateLike] = None) -> np.ndarray:
+        """
+        Índices (en orden cronológico) de las actividades que coinciden con
+        algún día de [start, end]; una actividad de varios días cuenta si se
+        solapa con el rango.
+        """
+        first = _ordinal(start)
+        last = first if end is None else _ordinal(end)
+        lo = np.searchsorted(self.sorted_start, first - self.max_span, side="left")
+        hi = np.searchsorted(self.sorted_start, last, side="right")
+        candidates = self.by_start[lo:hi]
+        return candidates[self.end[candidates] >= first]
+
+    def query(
+        self,
+        *,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        civicos: Optional[Iterable[str]] = None,
+        requiere_inscripcion: Optional[bool] = None,
+        gratis: Optional[bool] = None,
+        edad: Optional[int] = None,
+        desde_hora: Optional[str] = None,
+        hasta_hora: Optional[str] = None,
+        **text: str,
+    ) -> np.ndarray:
+        """
+        Índices de las actividades que cumplen todos los filtros, en orden
+        cronológico.
+
+        Args:
+            start, end: rango de fechas (date u ordinal); sin start, toda la tabla
+            civicos: ids de cívico admitidos
+            requiere_inscripcion: True/False
+            gratis: True = precio 0 o sin precio; False = precio > 0
+            edad: la actividad admite esa edad (según edad_minima/edad_maxima)
+            desde_hora, hasta_hora: "HH:MM"; la hora de inicio debe caer dentro
+            nombre, publico, lugar: subcadena, sin distinguir tildes ni mayúsculas
+        """
+        unknown = set(text) - set(TEXT_FIELDS)
+        if unknown:
+            raise TypeError(f"Filtros desconocidos: {', '.join(sorted(unknown))}")
+
+        if start is not None:
+            idx = self.in_range(start, end)
+        elif end is not None:
+            raise ValueError("end requiere start")
+        else:
+            idx = self.by_start
+
+        mask = np.ones(len(idx), dtype=bool)
+        if civicos is not None:
+            codes = [self.civicos.index(c) for c in civicos if c in self.civicos]
+            mask &= np.isin(self.civico[idx], codes)
+        if requiere_inscripcion is not None:
+            mask &= self.requiere_inscripcion[idx] == requiere_inscripcion
+        if gratis is not None:
+            free = ~(self.precio[idx] > 0)
+            mask &= free if gratis else ~free
+        if edad is not None:
+            minima, maxima = self.edad_minima[idx], self.edad_maxima[idx]
+            mask &= ((minima == NO_VALUE) | (minima <= edad)) & ((maxima == NO_VALUE) | (maxima >= edad))
+        if desde_hora is not None:
+            mask &= self.start_min[idx] >= minute_of_day(desde_hora)
+        if hasta_hora is not None:
+            mask &= (self.start_min[idx] != NO_VALUE) & (self.start_min[idx] <= minute_of_day(hasta_hora))
+        for field, needle in text.items():
+            if needle:
+                mask &= np.char.find(self.text[field][idx], fold(needle)) >= 0
+
+        return idx[mask]
+
+    def records(self, idx: Sequence[int]) -> Iterator[dict]:
+        """Actividades originales (con civico y month) de los índices dados"""
+        for i in idx:
+            yield self.activities[i]
+
+    def facets(self, idx: Optional[np.ndarray] = None) -> dict:
+        """
+        Recuentos por cívico, mes e inscripción de un resultado (o de toda la
+        tabla), para pintar filtros con su número de actividades.
+        """
+        if idx is None:
+            idx = self.by_start
+        civico_counts = np.bincount(self.civico[idx], minlength=len(self.civicos))
+        months, month_counts = np.unique(self.month[idx], return_counts=True)
+        inscripcion = int(self.requiere_inscripcion[idx].sum())
+        return {
+            "total": len(idx),
+            "civicos": {c: int(n) for c, n in zip(self.civicos, civico_counts) if n},
+            "meses": {str(m): int(n) for m, n in zip(months, month_counts)},
+            "requiere_inscripcion": {"true": inscripcion, "false": len(idx) - inscripcion},
+        }
+
+    def days(self, idx: Optional[np.ndarray] = None) -> Counter:
+        """Actividades por día de inicio (date → recuento)"""
+        if idx is None:
+            idx = self.by_start
+        ordinals, counts = np.unique(self.start[idx], return_counts=True)
+        return Counter({date.fromordinal(int(o)): int(n) for o, n in zip(ordinals, counts)})
@@ -0,0 +1,317 @@
+"""
+Exportación de docs/data a una base SQLite para análisis histórico.
+
+Tablas:
+
+    months      un registro por mes con los SHA-256 de sus ficheros de origen
+    activities  una fila por actividad; id = hash estable de (mes, cívico,
+                contenido, nº de repetición). Fechas en ISO (YYYY-MM-DD) para
+                poder ordenar y comparar en SQL
+    links       links.json de cada mes
+    warnings    líneas de warnings.log de cada mes
+    activities_fts  índice FTS5 sobre nombre/descripcion (sin tildes),
+                sincronizado con activities mediante triggers
+
+La exportación es incremental: un mes cuyos ficheros no han cambiado (mismo
+hash) no se toca, y en uno que ha cambiado solo se insertan las actividades
+nuevas y se borran las que ya no están; las demás conservan su fila.
+
+Uso:
+    python -m src.store.sqlite_export                    # Todos los meses
+    python -m src.store.sqlite_export 202601 --db /tmp/actividades.sqlite
+
+    sqlite3 .cache/actividades.sqlite \\
+        "SELECT fecha, civico, nombre FROM activities_fts JOIN activities
+         ON activities.rowid = activities_fts.rowid
+         WHERE activities_fts MATCH 'yoga' ORDER BY fecha"
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from src.utils.logging_config import setup_logging
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path("docs/data")
+DB_PATH = Path(".cache/actividades.sqlite")
+
+ACTIVITY_FIELDS = (
+    "nombre", "descripcion", "fecha", "fecha_fin", "hora", "hora_fin", "requiere_inscripcion",
+    "lugar", "publico", "edad_minima", "edad_maxima", "precio",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS months (
+    month TEXT PRIMARY KEY,
+    actividades_sha256 TEXT,
+    links_sha256 TEXT,
+    warnings_sha256 TEXT,
+    activities INTEGER NOT NULL DEFAULT 0,
+    exported_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS activities (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    month TEXT NOT NULL,
+    civico TEXT NOT NULL,
+    nombre TEXT NOT NULL,
+    descripcion TEXT,
+    fecha TEXT NOT NULL,
+    fecha_fin TEXT,
+    hora TEXT,
+    hora_fin TEXT,
+    requiere_inscripcion INTEGER NOT NULL,
+    lugar TEXT,
+    publico TEXT NOT NULL,
+    edad_minima INTEGER,
+    edad_maxima INTEGER,
+    precio REAL
+);
+CREATE INDEX IF NOT EXISTS idx_activities_fecha ON activities (fecha, hora);
+CREATE INDEX IF NOT EXISTS idx_activities_civico ON activities (civico, fecha);
+CREATE INDEX IF NOT EXISTS idx_activities_publico ON activities (publico);
+CREATE INDEX IF NOT EXISTS idx_activities_inscripcion ON activities (requiere_inscripcion, fecha);
+CREATE INDEX IF NOT EXISTS idx_activities_month ON activities (month);
+
+CREATE TABLE IF NOT EXISTS links (
+    month TEXT NOT NULL,
+    civico_id TEXT NOT NULL,
+    title TEXT,
+    url TEXT NOT NULL,
+    filename TEXT,
+    is_new INTEGER,
+    PRIMARY KEY (month, civico_id, url)
+);
+
+CREATE TABLE IF NOT EXISTS warnings (
+    month TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    logged_at TEXT,
+    source TEXT,
+    message TEXT NOT NULL,
+    PRIMARY KEY (month, line)
+);
+CREATE INDEX IF NOT EXISTS idx_warnings_source ON warnings (source);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS activities_fts USING fts5(
+    nombre, descripcion,
+    content='activities', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS activities_fts_insert AFTER INSERT ON activities BEGIN
+    INSERT INTO activities_fts (rowid, nombre, descripcion) VALUES (new.rowid, new.nombre, new.descripcion);
+END;
+CREATE TRIGGER IF NOT EXISTS activities_fts_delete AFTER DELETE ON activities BEGIN
+    INSERT INTO activities_fts (activities_fts, rowid, nombre, descripcion)
+    VALUES ('delete', old.rowid, old.nombre, old.descripcion);
+END;
+"""
+
+# "2026-01-05 10:00:00,123 [W] parser.x:42 - mensaje"
+# warnings.log recibe dos formatos: el de warning_logger ("<fecha> [W] origen - mensaje")
+# y el del log de setup_logging ("[WARNING] <fecha> - origen - mensaje")
+_TIMESTAMP = r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}"
+_WARNING_LINES = (
+    re.compile(rf"^(?P<fecha>{_TIMESTAMP}) \[W\] (?P<origen>\S+) - (?P<mensaje>.*)$"),
+    re.compile(rf"^\[[A-Z]+\] (?P<fecha>{_TIMESTAMP}) - (?P<origen>\S+) - (?P<mensaje>.*)$"),
+)
+# Inicio de registro aunque no encaje en ninguno de los formatos (no es continuación)
+_RECORD_START = re.compile(rf"^(\[[A-Z]+\] |{_TIMESTAMP} )")
+
+
+def _sha256(path: Path) -> Optional[str]:
+    if not path.exists():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _iso_date(value: Optional[str]) -> Optional[str]:
+    """"DD/MM/YYYY" → "YYYY-MM-DD" (sin validar el calendario)"""
+    if not value or len(value) != 10:
+        return value
+    return f"{value[6:10]}-{value[3:5]}-{value[0:2]}"
+
+
+def activity_rows(month: str, activities_by_civic: dict) -> Iterator[Tuple]:
+    """
+    Filas de activities para un mes. El id es el hash del contenido más el
+    número de repetición, así que una actividad idéntica listada dos veces
+    da dos filas y el id no depende de su posición en el fichero.
+    """
+    for civico, activities in activities_by_civic.items():
+        seen = Counter()
+        for activity in activities:
+            canonical = json.dumps(
+                {field: activity.get(field) for field in ACTIVITY_FIELDS},
+                ensure_ascii=False, sort_keys=True,
+            )
+            seen[canonical] += 1
+            digest = hashlib.sha256(f"{month}\0{civico}\0{canonical}\0{seen[canonical]}".encode("utf-8"))
+            yield (
+                digest.hexdigest()[:32], month, civico,
+                activity["nombre"], activity.get("descripcion"),
+                _iso_date(activity["fecha"]), _iso_date(activity.get("fecha_fin")),
+                activity.get("hora"), activity.get("hora_fin"),
+                int(bool(activity.get("requiere_inscripcion"))),
+                activity.get("lugar"), activity["publico"],
+                activity.get("edad_minima"), activity.get("edad_maxima"), activity.get("precio"),
+            )
+
+
+def parse_warnings(text: str) -> List[Tuple[int, Optional[str], Optional[str], str]]:
+    """
+    (nº de línea, fecha, origen, mensaje) de cada registro de warnings.log.
+    Las líneas que no empiezan un registro (sangradas, trazas...) se unen al anterior.
+    """
+    entries = []
+    for number, line in enumerate(text.splitlines(), start=1):
+        match = next((m for m in (p.match(line) for p in _WARNING_LINES) if m), None)
+        if match:
+            entries.append([number, match["fecha"], match["origen"], match["mensaje"]])
+        elif entries and not _RECORD_START.match(line):
+            entries[-1][3] += "\n" + line
+        elif line.strip():
+            entries.append([number, None, None, line])
+    return [tuple(entry) for entry in entries]
+
+
+def connect(db_path: Path = DB_PATH) -> sqlite3.Connection:
+    """Abre (o crea) la base con el schema; FTS5 solo si SQLite lo incluye"""
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.executescript(SCHEMA)
+    try:
+        conn.executescript(FTS_SCHEMA)
+    except sqlite3.OperationalError as e:
+        logger.warning("SQLite sin FTS5 (%s): no se crea activities_fts", e)
+    return conn
+
+
+def export_month(conn: sqlite3.Connection, month_dir: Path) -> dict:
+    """
+    Sincroniza un mes con la base.
+
+    Returns:
+        {"month", "inserted", "deleted", "unchanged", "links", "warnings"};
+        links/warnings indican si se reescribieron
+    """
+    month = month_dir.name
+    hashes = {
+        "actividades_sha256": _sha256(month_dir / "actividades.json"),
+        "links_sha256": _sha256(month_dir / "links.json"),
+        "warnings_sha256": _sha256(month_dir / "warnings.log"),
+    }
+    previous = conn.execute(
+        "SELECT actividades_sha256, links_sha256, warnings_sha256 FROM months WHERE month = ?", (month,)
+    ).fetchone()
+    previous = dict(zip(hashes, previous)) if previous else {}
+    report = {"month": month, "inserted": 0, "deleted": 0, "unchanged": 0, "links": False, "warnings": False}
+
+    with conn:
+        if hashes["actividades_sha256"] != previous.get("actividades_sha256"):
+            if hashes["actividades_sha256"] is None:
+                rows = []
+            else:
+                data = json.loads((month_dir / "actividades.json").read_text(encoding="utf-8"))
+                rows = list(activity_rows(month, data))
+            wanted = {row[0] for row in rows}
+            existing = {r[0] for r in conn.execute("SELECT id FROM activities WHERE month = ?", (month,))}
+            stale = existing - wanted
+            conn.executemany("DELETE FROM activities WHERE id = ?", ((i,) for i in stale))
+            new_rows = [row for row in rows if row[0] not in existing]
+            conn.executemany(
+                f"INSERT INTO activities (id, month, civico, {', '.join(ACTIVITY_FIELDS)}) "
+                f"VALUES ({', '.join('?' * (3 + len(ACTIVITY_FIELDS)))})",
+                new_rows,
+            )
+            report.update(inserted=len(new_rows), deleted=len(stale), unchanged=len(wanted & existing))
+        else:
+            report["unchanged"] = conn.execute(
+                "SELECT COUNT(*) FROM activities WHERE month = ?", (month,)
+            ).fetchone()[0]
+
+        if hashes["links_sha256"] != previous.get("links_sha256"):
+            conn.execute("DELETE FROM links WHERE month = ?", (month,))
+            if hashes["links_sha256"] is not None:
+                links = json.loads((month_dir / "links.json").read_text(encoding="utf-8")).get("links", [])
+                conn.executemany(
+                    "INSERT OR REPLACE INTO links VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (month, link.get("civico_id"), link.get("title"), link.get("url"),
+                         link.get("filename"), int(bool(link.get("is_new"))))
+                        for link in links
+                    ],
+                )
+            report["links"] = True
+
+        if hashes["warnings_sha256"] != previous.get("warnings_sha256"):
+            conn.execute("DELETE FROM warnings WHERE month = ?", (month,))
+            if hashes["warnings_sha256"] is not None:
+                text = (month_dir / "warnings.log").read_text(encoding="utf-8", errors="replace")
+                conn.executemany(
+                    "INSERT INTO warnings VALUES (?, ?, ?, ?, ?)",
+                    [(month, *entry) for entry in parse_warnings(text)],
+                )
+            report["warnings"] = True
+
+        count = conn.execute("SELECT COUNT(*) FROM activities WHERE month = ?", (month,)).fetchone()[0]
+        conn.execute(
+            "INSERT OR REPLACE INTO months VALUES (?, ?, ?, ?, ?, ?)",
+            (month, hashes["actividades_sha256"], hashes["links_sha256"], hashes["warnings_sha256"],
+             count, datetime.now(timezone.utc).isoformat()),
+        )
+
+    return report
+
+
+def export_all(
+    data_dir: Path = DATA_DIR, db_path: Path = DB_PATH, months: Optional[List[str]] = None
+) -> List[dict]:
+    """Exporta los meses indicados (o todos los YYYYMM de data_dir)"""
+    if months:
+        month_dirs = [Path(data_dir) / m for m in months]
+    else:
+        month_dirs = sorted(Path(data_dir).glob("[0-9][0-9][0-9][0-9][0-9][0-9]"))
+
+    conn = connect(db_path)
+    try:
+        reports = []
+        for month_dir in month_dirs:
+            report = export_month(conn, month_dir)
+            logger.info(
+                "%s: +%d -%d =%d actividades%s%s", report["month"], report["inserted"], report["deleted"],
+                report["unchanged"], ", links" if report["links"] else "", ", warnings" if report["warnings"] else "",
+            )
+            reports.append(report)
+        return reports
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporta docs/data a SQLite para análisis")
+    parser.add_argument("months", nargs="*", help="Meses YYYYMM (por defecto todos)")
+    parser.add_argument("--data-path", default="docs/data", help="Ruta base de datos (por defecto: docs/data/)")
+    parser.add_argument("--db", default=str(DB_PATH), help=f"Base SQLite (por defecto: {DB_PATH})")
+    args = parser.parse_args()
+
+    setup_logging()
+    export_all(Path(args.data_path), Path(args.db), args.months)
+
+
+if __name__ == "__main__":
+    main()
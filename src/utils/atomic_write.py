@@ -0,0 +1,44 @@
+import json
+import os
+import stat
+import tempfile
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Escribe `data` en `path` sin dejar nunca un fichero a medias:
+    escribe a un temporal en el mismo directorio, hace fsync y lo renombra
+    con os.replace (atómico en el mismo sistema de ficheros).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # mkstemp crea con 0600: conservar los permisos del fichero existente
+    # (o 0644) para que la web pueda servir lo publicado
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), mode)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8") -> None:
+    """Como atomic_write_bytes, para texto"""
+    atomic_write_bytes(path, text.encode(encoding))
+
+
+def atomic_write_json(path: Path, data, *, indent: int | None = 2) -> None:
+    """Serializa `data` (ensure_ascii=False) y lo escribe con atomic_write_text"""
+    separators = None if indent is not None else (",", ":")
+    atomic_write_text(path, json.dumps(data, ensure_ascii=False, indent=indent, separators=separators))
@@ -0,0 +1,110 @@
+"""
+Caché en disco direccionada por contenido, base de las cachés del LLM y de
+Camelot.
+
+Cada entrada es un JSON en <cache_dir>/<2 primeros hex>/<sha256>.json; la
+clave la calcula quien usa la caché a partir de todo lo que determina el
+resultado, así que una entrada nunca queda obsoleta, solo sin usar.
+
+- get() descarta (y borra) las entradas ilegibles o que llevan más de
+  max_age_seconds sin usarse; cada lectura actualiza el mtime del fichero
+- _put() (detrás del put() de cada caché) escribe de forma atómica
+  (atomic_write_json) y, con max_bytes, poda cada EVICT_EVERY escrituras
+- evict() borra las caducadas y, si se pasa de max_bytes, las menos usadas
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from src.utils.atomic_write import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+# Cada cuántas escrituras se revisa el tamaño total de la caché
+EVICT_EVERY = 50
+
+
+class DiskCache:
+    # Nombre en los mensajes de log ("caché LLM", "caché Camelot")
+    name = "disco"
+
+    def __init__(self, cache_dir: Path, *, max_age_seconds: float, max_bytes: Optional[int] = None):
+        self.cache_dir = Path(cache_dir)
+        self.max_age_seconds = max_age_seconds
+        self.max_bytes = max_bytes
+        self._writes = 0
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _unpack(self, entry: dict) -> Any:
+        """Lo que devuelve get() a partir de la entrada leída (KeyError/TypeError = corrupta)"""
+        return entry
+
+    def get(self, key: str) -> Optional[Any]:
+        """Devuelve la entrada o None si no existe, está corrupta o ha caducado"""
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.max_age_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            value = self._unpack(json.loads(path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Entrada de caché {self.name} ilegible {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Marcar como usada recientemente
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def _put(self, key: str, entry: dict) -> None:
+        try:
+            # Serializa antes de crear el temporal y lo borra si la escritura falla
+            atomic_write_json(self._path(key), {"key": key, **entry, "created_at": time.time()}, indent=None)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"No se pudo guardar en caché {self.name}: {e}")
+            return
+
+        self._writes += 1
+        if self.max_bytes is not None and self._writes % EVICT_EVERY == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """Borra entradas caducadas y, si hace falta, las menos usadas. Devuelve cuántas borró."""
+        now = time.time()
+        entries = []
+        removed = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if now - stat.st_mtime > self.max_age_seconds:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        if self.max_bytes is not None:
+            total = sum(size for _, size, _ in entries)
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+
+        if removed:
+            logger.info(f"Caché {self.name}: {removed} entradas desalojadas")
+        return removed
@@ -0,0 +1,304 @@
+"""
+Métricas en formato de texto de Prometheus para el textfile collector.
+
+El scraper y el orquestador se ejecutan desde cron, así que en lugar de
+exponer un endpoint escriben al terminar un fichero .prom que node_exporter
+(--collector.textfile.directory) publica. No hace falta prometheus_client:
+este módulo implementa contadores, gauges e histogramas con etiquetas y el
+formato de exposición.
+
+Cada módulo declara sus métricas al importarse (con el mismo nombre se
+devuelve la misma métrica):
+
+    DOWNLOAD_SECONDS = metrics.histogram(
+        "download_seconds", "Duración de las descargas (s)", labels=("kind",)
+    )
+    DOWNLOAD_SECONDS.observe(0.42, kind="pdf")
+
+Lo que se registra en un proceso worker (Camelot en el pool del
+orquestador) vuelve al proceso principal con snapshot() y merge().
+
+El fichero se escribe de forma atómica (el collector podría leerlo a medias)
+en la ruta de --metrics-file o, si está definida la variable de entorno
+METRICS_TEXTFILE_DIR, en <dir>/burgos_civicos_<job>.prom.
+"""
+
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.utils.atomic_write import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "burgos_civicos_"
+METRICS_TEXTFILE_DIR = os.environ.get("METRICS_TEXTFILE_DIR")
+
+# Segundos: de una página de Camelot a una petición lenta a Ollama
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+TOKEN_BUCKETS = (16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], le: Optional[str] = None) -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if le is not None:
+        parts.append(f'le="{le}"')
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(ABC):
+    """Una familia de series con las mismas etiquetas (segura entre hilos)"""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        if set(labels) != set(self.label_names):
+            raise ValueError(
+                f"{self.name}: etiquetas {sorted(labels)}, se esperaban {sorted(self.label_names)}"
+            )
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def snapshot(self) -> List[list]:
+        """Series como [valores de etiquetas, valor] (serializable)"""
+        with self._lock:
+            return [[list(key), value] for key, value in sorted(self._series.items())]
+
+    @abstractmethod
+    def merge(self, series: List[list]) -> None:
+        """Incorpora las series de un snapshot() de otro proceso"""
+
+    def render(self) -> List[str]:
+        full = PREFIX + self.name
+        lines = [f"# HELP {full} {_escape(self.help)}", f"# TYPE {full} {self.kind}"]
+        for key, value in self.snapshot():
+            lines.extend(self._samples(full, key, value))
+        return lines
+
+    def _samples(self, full: str, key: List[str], value) -> List[str]:
+        return [f"{full}{_labels(self.label_names, key)} {_number(value)}"]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def merge(self, series: List[list]) -> None:
+        with self._lock:
+            for key, value in series:
+                key = tuple(key)
+                self._series[key] = self._series.get(key, 0) + value
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = value
+
+    def merge(self, series: List[list]) -> None:
+        with self._lock:
+            for key, value in series:
+                self._series[tuple(key)] = value
+
+
+class Histogram(Metric):
+    """Cada serie es [cuentas por bucket (no acumuladas), suma, número de observaciones]"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def _slot(self, value: float) -> int:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                return i
+        return len(self.buckets)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][self._slot(value)] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """Observa la duración del bloque (también si lanza una excepción)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def snapshot(self) -> List[list]:
+        with self._lock:
+            return [
+                [list(key), [list(counts), total, n]]
+                for key, (counts, total, n) in sorted(self._series.items())
+            ]
+
+    def merge(self, series: List[list]) -> None:
+        with self._lock:
+            for key, (counts, total, n) in series:
+                key = tuple(key)
+                current = self._series.get(key)
+                if current is None:
+                    current = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                current[0] = [a + b for a, b in zip(current[0], counts)]
+                current[1] += total
+                current[2] += n
+
+    def _samples(self, full: str, key: List[str], value) -> List[str]:
+        counts, total, n = value
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, counts):
+            cumulative += count
+            lines.append(f"{full}_bucket{_labels(self.label_names, key, _number(bound))} {cumulative}")
+        lines.append(f"{full}_bucket{_labels(self.label_names, key, '+Inf')} {n}")
+        lines.append(f"{full}_sum{_labels(self.label_names, key)} {_number(total)}")
+        lines.append(f"{full}_count{_labels(self.label_names, key)} {n}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Metric] = {}
+
+    def _get_or_create(self, cls, name: str, help: str, labels: Sequence[str], **kwargs) -> Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, labels, **kwargs)
+            elif type(metric) is not cls or metric.label_names != tuple(labels):
+                raise ValueError(f"La métrica {name} ya existe con otro tipo o etiquetas")
+            return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labels)
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help, labels)
+
+    def histogram(
+        self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help, labels, buckets=buckets)
+
+    def render(self) -> str:
+        """Todas las métricas en formato de exposición de texto"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        return "".join(line + "\n" for metric in metrics for line in metric.render())
+
+    def snapshot(self) -> Dict[str, List[list]]:
+        """Series de todas las métricas, para devolverlas desde otro proceso"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {metric.name: series for metric in metrics if (series := metric.snapshot())}
+
+    def merge(self, snapshot: Dict[str, List[list]]) -> None:
+        """Suma contadores e histogramas de un snapshot(); los gauges se sobrescriben"""
+        with self._lock:
+            metrics = dict(self._metrics)
+        for name, series in snapshot.items():
+            if name in metrics:
+                metrics[name].merge(series)
+
+    def reset(self) -> None:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+REGISTRY = Registry()
+counter = REGISTRY.counter
+gauge = REGISTRY.gauge
+histogram = REGISTRY.histogram
+
+LAST_RUN = gauge("last_run_timestamp_seconds", "Fin de la última ejecución (epoch)", labels=("job",))
+RUN_DURATION = gauge("run_duration_seconds", "Duración de la última ejecución (s)", labels=("job",))
+RUN_SUCCESS = gauge("run_success", "1 si la última ejecución terminó sin error", labels=("job",))
+
+
+def default_textfile(job: str) -> Optional[Path]:
+    """<METRICS_TEXTFILE_DIR>/burgos_civicos_<job>.prom, o None si no está configurado"""
+    if not METRICS_TEXTFILE_DIR:
+        return None
+    return Path(METRICS_TEXTFILE_DIR) / f"{PREFIX}{job}.prom"
+
+
+def record_run(job: str, *, started: float, success: bool) -> None:
+    """Gauges de la ejecución: fin, duración (desde `started`, time.time()) y éxito"""
+    now = time.time()
+    LAST_RUN.set(now, job=job)
+    RUN_DURATION.set(now - started, job=job)
+    RUN_SUCCESS.set(1 if success else 0, job=job)
+
+
+def write_textfile(path: Path, registry: Registry = REGISTRY) -> Path:
+    """Escribe las métricas en `path` de forma atómica"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(path, registry.render())
+    return path
+
+
+def finish_run(job: str, *, started: float, success: bool, path: Optional[Path] = None) -> Optional[Path]:
+    """
+    Registra la ejecución (record_run) y escribe las métricas en `path` o en
+    default_textfile(job). Sin destino no hace nada; un error al escribir
+    solo se registra en el log, para no tumbar la ejecución por las métricas.
+    """
+    path = Path(path) if path else default_textfile(job)
+    if path is None:
+        return None
+    record_run(job, started=started, success=success)
+    try:
+        write_textfile(path)
+    except OSError as e:
+        logger.warning("No se pudieron escribir las métricas en %s: %s", path, e)
+        return None
+    logger.info("Métricas: %s", path)
+    return path
@@ -0,0 +1,273 @@
+"""
+Spans de tiempo de una ejecución del orquestador.
+
+Un RunReport guarda spans (etapa, cívico, inicio y duración con reloj
+monótono, más contadores y tamaños en bytes) de todos los hilos. El
+orquestador lo activa mientras procesa un mes para que los módulos que no lo
+reciben como argumento (el parser IA, por cada llamada a Ollama) registren
+sus spans con las funciones span(), annotate() y add_counts() de este
+módulo, que no hacen nada si no hay ninguno activo.
+
+Al terminar se escribe:
+- run_report.json: totales por etapa y por cívico, resumen de llamadas al
+  LLM (p50/p95) y la lista de spans
+- run_trace.json (opcional): formato "trace event" de Chrome, para abrirlo
+  en chrome://tracing o https://ui.perfetto.dev
+
+El RunReport también estima el tiempo restante con el rendimiento medido
+(filas parseadas por segundo) y lo registra en el log como línea de progreso.
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from src.utils.atomic_write import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+REPORT_NAME = "run_report.json"
+TRACE_NAME = "run_trace.json"
+# Como mucho una línea de progreso cada tantos segundos desde las llamadas al LLM
+PROGRESS_INTERVAL = 10.0
+
+_active: Optional["RunReport"] = None
+_local = threading.local()
+
+
+def percentile(values: List[float], p: float) -> Optional[float]:
+    """Percentil por rango más cercano"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)]
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m{seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m"
+
+
+class RunReport:
+    """Spans y progreso de una ejecución (seguro entre hilos)"""
+
+    def __init__(self, month: str, *, jobs: int = 1, civicos: int = 0):
+        self.month = month
+        self.jobs = jobs
+        self.civicos = civicos
+        self.started_at = datetime.now(timezone.utc)
+        self.t0 = time.perf_counter()
+        self.spans: List[dict] = []
+        self._lock = threading.Lock()
+        # Progreso: filas extraídas y parseadas por cívico
+        self._rows_known: Dict[str, int] = {}
+        self._rows_done: Dict[str, int] = {}
+        self._parsed: set = set()
+        self._parse_started: Optional[float] = None
+        self._last_progress = 0.0
+
+    @contextmanager
+    def span(self, name: str, *, civico: str = "", **attrs) -> Iterator[dict]:
+        """
+        Mide el bloque. Los atributos del dict que se devuelve (contadores,
+        bytes...) se guardan con el span; si el bloque lanza una excepción
+        se anota en "error".
+        """
+        attrs = dict(attrs)
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(attrs)
+        start = time.perf_counter()
+        try:
+            yield attrs
+        except BaseException as e:
+            attrs["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            end = time.perf_counter()
+            stack.pop()
+            self._add({
+                "name": name,
+                "civico": civico,
+                "start": start - self.t0,
+                "duration": end - start,
+                "pid": os.getpid(),
+                "thread": threading.current_thread().name,
+                "attrs": attrs,
+            })
+
+    def _add(self, span: dict) -> None:
+        with self._lock:
+            self.spans.append(span)
+            self._track_progress(span)
+            line = None
+            now = time.perf_counter()
+            if span["name"] == "llm" and now - self._last_progress >= PROGRESS_INTERVAL:
+                self._last_progress = now
+                line = self._progress_line(now)
+        if line:
+            logger.info(line)
+
+    # --- Progreso -------------------------------------------------------
+
+    def _track_progress(self, span: dict) -> None:
+        civico, attrs = span["civico"], span["attrs"]
+        if span["name"] == "extract" and "rows" in attrs:
+            self._rows_known[civico] = attrs["rows"]
+        elif span["name"] == "llm" and not attrs.get("error"):
+            self._rows_done[civico] = self._rows_done.get(civico, 0) + attrs.get("rows", 1)
+            if self._parse_started is None:
+                self._parse_started = self.t0 + span["start"]
+        elif span["name"] == "parse":
+            self._parsed.add(civico)
+            self._rows_done[civico] = self._rows_known.get(civico, attrs.get("rows", 0))
+            if self._parse_started is None:
+                self._parse_started = self.t0 + span["start"]
+
+    def _progress_line(self, now: float) -> str:
+        known = sum(self._rows_known.values())
+        done = sum(min(n, self._rows_known.get(c, n)) for c, n in self._rows_done.items())
+        pending_civicos = max(self.civicos - len(self._rows_known), 0)
+        # Cívicos aún sin extraer: tantas filas como la media de los ya extraídos
+        avg_rows = known / len(self._rows_known) if self._rows_known else 0
+        total = known + pending_civicos * avg_rows
+
+        line = (
+            f"Progreso {self.month}: {len(self._parsed)}/{self.civicos} cívicos, "
+            f"{done}/{round(total)} filas"
+        )
+        elapsed = now - self._parse_started if self._parse_started is not None else 0
+        if done and elapsed > 0:
+            rate = done / elapsed
+            line += f", {rate:.2f} filas/s, ETA {format_duration((total - done) / rate)}"
+        return line
+
+    def progress_line(self) -> str:
+        """Línea de progreso: cívicos y filas hechos, ritmo medido y tiempo restante estimado"""
+        with self._lock:
+            return self._progress_line(time.perf_counter())
+
+    # --- Informe --------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            spans = list(self.spans)
+
+        stages: Dict[str, dict] = {}
+        civicos: Dict[str, dict] = {}
+        for span in spans:
+            for totals in (
+                stages.setdefault(span["name"], {}),
+                civicos.setdefault(span["civico"] or "*", {}).setdefault(span["name"], {}),
+            ):
+                totals["count"] = totals.get("count", 0) + 1
+                totals["seconds"] = totals.get("seconds", 0.0) + span["duration"]
+                for key, value in span["attrs"].items():
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        totals[key] = totals.get(key, 0) + value
+                if span["attrs"].get("error"):
+                    totals["errors"] = totals.get("errors", 0) + 1
+
+        # Las peticiones servidas enteras por la caché LLM no cuentan para la latencia
+        llm = [s for s in spans if s["name"] == "llm"]
+        calls = [s["duration"] for s in llm if s["attrs"].get("requests")]
+        return {
+            "month": self.month,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "duration": time.perf_counter() - self.t0,
+            "jobs": self.jobs,
+            "stages": stages,
+            "civicos": civicos,
+            "llm": {
+                "calls": len(calls),
+                "cached": len(llm) - len(calls),
+                "seconds": sum(calls),
+                "p50": percentile(calls, 50),
+                "p95": percentile(calls, 95),
+            },
+            "spans": spans,
+        }
+
+    def to_trace(self) -> dict:
+        """Spans en formato trace event de Chrome (eventos completos "X", en µs)"""
+        with self._lock:
+            spans = list(self.spans)
+        threads: Dict[tuple, int] = {}
+        events = []
+        for span in spans:
+            tid = threads.setdefault((span["pid"], span["thread"]), len(threads) + 1)
+            events.append({
+                "name": f"{span['name']} {span['civico']}".strip(),
+                "cat": span["name"],
+                "ph": "X",
+                "ts": round(span["start"] * 1e6),
+                "dur": round(span["duration"] * 1e6),
+                "pid": span["pid"],
+                "tid": tid,
+                "args": span["attrs"],
+            })
+        for (pid, thread), tid in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, month_dir: Path, *, trace: bool = False) -> Path:
+        """Escribe run_report.json (y run_trace.json si trace=True) en month_dir"""
+        path = month_dir / REPORT_NAME
+        atomic_write_json(path, self.to_dict())
+        if trace:
+            atomic_write_json(month_dir / TRACE_NAME, self.to_trace(), indent=None)
+        return path
+
+
+@contextmanager
+def activate(report: RunReport) -> Iterator[RunReport]:
+    """Hace que span()/annotate() registren en `report` mientras dure el bloque"""
+    global _active
+    previous, _active = _active, report
+    try:
+        yield report
+    finally:
+        _active = previous
+
+
+def get_active_report() -> Optional[RunReport]:
+    return _active
+
+
+@contextmanager
+def span(name: str, *, civico: str = "", **attrs) -> Iterator[dict]:
+    """RunReport.span sobre el informe activo (sin informe, solo devuelve un dict)"""
+    report = _active
+    if report is None:
+        yield dict(attrs)
+        return
+    with report.span(name, civico=civico, **attrs) as attrs:
+        yield attrs
+
+
+def annotate(**attrs) -> None:
+    """Añade atributos al span abierto más interno de este hilo (si lo hay)"""
+    stack = getattr(_local, "stack", None)
+    if stack:
+        stack[-1].update(attrs)
+
+
+def add_counts(**counts) -> None:
+    """Suma contadores al span abierto más interno de este hilo (si lo hay)"""
+    stack = getattr(_local, "stack", None)
+    if stack:
+        for key, value in counts.items():
+            stack[-1][key] = stack[-1].get(key, 0) + value
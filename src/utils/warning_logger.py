@@ -1,24 +1,99 @@
+"""
+Sink de warnings por mes: <base_dir>/<yyyymm>/warnings.log
+
+get_warning_logger devuelve siempre el mismo logger para un mes: el fichero
+se abre una sola vez (la primera vez que hay algo que escribir) y los
+registros pasan por un MemoryHandler que los vuelca por bloques, así que
+llamarlo una vez por actividad no abre ni cierra ficheros.
+
+El orquestador apunta base_dir a su --data-path con configure_warning_logger
+y vacía los buffers con flush_warning_loggers / close_warning_loggers al
+terminar (y atexit como red de seguridad).
+"""
+
+import atexit
 import logging
+import threading
+from logging.handlers import MemoryHandler
 from pathlib import Path
 
+# Registros que se acumulan antes de escribir en disco
+BUFFER_CAPACITY = 500
+
+_base_dir = Path("docs/data")
+_loggers: dict[str, logging.Logger] = {}
+_lock = threading.Lock()
+
+
+def configure_warning_logger(base_dir: Path) -> None:
+    """
+    Cambia el directorio base de los warnings.log.
+    Cierra los sinks abiertos que apuntaban a otro directorio.
+    """
+    global _base_dir
+    base_dir = Path(base_dir)
+    if base_dir == _base_dir:
+        return
+    close_warning_loggers()
+    with _lock:
+        _base_dir = base_dir
+
+
 def get_warning_logger(month: str | int):
     month_str = str(month).zfill(2) if isinstance(month, int) else month
 
-    logger = logging.getLogger(f"warnings.{month_str}")
-    logger.setLevel(logging.WARNING)
-    logger.propagate = False
+    with _lock:
+        logger = _loggers.get(month_str)
+        if logger is not None:
+            return logger
 
-    log_path = Path("docs/data") / month_str / "warnings.log"
-    log_path.parent.mkdir(parents=True, exist_ok=True)
+        logger = logging.getLogger(f"warnings.{month_str}")
+        logger.setLevel(logging.WARNING)
+        logger.propagate = False
 
-    handler = logging.FileHandler(log_path, encoding="utf-8")
-    formatter = logging.Formatter(
-        "%(asctime)s [W] %(name)s:%(lineno)d - %(message)s"
-    )
-    handler.setFormatter(formatter)
+        log_path = _base_dir / month_str / "warnings.log"
+        log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if not logger.handlers:
+        file_handler = logging.FileHandler(log_path, encoding="utf-8", delay=True)
+        formatter = logging.Formatter(
+            "%(asctime)s [W] %(name)s:%(lineno)d - %(message)s"
+        )
+        file_handler.setFormatter(formatter)
+
+        handler = MemoryHandler(BUFFER_CAPACITY, flushLevel=logging.CRITICAL, target=file_handler)
+
+        # Sustituir handlers de una configuración anterior
+        for old in list(logger.handlers):
+            logger.removeHandler(old)
+            old.close()
         logger.addHandler(handler)
 
-    return logger
+        _loggers[month_str] = logger
+        return logger
+
+
+def flush_warning_loggers() -> None:
+    """Escribe en disco los warnings pendientes de todos los meses"""
+    with _lock:
+        loggers = list(_loggers.values())
+    for logger in loggers:
+        for handler in logger.handlers:
+            handler.flush()
+
+
+def close_warning_loggers() -> None:
+    """Vacía y cierra todos los sinks (el siguiente get_warning_logger los reabre)"""
+    with _lock:
+        loggers = list(_loggers.values())
+        _loggers.clear()
+    for logger in loggers:
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            # MemoryHandler.close() vuelca el buffer pero suelta el target sin cerrarlo
+            target = getattr(handler, "target", None)
+            handler.close()
+            if target is not None:
+                target.close()
+
 
+atexit.register(close_warning_loggers)
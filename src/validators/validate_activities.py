@@ -1,11 +1,131 @@
+"""
+Validación de actividades contra schemas/actividades.schema.v1.json.
+
+jsonschema.validate() comprueba el schema y construye un validador nuevo en
+cada llamada. ActivityValidator lo hace una sola vez (Draft 2020-12, con el
+FormatChecker compartido de la clase) y permite validar una actividad, un
+lote o el documento completo, devolviendo todos los errores con su ruta
+JSON ($.gamonal_norte[3].hora).
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
 import jsonschema
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import best_match
+
+SCHEMA_PATH = Path(__file__).resolve().parents[2] / "schemas" / "actividades.schema.v1.json"
+
+# (ruta JSON, mensaje)
+ValidationIssue = Tuple[str, str]
+
+
+def _json_path(parts: Iterable) -> str:
+    path = "$"
+    for part in parts:
+        path += f"[{part}]" if isinstance(part, int) else f".{part}"
+    return path
+
+
+def _path_sort_key(parts: Iterable) -> list:
+    """Ordena rutas con los índices como números ([2] antes que [10])"""
+    return [(isinstance(part, int), part if isinstance(part, int) else str(part)) for part in parts]
+
+
+class ActivityValidator:
+    """
+    Validador precompilado del schema de actividades.
+
+    Uso:
+        validator = get_activity_validator()
+        issues = validator.validate_batch(nuevas, civico="gamonal_norte")
+    """
+
+    def __init__(self, schema: dict):
+        Draft202012Validator.check_schema(schema)
+        format_checker = Draft202012Validator.FORMAT_CHECKER
 
-def validate_activities(activities_by_civic: dict, schema: dict) -> None:
+        self.document_validator = Draft202012Validator(schema, format_checker=format_checker)
+        # Validador de una sola actividad: mismo $defs, raíz en #/$defs/actividad
+        self.activity_validator = Draft202012Validator(
+            {"$defs": schema.get("$defs", {}), "$ref": "#/$defs/actividad"},
+            format_checker=format_checker,
+        )
+
+    def iter_errors(self, activity: dict, path: Tuple = ()) -> Iterator[jsonschema.ValidationError]:
+        """Errores de una actividad; `path` se antepone a la ruta de cada error"""
+        for error in self.activity_validator.iter_errors(activity):
+            error.path.extendleft(reversed(path))
+            yield error
+
+    def is_valid(self, activity: dict) -> bool:
+        return self.activity_validator.is_valid(activity)
+
+    def validate(self, activity: dict) -> None:
+        """Lanza jsonschema.ValidationError con el primer error de la actividad"""
+        error = next(self.iter_errors(activity), None)
+        if error is not None:
+            raise error
+
+    def validate_batch(
+        self, activities: List[dict], *, civico: Optional[str] = None, start: int = 0
+    ) -> List[ValidationIssue]:
+        """
+        Valida una lista de actividades (p.ej. las recién parseadas de un cívico).
+        `start` es el índice de la primera dentro de la lista del cívico, para
+        que las rutas coincidan con las de actividades.json.
+
+        Returns:
+            Lista de (ruta JSON, mensaje); vacía si todas son válidas
+        """
+        prefix = (civico,) if civico else ()
+        issues = []
+        for index, activity in enumerate(activities, start=start):
+            if self.activity_validator.is_valid(activity):
+                continue
+            for error in self.iter_errors(activity, (*prefix, index)):
+                issues.append((_json_path(error.path), error.message))
+        return issues
+
+    def validate_document(self, activities_by_civic: dict) -> List[ValidationIssue]:
+        """Valida un actividades.json completo ({civico: [actividades]})"""
+        errors = sorted(self.document_validator.iter_errors(activities_by_civic), key=lambda e: _path_sort_key(e.path))
+        return [(_json_path(error.path), error.message) for error in errors]
+
+
+@lru_cache(maxsize=8)
+def _cached_validator(schema_json: str) -> ActivityValidator:
+    return ActivityValidator(json.loads(schema_json))
+
+
+@lru_cache(maxsize=1)
+def _default_schema_json() -> str:
+    return json.dumps(json.loads(SCHEMA_PATH.read_text(encoding="utf-8")), sort_keys=True)
+
+
+def get_activity_validator(schema: Optional[dict] = None) -> ActivityValidator:
+    """Validador compartido para `schema` (por defecto el del repo); se construye una vez"""
+    if schema is None:
+        schema_json = _default_schema_json()
+    else:
+        schema_json = json.dumps(schema, sort_keys=True)
+    return _cached_validator(schema_json)
+
+
+def validate_activities(activities_by_civic: dict, schema: Optional[dict] = None) -> None:
     """
     activities_by_civic:
     {
         "gamonal_norte": [ {...}, {...} ],
         "san_agustin":   [ {...} ]
     }
+
+    Lanza jsonschema.ValidationError si algo no cumple el schema.
     """
-    jsonschema.validate(instance=activities_by_civic, schema=schema)
+    validator = get_activity_validator(schema)
+    error = best_match(validator.document_validator.iter_errors(activities_by_civic))
+    if error is not None:
+        raise error
@@ -0,0 +1,79 @@
+from src.downloader import bulk_download
+from src.downloader.bulk_download import download_new_links
+from tests.fixtures.pdf_server import PdfServer
+
+CIVICOS = ["gamonal_norte", "capiscol", "huelgas", "rio_vena", "san_agustin", "san_juan", "vista_alegre"]
+
+
+def _files():
+    return {
+        f"/documents/{i}/{civico}.pdf/abc{i}": b"%PDF-1.4 " + civico.encode() * 100
+        for i, civico in enumerate(CIVICOS)
+    }
+
+
+def _links(base_url, paths, is_new=True):
+    return [{"civico_id": p.split("/")[3], "url": base_url + p, "is_new": is_new} for p in paths]
+
+
+def test_downloads_all_new_links_concurrently(tmp_path):
+    files = _files()
+    with PdfServer(files, delay=0.1) as server:
+        links = _links(server.url, files)
+        links.append({"civico_id": "viejo", "url": server.url + "/documents/9/viejo.pdf/x", "is_new": False})
+
+        result = download_new_links(links, tmp_path, max_concurrency=4, per_host=4)
+
+    assert set(result) == {server.url + p for p in files}
+    for path, body in files.items():
+        assert result[server.url + path].read_bytes() == body
+    assert "/documents/9/viejo.pdf/x" not in server.requests
+    assert server.max_in_flight == 4
+
+
+def test_per_host_limit(tmp_path):
+    files = _files()
+    with PdfServer(files, delay=0.1) as server:
+        # Mismo servidor bajo dos nombres de host
+        links = _links(server.url, list(files)[:4]) + _links(f"http://localhost:{server.port}", list(files)[4:])
+
+        result = download_new_links(links, tmp_path, max_concurrency=8, per_host=2)
+
+    assert len(result) == len(files)
+    assert max(server.max_in_flight_by_host.values()) == 2
+    assert server.max_in_flight > 2
+
+
+def test_retries_transient_errors_with_backoff(tmp_path, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(bulk_download.time, "sleep", sleeps.append)
+    files = _files()
+    flaky = next(iter(files))
+    with PdfServer(files, failures={flaky: 2}) as server:
+        result = download_new_links(_links(server.url, files), tmp_path, retries=3, backoff=0.5)
+
+    assert server.url + flaky in result
+    assert server.requests.count(flaky) == 3
+    assert len(sleeps) == 2
+    assert 0.25 <= sleeps[0] <= 0.5 and 0.5 <= sleeps[1] <= 1.0
+
+
+def test_permanent_errors_not_retried(tmp_path):
+    files = _files()
+    missing = "/documents/99/inexistente.pdf/zzz"
+    with PdfServer(files) as server:
+        result = download_new_links(_links(server.url, [*files, missing]), tmp_path, retries=3)
+
+    assert server.url + missing not in result
+    assert server.requests.count(missing) == 1
+    assert len(result) == len(files)
+
+
+def test_second_run_uses_conditional_requests(tmp_path):
+    files = _files()
+    with PdfServer(files) as server:
+        first = download_new_links(_links(server.url, files), tmp_path)
+        second = download_new_links(_links(server.url, files), tmp_path)
+
+    assert second == first
+    assert server.not_modified == len(files)
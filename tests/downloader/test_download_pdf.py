@@ -1,17 +1,82 @@
-from pathlib import Path
-from unittest.mock import patch, Mock
+from unittest.mock import patch, MagicMock
+
+import pytest
+import requests
 
 from src.downloader.download_pdf import download_pdf
 
 
+def _response(body=b"", status=200, headers=None, fail_after=None):
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.status_code = status
+    response.headers = headers or {}
+    response.raise_for_status = MagicMock()
+
+    def iter_content(chunk_size):
+        for i in range(0, len(body), 3):
+            if fail_after is not None and i >= fail_after:
+                raise requests.ConnectionError("conexión cortada")
+            yield body[i:i + 3]
+
+    response.iter_content = iter_content
+    return response
+
+
 @patch("src.downloader.download_pdf.requests.get")
 def test_download_pdf(mock_get, tmp_path):
-    mock_response = Mock()
-    mock_response.content = b"PDFDATA"
-    mock_response.raise_for_status = Mock()
-    mock_get.return_value = mock_response
+    mock_get.return_value = _response(b"PDFDATA")
 
     pdf = download_pdf("https://example.com/test.pdf", tmp_path)
 
     assert pdf.exists()
     assert pdf.read_bytes() == b"PDFDATA"
+    assert mock_get.call_args.kwargs["stream"] is True
+    assert mock_get.call_args.kwargs["timeout"]
+
+
+@patch("src.downloader.download_pdf.requests.get")
+def test_download_pdf_conditional_request_304(mock_get, tmp_path):
+    url = "https://example.com/agenda/enero.pdf/"
+    mock_get.return_value = _response(b"PDFDATA", headers={"ETag": '"abc"', "Last-Modified": "Mon, 05 Jan 2026 10:00:00 GMT"})
+    first = download_pdf(url, tmp_path)
+    mtime = first.stat().st_mtime_ns
+
+    mock_get.return_value = _response(status=304)
+    second = download_pdf(url, tmp_path)
+
+    headers = mock_get.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"abc"'
+    assert headers["If-Modified-Since"] == "Mon, 05 Jan 2026 10:00:00 GMT"
+    assert second == first
+    assert second.stat().st_mtime_ns == mtime
+
+
+@patch("src.downloader.download_pdf.requests.get")
+def test_download_pdf_identical_content_not_rewritten(mock_get, tmp_path):
+    mock_get.return_value = _response(b"PDFDATA")
+    first = download_pdf("https://example.com/a.pdf/", tmp_path)
+    mtime = first.stat().st_mtime_ns
+
+    # Mismo contenido: no se reescribe el fichero existente
+    mock_get.return_value = _response(b"PDFDATA")
+    assert download_pdf("https://example.com/a.pdf/", tmp_path) == first
+    assert first.stat().st_mtime_ns == mtime
+
+    # Mismo contenido publicado con otro nombre: se reutiliza el ya descargado
+    mock_get.return_value = _response(b"PDFDATA")
+    assert download_pdf("https://example.com/copia.pdf/", tmp_path) == first
+    assert not (tmp_path / "copia.pdf").exists()
+
+
+@patch("src.downloader.download_pdf.requests.get")
+def test_download_pdf_interrupted_leaves_previous_file(mock_get, tmp_path):
+    mock_get.return_value = _response(b"VERSION-1")
+    pdf = download_pdf("https://example.com/a.pdf/", tmp_path)
+
+    mock_get.return_value = _response(b"VERSION-2-LARGA", fail_after=6)
+    with pytest.raises(requests.ConnectionError):
+        download_pdf("https://example.com/a.pdf/", tmp_path)
+
+    assert pdf.read_bytes() == b"VERSION-1"
+    assert not list(tmp_path.glob("*.part"))
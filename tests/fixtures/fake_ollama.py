@@ -0,0 +1,220 @@
+"""
+Servidor HTTP local que imita la API de Ollama para tests y benchmarks.
+
+Responde a /api/tags y /api/generate. Por defecto devuelve una actividad
+construida a partir de las líneas "Día", "Mes/Año" y "Texto" del prompt
+(o un objeto {"r0": [...], ...} para prompts por lotes), tras dormir
+`delay` segundos más `prompt_char_delay` por carácter del prompt.
+
+Como Ollama, informa de prompt_eval_count/eval_count (aquí aproximados a
+1 token cada 4 caracteres) y acumula los totales en el servidor.
+
+Con "stream": true responde NDJSON por trozos de `stream_chunk_size`
+caracteres, esperando `stream_chunk_delay` entre trozos; si el cliente
+cierra la conexión antes de terminar se cuenta en `streams_aborted`.
+"""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+RE_DAY = re.compile(r"^Día: (.*)$", re.MULTILINE)
+RE_MONTH_YEAR = re.compile(r"^Mes/Año: (\d{2})/(\d{4})$", re.MULTILINE)
+RE_TEXT = re.compile(r"^Texto: (.*)$", re.MULTILINE)
+RE_BATCH_ROW = re.compile(r"^(r\d+) \| Día: (.*?) \| Texto: (.*)$", re.MULTILINE)
+
+
+def echo_activities(day: str, month_year: tuple[str, str], text: str) -> list[dict]:
+    """Actividad mínima válida derivada del texto de la celda"""
+    mm, yyyy = month_year
+    return [{
+        "nombre": text[:60] or "Actividad",
+        "descripcion": None,
+        "fecha": f"{int(day):02d}/{mm}/{yyyy}",
+        "fecha_fin": None,
+        "hora": "18:00",
+        "hora_fin": None,
+        "requiere_inscripcion": text.startswith("(*)"),
+        "lugar": "Sala",
+        "publico": "adultos",
+        "edad_minima": None,
+        "edad_maxima": None,
+        "precio": None,
+    }]
+
+
+def echo_responder(prompt: str) -> str:
+    """Responder por defecto: una actividad por celda"""
+    month_year = RE_MONTH_YEAR.search(prompt).groups()
+    batch_rows = RE_BATCH_ROW.findall(prompt)
+    if batch_rows:
+        return json.dumps(
+            {key: echo_activities(day, month_year, text.strip()) for key, day, text in batch_rows},
+            ensure_ascii=False,
+        )
+
+    day = RE_DAY.search(prompt).group(1).strip()
+    text = RE_TEXT.search(prompt).group(1).strip()
+    return json.dumps(echo_activities(day, month_year, text), ensure_ascii=False)
+
+
+class FakeOllamaServer:
+    """
+    Uso:
+        with FakeOllamaServer(delay=0.1) as server:
+            ai_parser.configure_client(base_url=server.url)
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.0,
+        responder=echo_responder,
+        models=("mistral",),
+        prompt_char_delay: float = 0.0,
+        stream_chunk_size: int = 8,
+        stream_chunk_delay: float = 0.0,
+    ):
+        self.delay = delay
+        self.stream_chunk_size = stream_chunk_size
+        self.stream_chunk_delay = stream_chunk_delay
+        self.chunks_sent = 0
+        self.streams_aborted = 0
+        self.connections = 0
+        self.tags_requests = 0
+        self.prompt_char_delay = prompt_char_delay
+        self.responder = responder
+        self.models = list(models)
+        self.prompts: list[str] = []
+        self.prompt_tokens = 0
+        self.eval_tokens = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Como el servidor real (Go), TCP_NODELAY: sin él, cabeceras y cuerpo
+            # en escrituras separadas sufren el retardo de Nagle + ACK diferido
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def _send_json(self, payload: dict, status: int = 200):
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _write_chunk(self, payload: dict):
+                data = (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.flush()
+
+            def _send_stream(self, model: str, text: str, prompt_eval_count: int):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                size = server.stream_chunk_size
+                try:
+                    for i in range(0, len(text), size):
+                        piece = text[i:i + size]
+                        self._write_chunk({"model": model, "response": piece, "done": False})
+                        with server._lock:
+                            server.chunks_sent += 1
+                            server.eval_tokens += max(1, len(piece) // 4)
+                        if server.stream_chunk_delay:
+                            time.sleep(server.stream_chunk_delay)
+                    self._write_chunk({
+                        "model": model,
+                        "response": "",
+                        "done": True,
+                        "prompt_eval_count": prompt_eval_count,
+                        "eval_count": len(text) // 4,
+                    })
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    with server._lock:
+                        server.streams_aborted += 1
+                    self.close_connection = True
+
+            def do_GET(self):
+                if self.path == "/api/tags":
+                    with server._lock:
+                        server.tags_requests += 1
+                    self._send_json({"models": [{"name": f"{m}:latest"} for m in server.models]})
+                else:
+                    self._send_json({"error": "not found"}, status=404)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                if self.path != "/api/generate":
+                    self._send_json({"error": "not found"}, status=404)
+                    return
+
+                prompt = request.get("prompt", "")
+                with server._lock:
+                    server.prompts.append(prompt)
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    delay = server.delay + server.prompt_char_delay * len(prompt)
+                    if delay:
+                        time.sleep(delay)
+                    text = server.responder(prompt)
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+                prompt_eval_count = len(prompt) // 4
+                eval_count = len(text) // 4
+                with server._lock:
+                    server.prompt_tokens += prompt_eval_count
+
+                if request.get("stream"):
+                    self._send_stream(request.get("model"), text, prompt_eval_count)
+                    return
+
+                with server._lock:
+                    server.eval_tokens += eval_count
+
+                self._send_json({
+                    "model": request.get("model"),
+                    "response": text,
+                    "done": True,
+                    "prompt_eval_count": prompt_eval_count,
+                    "eval_count": eval_count,
+                })
+
+        return Handler
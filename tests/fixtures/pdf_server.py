@@ -0,0 +1,119 @@
+"""
+Servidor HTTP local que sirve PDFs de prueba para tests y benchmarks de descarga.
+
+Sirve `files` ({ruta: bytes}) en rutas con la forma de las del Ayuntamiento
+(/documents/<id>/<nombre>.pdf/<uuid>), con ETag y soporte de If-None-Match.
+Puede simular latencia (`delay`) y fallos transitorios: `failures` indica
+cuántas veces responde una ruta con `failure_status` antes de servirla.
+
+Lleva la cuenta de peticiones, respuestas 304 y conexiones simultáneas
+(global y por cabecera Host) para comprobar los límites de concurrencia.
+"""
+
+import hashlib
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class PdfServer:
+    """
+    Uso:
+        with PdfServer({"/documents/1/agenda.pdf/abc": b"%PDF..."}) as server:
+            download_pdf(server.url + "/documents/1/agenda.pdf/abc", tmp_path)
+    """
+
+    def __init__(self, files: dict, *, delay: float = 0.0, failures: dict | None = None, failure_status: int = 503):
+        self.files = dict(files)
+        self.delay = delay
+        self.failures = Counter(failures or {})
+        self.failure_status = failure_status
+        self.requests: list[str] = []
+        self.not_modified = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.in_flight_by_host = Counter()
+        self.max_in_flight_by_host = Counter()
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._httpd.daemon_threads = True
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self):
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status: int, body: bytes = b"", headers: dict | None = None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def do_GET(self):
+                host = self.headers.get("Host", "")
+                with server._lock:
+                    server.requests.append(self.path)
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                    server.in_flight_by_host[host] += 1
+                    server.max_in_flight_by_host[host] = max(
+                        server.max_in_flight_by_host[host], server.in_flight_by_host[host]
+                    )
+                try:
+                    if server.delay:
+                        time.sleep(server.delay)
+                    self._serve()
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+                        server.in_flight_by_host[host] -= 1
+
+            def _serve(self):
+                with server._lock:
+                    failing = server.failures[self.path] > 0
+                    if failing:
+                        server.failures[self.path] -= 1
+                if failing:
+                    self._reply(server.failure_status, b"error")
+                    return
+
+                body = server.files.get(self.path)
+                if body is None:
+                    self._reply(404, b"not found")
+                    return
+
+                etag = '"%s"' % hashlib.sha256(body).hexdigest()[:16]
+                if self.headers.get("If-None-Match") == etag:
+                    with server._lock:
+                        server.not_modified += 1
+                    self._reply(304, headers={"ETag": etag})
+                    return
+
+                self._reply(200, body, {"Content-Type": "application/pdf", "ETag": etag})
+
+        return Handler
@@ -0,0 +1,131 @@
+"""
+PDFs sintéticos con la estructura de las agendas, para tests y benchmarks.
+
+Escribe el PDF a mano (sin dependencias): cada página tiene una tabla con
+bordes (detectable por Camelot lattice) cuyas filas siguen uno de los
+layouts que manejan los process_pdf_*:
+
+    2 columnas: [día, texto]                          (gamonal_norte enero, rio_vena...)
+    4 columnas: [día, texto, día, texto]              (vista_alegre, capiscol)
+    5 columnas: [día, texto, vacía, día, texto]       (gamonal_norte febrero)
+    6 columnas: [día, texto, vacía, día, texto, vacía] (huelgas)
+"""
+
+from pathlib import Path
+
+DAY_NAMES = ["LUNES", "MARTES", "MIERCOLES", "JUEVES", "VIERNES", "SABADO", "DOMINGO"]
+
+ACTIVITIES = [
+    "(*) Taller de ceramica. 18:00 h. Sala 2. Publico: adultos",
+    "Cuentacuentos. 17:30 h. Biblioteca. Publico: infantil de 4 a 8 anos",
+    "(*) Yoga en familia. 11:00 h. Sala de encuentro. Publico: familiar",
+    "Cine forum. 19:00 h. Salon de actos. Publico: juvenil",
+]
+
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842
+MARGIN = 40
+
+# Posición de [día, texto] dentro de cada fila según el número de columnas
+LAYOUTS = {
+    2: [(0, 1)],
+    4: [(0, 1), (2, 3)],
+    5: [(0, 1), (3, 4)],
+    6: [(0, 1), (3, 4)],
+}
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _page_content(rows: list[list[str]], columns: int) -> bytes:
+    width = PAGE_WIDTH - 2 * MARGIN
+    row_height = 24
+    top = PAGE_HEIGHT - MARGIN
+    bottom = top - row_height * len(rows)
+    col_width = width / columns
+    font_size = 7 if columns > 2 else 8
+
+    ops = ["0.5 w"]
+    # Líneas horizontales y verticales de la tabla
+    for i in range(len(rows) + 1):
+        y = top - i * row_height
+        ops.append(f"{MARGIN} {y} m {MARGIN + width} {y} l S")
+    for j in range(columns + 1):
+        x = MARGIN + j * col_width
+        ops.append(f"{x:.2f} {top} m {x:.2f} {bottom} l S")
+
+    # Texto de cada celda (truncado para que quepa en una línea)
+    max_chars = int(col_width / (font_size * 0.5))
+    for i, row in enumerate(rows):
+        y = top - i * row_height - row_height / 2 - font_size / 3
+        for j, cell in enumerate(row):
+            if not cell:
+                continue
+            x = MARGIN + j * col_width + 3
+            ops.append(f"BT /F1 {font_size} Tf {x:.2f} {y:.2f} Td ({_escape(cell[:max_chars])}) Tj ET")
+
+    return "\n".join(ops).encode("cp1252")
+
+
+def agenda_rows(columns: int, n_rows: int, first_day: int = 1) -> list[list[str]]:
+    """Filas de tabla con el layout de `columns` columnas"""
+    rows = []
+    day = first_day
+    for i in range(n_rows):
+        row = [""] * columns
+        for day_col, text_col in LAYOUTS[columns]:
+            row[day_col] = f"{DAY_NAMES[(day - 1) % 7]} {(day - 1) % 28 + 1}"
+            row[text_col] = ACTIVITIES[(day - 1) % len(ACTIVITIES)]
+            day += 1
+        rows.append(row)
+    return rows
+
+
+def write_agenda_pdf(
+    path: Path, *, pages: int = 4, columns: int = 2, rows_per_page: int = 12, first_day: int = 1
+) -> Path:
+    """
+    Escribe un PDF de `pages` páginas con una tabla de agenda por página.
+
+    `first_day` desplaza los días (y las actividades) para generar PDFs
+    distintos con el mismo layout.
+    """
+    if columns not in LAYOUTS:
+        raise ValueError(f"Layout no soportado: {columns} columnas. Opciones: {sorted(LAYOUTS)}")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Pages, se rellena al final
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    page_ids = []
+    per_page_days = rows_per_page * len(LAYOUTS[columns])
+    for p in range(pages):
+        content = _page_content(agenda_rows(columns, rows_per_page, first_day + p * per_page_days), columns)
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % (PAGE_WIDTH, PAGE_HEIGHT, content_id)
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{i} 0 R" for i in page_ids).encode()
+    objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % pages
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % i + obj + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for off in offsets:
+        out += b"%010d 00000 n \n" % off
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(bytes(out))
+    return path
@@ -1,4 +1,5 @@
 import json
+import threading
 from pathlib import Path
 
 from src.orchestrator.main import run_orchestrator
@@ -83,3 +84,184 @@ def test_orchestrator_basic(tmp_path):
     assert isinstance(activities["gamonal_norte"], list)
     assert len(activities["gamonal_norte"]) == 1
 
+
+
+# Los parse_raw de test_orchestrator_parallel_jobs esperan aquí a que estén todos en vuelo
+_parse_barrier = None
+
+def concurrent_parse_raw(raw, *, month, civico=""):
+    _parse_barrier.wait()
+    return [dict(fake_parse_raw(raw, month=month)[0], nombre=f"Yoga {civico}")]
+
+def failing_extract_raw(pdf_path):
+    raise RuntimeError("PDF corrupto")
+
+def test_orchestrator_parallel_jobs(tmp_path):
+    """Con jobs>1 los cívicos se procesan a la vez y un único escritor guarda todo"""
+    month = "202512"
+    data_dir = tmp_path / month
+    data_dir.mkdir(parents=True)
+    civicos = ["gamonal_norte", "capiscol", "huelgas", "rio_vena"]
+    links = {
+        "meta": {"month": month},
+        "links": [
+            {"civico_id": c, "title": c, "url": f"file:///{c}.pdf", "filename": c, "is_new": True}
+            for c in civicos
+        ],
+    }
+    (data_dir / "links.json").write_text(json.dumps(links), encoding="utf-8")
+    parsers = {c: {"extract_raw": fake_extract_raw, "parse_raw": concurrent_parse_raw} for c in civicos}
+    parsers["rio_vena"] = {"extract_raw": failing_extract_raw, "parse_raw": concurrent_parse_raw}
+    # Los 3 parseos correctos solo pasan la barrera si se ejecutan a la vez (si no, se rompe
+    # por timeout y esos cívicos acaban con error)
+    global _parse_barrier
+    _parse_barrier = threading.Barrier(3, timeout=10)
+
+    activities = run_orchestrator(
+        month,
+        base_data_path=tmp_path,
+        download_fn=fake_download,
+        parsers=parsers,
+        jobs=4,
+    )
+
+    assert sorted(activities) == ["capiscol", "gamonal_norte", "huelgas"]
+    assert activities["capiscol"][0]["nombre"] == "Yoga capiscol"
+
+    saved = json.loads((data_dir / "actividades.json").read_text(encoding="utf-8"))
+    assert saved == activities
+    saved_links = json.loads((data_dir / "links.json").read_text(encoding="utf-8"))["links"]
+    assert {l["civico_id"]: l["is_new"] for l in saved_links} == {
+        "gamonal_norte": False, "capiscol": False, "huelgas": False, "rio_vena": True,
+    }
+
+
+def _write_links(data_dir, civicos):
+    links = {
+        "meta": {"month": data_dir.name},
+        "links": [
+            {"civico_id": c, "title": c, "url": f"file:///{c}.pdf", "filename": c, "is_new": True}
+            for c in civicos
+        ],
+    }
+    (data_dir / "links.json").write_text(json.dumps(links), encoding="utf-8")
+
+
+def test_orchestrator_shards_merge_once_at_end(tmp_path, monkeypatch):
+    """Con shards=True cada cívico va a actividades/<civico>.json y al final se fusiona"""
+    month = "202512"
+    data_dir = tmp_path / month
+    data_dir.mkdir(parents=True)
+    civicos = ["gamonal_norte", "capiscol"]
+    _write_links(data_dir, civicos)
+    (data_dir / "actividades.json").write_text(json.dumps({"huelgas": []}), encoding="utf-8")
+    parsers = {c: {"extract_raw": fake_extract_raw, "parse_raw": fake_parse_raw} for c in civicos}
+
+    from src.orchestrator import storage
+    saved_shards = []
+    original_save = storage.MonthStorage.save_civico
+
+    def spy_save(self, civico_id, all_activities):
+        path = original_save(self, civico_id, all_activities)
+        saved_shards.append(path.relative_to(data_dir).as_posix())
+        assert not (data_dir / "actividades.json").read_text(encoding="utf-8").count("Yoga")
+        return path
+
+    monkeypatch.setattr(storage.MonthStorage, "save_civico", spy_save)
+    activities = run_orchestrator(
+        month, base_data_path=tmp_path, download_fn=fake_download, parsers=parsers, shards=True
+    )
+
+    assert saved_shards == ["actividades/gamonal_norte.json", "actividades/capiscol.json"]
+    saved = json.loads((data_dir / "actividades.json").read_text(encoding="utf-8"))
+    assert saved == activities
+    assert sorted(saved) == ["capiscol", "gamonal_norte", "huelgas"]
+    assert not (data_dir / "actividades").exists()
+    assert not list(data_dir.glob(".*.tmp"))
+
+
+def test_orchestrator_recovers_pending_shards(tmp_path):
+    """Shards de una ejecución interrumpida se incorporan a actividades.json"""
+    month = "202512"
+    data_dir = tmp_path / month
+    (data_dir / "actividades").mkdir(parents=True)
+    _write_links(data_dir, [])
+    (data_dir / "actividades.json").write_text(json.dumps({"huelgas": []}), encoding="utf-8")
+    shard = fake_parse_raw([], month=month)
+    (data_dir / "actividades" / "capiscol.json").write_text(json.dumps(shard), encoding="utf-8")
+
+    activities = run_orchestrator(month, base_data_path=tmp_path, download_fn=fake_download, parsers={})
+
+    assert activities == {"huelgas": [], "capiscol": shard}
+    assert json.loads((data_dir / "actividades.json").read_text(encoding="utf-8")) == activities
+    assert not (data_dir / "actividades").exists()
+
+
+def test_orchestrator_writes_run_report(tmp_path):
+    """Cada etapa queda medida por cívico en run_report.json (y en la traza con trace=True)"""
+    month = "202512"
+    data_dir = tmp_path / month
+    data_dir.mkdir(parents=True)
+    _write_links(data_dir, ["gamonal_norte", "rio_vena"])
+    parsers = {
+        "gamonal_norte": {"extract_raw": fake_extract_raw, "parse_raw": fake_parse_raw},
+        "rio_vena": {"extract_raw": failing_extract_raw, "parse_raw": fake_parse_raw},
+    }
+
+    run_orchestrator(month, base_data_path=tmp_path, download_fn=fake_download, parsers=parsers, trace=True)
+
+    report = json.loads((data_dir / "run_report.json").read_text(encoding="utf-8"))
+    gamonal = report["civicos"]["gamonal_norte"]
+    assert {"download", "extract", "save_raw", "parse", "validate", "save", "save_links"} <= set(gamonal)
+    assert gamonal["extract"]["rows"] == 1
+    assert gamonal["parse"]["activities"] == 1
+    assert gamonal["save"]["bytes"] == (data_dir / "actividades.json").stat().st_size
+    assert report["civicos"]["rio_vena"]["extract"]["errors"] == 1
+    assert report["stages"]["download"]["count"] == 2
+
+    trace = json.loads((data_dir / "run_trace.json").read_text(encoding="utf-8"))
+    assert {e["name"] for e in trace["traceEvents"] if e["ph"] == "X"} >= {"parse gamonal_norte", "finalize"}
+
+
+def counting_extract_raw(pdf_path):
+    from src.utils import metrics
+
+    metrics.counter("test_extract_calls_total", "extract_raw en el worker").inc()
+    return fake_extract_raw(pdf_path)
+
+
+def test_orchestrator_metrics_include_pool_workers(tmp_path):
+    """Con jobs>1 las métricas de los procesos de extracción se suman en el principal"""
+    from src.utils import metrics
+
+    month = "202512"
+    data_dir = tmp_path / month
+    data_dir.mkdir(parents=True)
+    _write_links(data_dir, ["gamonal_norte", "capiscol"])
+    parsers = {c: {"extract_raw": counting_extract_raw, "parse_raw": fake_parse_raw} for c in ("gamonal_norte", "capiscol")}
+    calls = metrics.counter("test_extract_calls_total", "extract_raw en el worker")
+    calls.reset()
+
+    run_orchestrator(month, base_data_path=tmp_path, download_fn=fake_download, parsers=parsers, jobs=2)
+
+    assert calls.snapshot() == [[[], 2]]
+    text = metrics.REGISTRY.render()
+    assert 'burgos_civicos_activities{month="202512",civico="capiscol"} 1' in text
+    assert 'burgos_civicos_civicos_failed{month="202512"} 0' in text
+
+
+def test_orchestrator_accepts_download_paths_not_on_disk(tmp_path):
+    """Un download_fn inyectado puede devolver una ruta que el extract_raw resuelve por su cuenta"""
+    month = "202512"
+    data_dir = tmp_path / month
+    data_dir.mkdir(parents=True)
+    _write_links(data_dir, ["gamonal_norte"])
+
+    activities = run_orchestrator(
+        month, base_data_path=tmp_path, download_fn=lambda url, output_dir: output_dir / "pendiente.pdf",
+        parsers=fake_parsers,
+    )
+
+    assert len(activities["gamonal_norte"]) == 1
+    report = json.loads((data_dir / "run_report.json").read_text(encoding="utf-8"))
+    assert report["civicos"]["gamonal_norte"]["extract"]["pdf_bytes"] == 0
@@ -0,0 +1,109 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.parser.common import camelot_extract
+from src.parser.common.camelot_extract import read_pdf_tables, split_pages
+from src.parser.common.table_cache import TableCache
+from src.parser.gamonal_norte.process_pdf import process_pdf_gamonal
+from tests.fixtures.synthetic_pdf import write_agenda_pdf
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture(autouse=True)
+def table_cache(tmp_path, monkeypatch):
+    """Caché de tablas aislada en un directorio temporal"""
+    cache = TableCache(tmp_path / "camelot-cache")
+    monkeypatch.setattr(camelot_extract, "_table_cache", cache)
+    monkeypatch.setattr(camelot_extract, "_table_cache_enabled", True)
+    return cache
+
+
+@pytest.fixture
+def count_extractions(monkeypatch):
+    calls = []
+    original = camelot_extract._extract_pages
+
+    def counting(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(camelot_extract, "_extract_pages", counting)
+    return calls
+
+
+def test_split_pages_contiguous_and_balanced():
+    assert split_pages([1, 2, 3, 4, 5], 2) == ["1,2,3", "4,5"]
+    assert split_pages([1, 2], 4) == ["1", "2"]
+    assert split_pages([2, 5, 7], 1) == ["2,5,7"]
+
+
+def test_read_pdf_tables_parallel_matches_serial(tmp_path):
+    pdf_path = write_agenda_pdf(tmp_path / "agenda.pdf", pages=3, columns=5, rows_per_page=4)
+
+    camelot_extract.configure_table_cache(enabled=False)
+    serial = read_pdf_tables(pdf_path, workers=1)
+    parallel = read_pdf_tables(pdf_path, workers=3)
+
+    assert [t.page for t in parallel] == [1, 2, 3]
+    assert [t.df.values.tolist() for t in parallel] == [t.df.values.tolist() for t in serial]
+    assert parallel[0].shape == (4, 5)
+
+
+def test_process_pdf_uses_page_parallel_tables(tmp_path):
+    pdf_path = write_agenda_pdf(tmp_path / "agenda.pdf", pages=2, columns=2, rows_per_page=3)
+
+    rows = process_pdf_gamonal(pdf_path)
+
+    assert [row[0] for row in rows] == ["LUNES 1", "MARTES 2", "MIERCOLES 3", "JUEVES 4", "VIERNES 5", "SABADO 6"]
+
+
+def test_table_cache_skips_camelot_for_unchanged_pdf(tmp_path, count_extractions):
+    pdf_path = write_agenda_pdf(tmp_path / "agenda.pdf", pages=2, columns=4, rows_per_page=3)
+
+    first = read_pdf_tables(pdf_path, workers=1)
+    second = read_pdf_tables(pdf_path, workers=1)
+
+    assert len(count_extractions) == 1
+    assert [t.df.values.tolist() for t in second] == [t.df.values.tolist() for t in first]
+    assert [t.page for t in second] == [1, 2]
+    assert second[0].accuracy == pytest.approx(first[0].accuracy)
+
+
+def test_table_cache_invalidated_by_options_version_and_content(tmp_path, monkeypatch, count_extractions):
+    pdf_path = write_agenda_pdf(tmp_path / "agenda.pdf", pages=1, columns=2, rows_per_page=3)
+
+    read_pdf_tables(pdf_path, workers=1)
+    read_pdf_tables(pdf_path, workers=1, flavor="stream")
+    read_pdf_tables(pdf_path, workers=1, line_scale=40)
+    assert len(count_extractions) == 3
+
+    monkeypatch.setattr(camelot_extract, "camelot_version", lambda: "0.0.0-test")
+    read_pdf_tables(pdf_path, workers=1)
+    assert len(count_extractions) == 4
+
+    write_agenda_pdf(pdf_path, pages=1, columns=2, rows_per_page=4)
+    tables = read_pdf_tables(pdf_path, workers=1)
+    assert len(count_extractions) == 5
+    assert tables[0].shape == (4, 2)
+
+
+def test_table_cache_hit_does_not_import_camelot(tmp_path, table_cache):
+    pdf_path = write_agenda_pdf(tmp_path / "agenda.pdf", pages=1, columns=2, rows_per_page=3)
+    read_pdf_tables(pdf_path, workers=1)
+
+    script = (
+        "import sys\n"
+        "from src.parser.common.camelot_extract import configure_table_cache, read_pdf_tables\n"
+        f"configure_table_cache(True, {str(table_cache.cache_dir)!r})\n"
+        f"tables = read_pdf_tables({str(pdf_path)!r}, workers=1)\n"
+        "print(len(tables), 'camelot' in sys.modules, 'pandas' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split() == ["1", "False", "False"]
@@ -0,0 +1,175 @@
+"""
+Tests del parser IA contra un servidor Ollama falso local.
+"""
+
+import json
+import time
+
+import pytest
+
+from src.parser import ai_parser
+from src.parser.llm_cache import LLM_CACHE_DIR
+from src.utils import timing
+from tests.fixtures.fake_ollama import FakeOllamaServer, echo_activities, echo_responder
+
+RAW_ROWS = [[f"LUNES {d}", f"Actividad del día {d}. Sala. Público: adultos"] for d in range(1, 9)]
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch):
+    # monkeypatch restaura al terminar la caché que hubiera (no la de por defecto)
+    monkeypatch.setattr(ai_parser, "_llm_cache_enabled", False)
+    monkeypatch.setattr(ai_parser, "_llm_cache", None)
+    with FakeOllamaServer(delay=0.2) as server:
+        monkeypatch.setattr(ai_parser, "_client", ai_parser.OllamaClient(server.url))
+        yield server
+
+
+def test_parse_raw_ai_concurrent_bounded(fake_ollama):
+    """Con max_workers=4 nunca hay más de 4 peticiones en vuelo"""
+    activities = ai_parser.parse_raw_ai(RAW_ROWS, month="202602", max_workers=4)
+
+    assert fake_ollama.max_in_flight == 4
+    assert len(fake_ollama.prompts) == len(RAW_ROWS)
+    assert len(activities) == len(RAW_ROWS)
+
+
+def test_parse_raw_ai_concurrent_matches_sequential(fake_ollama):
+    """El modo concurrente devuelve lo mismo que el secuencial, ordenado por fecha"""
+    fake_ollama.delay = 0.01
+    sequential = ai_parser.parse_raw_ai(RAW_ROWS, month="202602", max_workers=1)
+    concurrent = ai_parser.parse_raw_ai(RAW_ROWS, month="202602", max_workers=8)
+
+    assert concurrent == sequential
+    assert [a["fecha"] for a in concurrent] == [f"{d:02d}/02/2026" for d in range(1, 9)]
+
+
+def test_llm_cache_hit_skips_ollama(fake_ollama, tmp_path):
+    """Un segundo parseo idéntico se sirve desde la caché en disco"""
+    fake_ollama.delay = 0
+    ai_parser.configure_llm_cache(enabled=True, cache_dir=tmp_path / "llm")
+
+    first = ai_parser.parse_raw_ai(RAW_ROWS, month="202602")
+    second = ai_parser.parse_raw_ai(RAW_ROWS, month="202602")
+
+    assert second == first
+    assert len(fake_ollama.prompts) == len(RAW_ROWS)
+
+
+
+def test_configure_llm_cache_keeps_limits_with_default_dir(monkeypatch):
+    monkeypatch.setattr(ai_parser, "_llm_cache_enabled", ai_parser._llm_cache_enabled)
+    monkeypatch.setattr(ai_parser, "_llm_cache", ai_parser._llm_cache)
+
+    ai_parser.configure_llm_cache(True, max_bytes=1024, max_age_seconds=60)
+
+    cache = ai_parser.get_llm_cache()
+    assert cache.cache_dir == LLM_CACHE_DIR
+    assert (cache.max_bytes, cache.max_age_seconds) == (1024, 60)
+
+
+def test_llm_cache_disabled_always_calls_ollama(fake_ollama):
+    fake_ollama.delay = 0
+    ai_parser.parse_raw_ai(RAW_ROWS[:2], month="202602")
+    ai_parser.parse_raw_ai(RAW_ROWS[:2], month="202602")
+
+    assert len(fake_ollama.prompts) == 4
+
+
+def test_parse_raw_ai_batched_matches_single(fake_ollama):
+    """Con batch_size=4 se hacen 2 peticiones y el resultado es el mismo"""
+    fake_ollama.delay = 0
+    single = ai_parser.parse_raw_ai(RAW_ROWS, month="202602", batch_size=1)
+    fake_ollama.prompts.clear()
+
+    batched = ai_parser.parse_raw_ai(RAW_ROWS, month="202602", batch_size=4)
+
+    assert batched == single
+    assert len(fake_ollama.prompts) == 2
+
+
+def test_parse_batch_falls_back_for_invalid_rows(fake_ollama):
+    """Una fila con sub-resultado inválido se reintenta con el prompt individual"""
+    fake_ollama.delay = 0
+
+    def responder(prompt):
+        if "Filas:" in prompt:
+            return json.dumps({"r0": [{"nombre": "", "fecha": "01/02/2026",
+                                       "requiere_inscripcion": True, "publico": "adultos"}],
+                               "r1": echo_activities("2", ("02", "2026"), "Bien")})
+        return echo_responder(prompt)
+
+    fake_ollama.responder = responder
+    results = ai_parser.parse_batch_with_ai([("1", "Mal"), ("2", "Bien")], month_year="202602")
+
+    assert [r[0]["nombre"] for r in results] == ["Mal", "Bien"]
+    assert len(fake_ollama.prompts) == 2
+    assert "Filas:" not in fake_ollama.prompts[1]
+
+
+def test_pack_batches_respects_size_and_char_budget():
+    cells = [("1", "a" * 10), ("2", "b" * 10), ("3", "c" * 50), ("4", "d" * 10)]
+
+    assert [len(b) for b in ai_parser._pack_batches(cells, 2, 1000)] == [2, 2]
+    assert [len(b) for b in ai_parser._pack_batches(cells, 8, 30)] == [2, 1, 1]
+
+
+def test_json_array_stream_yields_objects_as_they_close():
+    stream = ai_parser.JsonArrayStream()
+
+    assert stream.feed('Claro: [{"nombre": "a {x}", "p": ') == []
+    assert stream.feed('"b\\"]"}, {"nombre"') == ['{"nombre": "a {x}", "p": "b\\"]"}']
+    assert stream.feed(': "c"}] y más texto [') == ['{"nombre": "c"}']
+    assert stream.closed
+
+
+def test_streaming_cuts_generation_after_array_closes(fake_ollama):
+    """Con stream=True se deja de leer en cuanto se cierra el array JSON"""
+    fake_ollama.delay = 0
+    fake_ollama.stream_chunk_delay = 0.005
+    fake_ollama.responder = lambda prompt: echo_responder(prompt) + " Espero que te sirva." * 40
+
+    activities = ai_parser.parse_activity_with_ai("3", "Taller de radio", "202602", stream=True)
+
+    assert [a["nombre"] for a in activities] == ["Taller de radio"]
+    assert activities[0]["fecha"] == "03/02/2026"
+    time.sleep(0.1)
+    assert fake_ollama.streams_aborted == 1
+    full_chunks = len(fake_ollama.responder(fake_ollama.prompts[0])) // fake_ollama.stream_chunk_size
+    assert fake_ollama.chunks_sent < full_chunks / 2
+
+
+
+def _requests_total(result):
+    return sum(value for (model, r), value in ai_parser.LLM_REQUESTS.snapshot() if r == result)
+
+
+def test_streamed_requests_count_in_run_report_and_metrics(fake_ollama, monkeypatch):
+    """Las peticiones cortadas al cerrarse el array cuentan como llamadas, no como caché"""
+    fake_ollama.delay = 0
+    fake_ollama.responder = lambda prompt: echo_responder(prompt) + " Espero que te sirva." * 40
+    monkeypatch.setattr(ai_parser, "OLLAMA_STREAM", True)
+    cutoff_before, ok_before = _requests_total("cutoff"), _requests_total("ok")
+    report = timing.RunReport("202602")
+
+    with timing.activate(report):
+        activities = ai_parser.parse_raw_ai(RAW_ROWS[:4], month="202602", max_workers=2)
+
+    assert len(activities) == 4
+    llm = report.to_dict()["llm"]
+    assert (llm["calls"], llm["cached"]) == (4, 0)
+    assert llm["p50"] is not None
+    assert _requests_total("cutoff") - cutoff_before == 4
+    assert _requests_total("ok") == ok_before
+
+
+def test_client_reuses_connections_and_caches_health(fake_ollama):
+    """Las peticiones secuenciales comparten una conexión y /api/tags se consulta una vez"""
+    fake_ollama.delay = 0
+    ai_parser.parse_raw_ai(RAW_ROWS, month="202602", max_workers=1)
+    ai_parser.parse_raw_ai(RAW_ROWS, month="202602", max_workers=1)
+
+    assert fake_ollama.tags_requests == 1
+    assert fake_ollama.connections == 1
+    assert ai_parser.check_ollama_health(force=True)
+    assert fake_ollama.tags_requests == 2
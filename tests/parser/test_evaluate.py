@@ -0,0 +1,132 @@
+import json
+
+import pytest
+
+from src.parser import ai_parser
+from src.parser.evaluate import configure_llm, evaluate, field_scores, format_results
+from src.utils import warning_logger
+from src.utils.warning_logger import close_warning_loggers, configure_warning_logger
+from tests.fixtures.fake_ollama import FakeOllamaServer
+
+MONTH = "202601"
+REGEX = "src.parser.gamonal_norte.parse_raw:parse_raw_gamonal"
+
+
+@pytest.fixture(autouse=True)
+def warnings_dir(tmp_path):
+    """Los warnings del parser van a tmp_path, no a docs/data/<mes>/warnings.log"""
+    previous = warning_logger._base_dir
+    configure_warning_logger(tmp_path)
+    yield tmp_path
+    close_warning_loggers()
+    configure_warning_logger(previous)
+
+
+def _activity(**fields):
+    base = {
+        "nombre": "Taller", "descripcion": None, "fecha": "05/01/2026", "fecha_fin": None,
+        "hora": "18:00", "hora_fin": None, "requiere_inscripcion": False, "lugar": "Sala 2",
+        "publico": "adultos", "edad_minima": None, "edad_maxima": None, "precio": None,
+    }
+    return {**base, **fields}
+
+
+@pytest.fixture
+def verified_month(tmp_path):
+    month_dir = tmp_path / MONTH
+    month_dir.mkdir()
+    expected = {
+        "gamonal_norte": [
+            _activity(nombre="Taller de cerámica", requiere_inscripcion=True),
+            _activity(nombre="Cuentacuentos", fecha="06/01/2026", hora="17:30", lugar="Biblioteca",
+                      publico="infantil de 4 a 8 años", edad_minima=4, edad_maxima=8),
+            _activity(nombre="Cine fórum", fecha="07/01/2026", hora="19:00", lugar="Salón de actos",
+                      publico="juvenil"),
+        ],
+    }
+    raw = [
+        ["LUNES 5", "(*) Taller de cerámica. 18:00 h. Sala 2. Público: adultos"],
+        ["MARTES 6", "Cuentacuentos. 17:30 h. Biblioteca. Público: infantil de 4 a 8 años"],
+        ["MIERCOLES 7", "Cine fórum. 19h. Público: juvenil"],
+    ]
+    (month_dir / "actividades.json").write_text(json.dumps(expected), encoding="utf-8")
+    (month_dir / "actividades_raw_gamonal_norte.json").write_text(json.dumps(raw), encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def llm_state(monkeypatch):
+    """Cliente y caché LLM que el test cambie se restauran al terminar"""
+    monkeypatch.setattr(ai_parser, "_client", None)
+    monkeypatch.setattr(ai_parser, "_llm_cache_enabled", ai_parser._llm_cache_enabled)
+    monkeypatch.setattr(ai_parser, "_llm_cache", ai_parser._llm_cache)
+    return monkeypatch
+
+
+def test_field_scores_precision_and_recall():
+    expected = [_activity(nombre="Yoga"), _activity(nombre="Pilates", hora="10:00")]
+    predicted = [
+        _activity(nombre="YOGA ", lugar="sala 2"),           # mismo lugar sin mayúsculas
+        _activity(nombre="Pilates", hora="11:00", precio=3),  # hora mal y precio de más
+        _activity(nombre="Ajedrez"),                          # sin pareja
+    ]
+
+    scores = field_scores(predicted, expected)
+
+    assert scores["activities"]["precision"] == pytest.approx(2 / 3)
+    assert scores["activities"]["recall"] == 1.0
+    assert scores["fields"]["hora"]["tp"] == 1
+    assert scores["fields"]["lugar"]["recall"] == 1.0
+    assert scores["fields"]["precio"] == {"tp": 0, "predicted": 1, "expected": 0, "precision": 0.0, "recall": None}
+
+
+def test_evaluate_replays_raw_rows(verified_month):
+    results = evaluate(verified_month, [MONTH], parsers=[REGEX])
+
+    (result,) = results
+    assert (result["parser"], result["civico"], result["rows"]) == (REGEX, "gamonal_norte", 3)
+    assert result["activities"]["recall"] == 1.0
+    assert result["fields"]["edad_minima"]["recall"] == 1.0
+    # "Cine fórum. 19h." sin lugar: el regex no lo detecta
+    assert result["fields"]["lugar"]["recall"] == pytest.approx(2 / 3)
+    assert result["rows_per_second"] > 0
+    assert result["p50_ms"] <= result["p95_ms"]
+    assert "gamonal_norte" in format_results(results)
+
+
+def _record(verified_month, rows):
+    """Graba en un cassette las respuestas de un Ollama falso a parse_raw_ai(rows)"""
+    cassette = verified_month / "llm"
+    ai_parser.configure_llm_cache(enabled=True, cache_dir=cassette)
+    with FakeOllamaServer() as server:
+        ai_parser.configure_client(base_url=server.url)
+        recorded = ai_parser.parse_raw_ai(rows, month=MONTH)
+    return cassette, recorded
+
+
+def test_cassette_replays_recorded_llm_responses(verified_month, llm_state):
+    rows = json.loads((verified_month / MONTH / "actividades_raw_gamonal_norte.json").read_text())
+    cassette, recorded = _record(verified_month, rows[:2])
+
+    # Reproducir sin servidor: lo no grabado se queda sin actividades
+    assert configure_llm(cassette=cassette) is False
+    results = evaluate(verified_month, [MONTH], parsers=["ai"])
+
+    assert len(recorded) == 2
+    assert results[0]["activities"]["predicted"] == 2
+
+
+def test_cassette_recorded_in_batches_replays_per_civico(verified_month, llm_state):
+    llm_state.setattr(ai_parser, "OLLAMA_BATCH_SIZE", 4)
+    rows = json.loads((verified_month / MONTH / "actividades_raw_gamonal_norte.json").read_text())
+    cassette, recorded = _record(verified_month, rows)
+
+    batched = configure_llm(cassette=cassette)
+    row_by_row = evaluate(verified_month, [MONTH], parsers=["ai"])
+    per_civico = evaluate(verified_month, [MONTH], parsers=["ai"], batched=batched)
+
+    assert batched is True
+    # Fila a fila los prompts no son los del lote grabado: ninguno está en el cassette
+    assert row_by_row[0]["activities"]["predicted"] == 0
+    assert per_civico[0]["activities"]["predicted"] == len(recorded) == 3
+    assert per_civico[0]["p50_ms"] is None
@@ -0,0 +1,102 @@
+import pytest
+
+from src.parser import hybrid
+from src.parser.gamonal_norte.parse_activities import parse_cell_gamonal
+from src.parser.gamonal_norte.parse_raw import parse_raw_gamonal_hybrid
+from src.parser.hybrid import parse_raw_hybrid, routing_report, score_activity, score_cell
+from src.utils import warning_logger
+from src.utils.warning_logger import close_warning_loggers, configure_warning_logger
+
+MONTH = "202601"
+
+CLEAR = ["LUNES 5", "(*) Taller de cerámica. 18:00 h. Sala 2. Público: adultos"]
+TWO_CLEAR = [
+    "MARTES 6",
+    "(*) Café tertulia. 10-12h. Biblioteca. Público: adultos\n(*) Yoga. 9h. Sala 1. Público: adultos",
+]
+NO_PLACE = ["MIERCOLES 7", "Cuentacuentos 17:30 h Público: infantil"]
+GARBAGE = ["JUEVES 8", "Programación sujeta a cambios"]
+BAD_DAY = ["SIN DIA", "Cine fórum. 19:00 h. Salón de actos. Público: juvenil"]
+
+
+@pytest.fixture(autouse=True)
+def warnings_dir(tmp_path):
+    """Los warnings del parser van a tmp_path, no a docs/data/<mes>/warnings.log"""
+    previous = warning_logger._base_dir
+    configure_warning_logger(tmp_path)
+    yield tmp_path
+    close_warning_loggers()
+    configure_warning_logger(previous)
+
+
+class FakeLLM:
+    """parse_raw_ai falso: una actividad por celda recibida"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, rows, *, month, civico="", **kwargs):
+        self.calls.append(rows)
+        return [
+            {
+                "nombre": f"LLM {text[:10]}", "descripcion": None, "fecha": "31/01/2026", "fecha_fin": None,
+                "hora": None, "hora_fin": None, "requiere_inscripcion": False, "lugar": None,
+                "publico": "adultos", "edad_minima": None, "edad_maxima": None, "precio": None,
+            }
+            for _, text in rows
+        ]
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    hybrid.reset_routing_stats()
+    yield
+    hybrid.reset_routing_stats()
+
+
+def test_score_activity_penalizes_missing_and_invalid_fields():
+    (activity, issues), = parse_cell_gamonal(*CLEAR, month=MONTH)
+    assert issues == []
+    assert score_activity(activity, issues) == 1.0
+
+    assert score_activity({**activity, "hora": "9:00"}) == 0.0  # no cumple el schema
+    assert score_activity({**activity, "hora": "25:00"}) < 1.0
+    assert score_activity({**activity, "hora": "20:00", "hora_fin": "19:00"}) < 1.0
+    assert score_activity({**activity, "lugar": None}, ["Lugar no detectado"]) < hybrid.HYBRID_MIN_CONFIDENCE
+    assert score_cell([]) == 0.0
+    assert score_cell([(None, ["Fecha inválida"])]) == 0.0
+
+
+def test_confident_cells_bypass_the_llm():
+    llm = FakeLLM()
+    raw = [GARBAGE, CLEAR, NO_PLACE, TWO_CLEAR, BAD_DAY]
+
+    activities = parse_raw_hybrid(raw, month=MONTH, parse_cell=parse_cell_gamonal, llm_parse_raw=llm)
+
+    assert llm.calls == [[GARBAGE, NO_PLACE, BAD_DAY]]
+    names = [a["nombre"] for a in activities]
+    assert names[:3] == ["Taller de cerámica", "Yoga", "Café tertulia"]  # ordenadas por fecha y hora
+    assert len(names) == 6
+
+    report = routing_report(MONTH)
+    assert (report["cells"], report["rule_cells"], report["llm_cells"]) == (5, 2, 3)
+    assert report["bypass_fraction"] == pytest.approx(0.4)
+    assert report["saved_seconds"] is not None
+
+
+def test_threshold_and_report_without_llm_cells():
+    llm = FakeLLM()
+    parse_raw_hybrid([CLEAR, NO_PLACE], month=MONTH, parse_cell=parse_cell_gamonal, llm_parse_raw=llm,
+                     min_confidence=0.5)
+
+    assert llm.calls == []
+    report = routing_report(MONTH)
+    assert report["bypass_fraction"] == 1.0
+    assert report["saved_seconds"] is None
+    assert routing_report("209901")["cells"] == 0
+
+
+def test_gamonal_plugin_uses_hybrid_parser():
+    from src.parser.registry import get_parser
+
+    assert get_parser("gamonal_norte")["parse_raw"] is parse_raw_gamonal_hybrid
@@ -0,0 +1,67 @@
+"""
+Guarda de tiempos de importación (python -X importtime).
+
+El registry y camelot_extract deben poder importarse sin cargar Camelot,
+pandas ni requests; esos módulos solo se importan al resolver un parser o
+al extraer tablas.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.parser import registry
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+HEAVY_MODULES = {"camelot", "pandas", "cv2", "pdfminer", "pypdf", "requests", "src.parser.ai_parser"}
+
+# Margen amplio: con imports perezosos el registry tarda ~1-2 ms (antes ~600 ms)
+IMPORT_BUDGET_MS = 100
+
+
+def _importtime(statement: str) -> dict:
+    """Ejecuta `statement` en un intérprete nuevo y devuelve {módulo: tiempo acumulado en µs}"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", ["src.parser.registry", "src.parser.common.camelot_extract"])
+def test_import_does_not_load_heavy_dependencies(module):
+    times = _importtime(f"import {module}")
+
+    assert not HEAVY_MODULES & set(times), sorted(HEAVY_MODULES & set(times))
+    assert times[module] / 1000 < IMPORT_BUDGET_MS, f"{module}: {times[module] / 1000:.1f} ms"
+
+
+def test_get_parser_resolves_on_first_use(monkeypatch):
+    calls = []
+    real_resolve = registry.resolve
+
+    def counting_resolve(entry_point):
+        calls.append(entry_point)
+        return real_resolve(entry_point)
+
+    monkeypatch.setattr(registry, "resolve", counting_resolve)
+    monkeypatch.setattr(registry, "_resolved", {})
+
+    first = registry.get_parser("capiscol")
+    second = registry.get_parser("capiscol")
+
+    assert first is second
+    assert calls == [
+        "src.parser.capiscol.extract_raw:extract_raw_capiscol",
+        "src.parser.ai_parser:parse_raw_ai",
+    ]
+    assert first["extract_raw"].__name__ == "extract_raw_capiscol"
@@ -0,0 +1,63 @@
+import os
+import time
+
+from src.parser.llm_cache import LLMCache, cache_key
+
+
+def test_cache_key_depends_on_model_prompt_and_temperature():
+    base = cache_key(model="mistral", prompt="p", temperature=0.2)
+
+    assert base == cache_key(model="mistral", prompt="p", temperature=0.2)
+    assert base != cache_key(model="llama2", prompt="p", temperature=0.2)
+    assert base != cache_key(model="mistral", prompt="p2", temperature=0.2)
+    assert base != cache_key(model="mistral", prompt="p", temperature=0.7)
+
+
+def test_put_get_roundtrip(tmp_path):
+    cache = LLMCache(tmp_path)
+    key = cache_key(model="mistral", prompt="p", temperature=0.2)
+    cache.put(key, model="mistral", raw_response="[]", activities=[{"nombre": "Yoga"}])
+
+    entry = cache.get(key)
+
+    assert entry["raw_response"] == "[]"
+    assert entry["activities"] == [{"nombre": "Yoga"}]
+    assert cache.get(cache_key(model="mistral", prompt="otro", temperature=0.2)) is None
+
+
+def test_expired_entry_is_discarded(tmp_path):
+    cache = LLMCache(tmp_path, max_age_seconds=60)
+    cache.put("ab" * 32, model="m", raw_response="[]", activities=[])
+    path = tmp_path / "ab" / f"{'ab' * 32}.json"
+    old = time.time() - 120
+    os.utime(path, (old, old))
+
+    assert cache.get("ab" * 32) is None
+    assert not path.exists()
+
+
+def test_evict_removes_least_recently_used_over_budget(tmp_path):
+    cache = LLMCache(tmp_path)
+    keys = [f"{i:02d}" * 32 for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, model="m", raw_response="x" * 100, activities=[])
+        path = tmp_path / key[:2] / f"{key}.json"
+        os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+    sizes = [(tmp_path / key[:2] / f"{key}.json").stat().st_size for key in keys]
+
+    cache.max_bytes = sizes[1] + sizes[2]
+    removed = cache.evict()
+
+    assert removed == 1
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_failed_put_leaves_no_temporary_file(tmp_path):
+    cache = LLMCache(tmp_path)
+    key = "cd" * 32
+
+    cache.put(key, model="m", raw_response="[]", activities=[{"nombre": object()}])
+
+    assert cache.get(key) is None
+    assert list(tmp_path.rglob("*")) == []
@@ -0,0 +1,136 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from src.parser import plugins
+from src.parser.plugins import (
+    DEFAULT_EXTRACT_RAW,
+    DEFAULT_PARSE_RAW,
+    ENTRY_POINT_GROUP,
+    discover_plugins,
+    normalize_plugin,
+)
+
+
+def third_party_extract(pdf_path):
+    return [["LUNES 1", "Actividad de prueba"]]
+
+
+# Plugin de terceros (al que apuntan los entry points falsos)
+THIRD_PARTY = {
+    "id": "fuentecillas",
+    "title": "Centro Cívico Fuentecillas",
+    "title_pattern": r"fuentecillas",
+    "extract_raw": third_party_extract,
+}
+# Solo declara flavor: usa el extractor genérico con ese flavor
+STREAM_ONLY = {
+    "id": "villimar",
+    "title_pattern": r"villimar",
+    "flavor": "stream",
+    "camelot_options": {"row_tol": 10},
+}
+DUPLICATE = {"id": "capiscol", "title_pattern": r"capiscol"}
+BROKEN = {"id": "roto", "title_pattern": r"(sin cerrar"}
+
+
+def _entry_point(name, attr):
+    return EntryPoint(name=name, value=f"{__name__}:{attr}", group=ENTRY_POINT_GROUP)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "parser_plugins.json"
+
+
+def test_builtin_plugins_are_read_without_importing(cache_path, monkeypatch):
+    monkeypatch.setattr(plugins, "_entry_points", lambda: [])
+    for module in [m for m in sys.modules if m.startswith("src.parser.capiscol")]:
+        monkeypatch.delitem(sys.modules, module)
+
+    found = discover_plugins(cache_path=cache_path, refresh=True)
+
+    assert set(found) == {
+        "gamonal_norte", "rio_vena", "vista_alegre", "capiscol", "san_agustin", "huelgas", "san_juan",
+    }
+    assert found["capiscol"]["flavor"] == "stream"
+    assert found["rio_vena"]["flavor"] == "lattice"
+    assert found["huelgas"]["title_pattern"] == r"huelgas|el\s+pilar"
+    assert found["gamonal_norte"]["extract_raw"] == "src.parser.gamonal_norte.extract_raw:extract_raw_gamonal"
+    assert "src.parser.capiscol" not in sys.modules
+
+
+def test_cache_is_reused_while_fingerprint_matches(cache_path, monkeypatch):
+    monkeypatch.setattr(plugins, "_entry_points", lambda: [])
+    first = discover_plugins(cache_path=cache_path)
+    assert json.loads(cache_path.read_text())["plugins"] == first
+
+    def fail():
+        raise AssertionError("no debería reescanear")
+
+    monkeypatch.setattr(plugins, "scan_plugins", fail)
+    assert discover_plugins(cache_path=cache_path) == first
+
+    monkeypatch.setattr(plugins, "fingerprint", lambda: {"builtin": {}, "site_packages": {"/nuevo": [1, 1]}})
+    with pytest.raises(AssertionError, match="reescanear"):
+        discover_plugins(cache_path=cache_path)
+
+
+def test_entry_point_plugins(cache_path, monkeypatch):
+    monkeypatch.setattr(plugins, "_entry_points", lambda: [
+        _entry_point("fuentecillas", "THIRD_PARTY"),
+        _entry_point("capiscol_bis", "DUPLICATE"),
+        _entry_point("roto", "BROKEN"),
+    ])
+
+    found = discover_plugins(cache_path=cache_path, refresh=True)
+
+    plugin = found["fuentecillas"]
+    assert plugin["extract_raw"] == f"{__name__}:third_party_extract"
+    assert plugin["parse_raw"] == DEFAULT_PARSE_RAW
+    assert plugin["flavor"] == "lattice"
+    assert plugin["source"] == f"fuentecillas = {__name__}:THIRD_PARTY"
+    # El cívico ya declarado en src/parser no se sobrescribe; el roto se ignora
+    assert found["capiscol"]["source"] == "src.parser.capiscol"
+    assert "roto" not in found
+
+
+def test_normalize_plugin_defaults_and_validation():
+    plugin = normalize_plugin({"id": "nuevo", "title_pattern": r"nuevo"}, "prueba")
+    assert plugin["extract_raw"] == DEFAULT_EXTRACT_RAW
+    assert plugin["title"] == "nuevo"
+
+    with pytest.raises(ValueError, match="title_pattern"):
+        normalize_plugin({"id": "nuevo"}, "prueba")
+
+
+def test_generic_extractor_uses_the_plugin_flavor(cache_path, monkeypatch):
+    from src.parser import registry
+    from src.parser.generic import extract_raw
+
+    monkeypatch.setattr(plugins, "_entry_points", lambda: [_entry_point("villimar", "STREAM_ONLY")])
+    plugin = discover_plugins(cache_path=cache_path, refresh=True)["villimar"]
+    # Lo que sale de la caché JSON debe funcionar igual
+    plugin = discover_plugins(cache_path=cache_path)["villimar"]
+    calls = []
+    monkeypatch.setattr(extract_raw, "read_pdf_tables", lambda path, **kwargs: calls.append(kwargs) or [])
+
+    parser = registry._resolve_parser(plugin)
+    parser["extract_raw"](Path("villimar.pdf"))
+
+    assert calls == [{"flavor": "stream", "row_tol": 10}]
+
+
+def test_importing_the_registry_does_not_write_the_cache(tmp_path):
+    cache = tmp_path / "plugins.json"
+    subprocess.run(
+        [sys.executable, "-c", "import src.parser.registry, src.utils.civico_utils"],
+        cwd=Path(__file__).resolve().parents[2], env={**os.environ, "PARSER_PLUGINS_CACHE": str(cache)},
+        check=True,
+    )
+    assert not cache.exists()
@@ -0,0 +1,105 @@
+import hashlib
+import json
+
+from src.orchestrator.storage import MonthStorage
+from src.publish.main import publish_month
+from src.publish.manifest import update_manifest
+
+ACTIVITY = {"nombre": "Yoga", "fecha": "04/12/2025", "hora": "19:30", "descripcion": None}
+
+
+def _write_month(data_dir, month, data):
+    month_dir = data_dir / month
+    month_dir.mkdir(parents=True, exist_ok=True)
+    (month_dir / "actividades.json").write_text(json.dumps(data, indent=2), encoding="utf-8")
+    return month_dir
+
+
+def _read(data_dir):
+    return json.loads((data_dir / "index.json").read_text(encoding="utf-8"))
+
+
+def test_manifest_lists_months_with_counts_and_hashes(tmp_path):
+    _write_month(tmp_path, "202601", {"capiscol": [ACTIVITY]})
+    month_dir = _write_month(tmp_path, "202602", {"gamonal_norte": [ACTIVITY] * 3, "capiscol": []})
+    (tmp_path / "202603").mkdir()  # Sin actividades.json: no se publica
+
+    update_manifest(tmp_path)
+
+    manifest = _read(tmp_path)
+    assert [m["month"] for m in manifest["months"]] == ["202602", "202601"]
+    latest = manifest["months"][0]
+    assert latest["activities"] == 3
+    assert latest["civicos"] == {"capiscol": 0, "gamonal_norte": 3}
+    source = (month_dir / "actividades.json").read_bytes()
+    assert latest["files"]["actividades.json"] == {
+        "sha256": hashlib.sha256(source).hexdigest(),
+        "bytes": len(source),
+    }
+    assert manifest["updated_at"] == max(m["updated_at"] for m in manifest["months"])
+
+
+def test_manifest_is_unchanged_when_data_is_unchanged(tmp_path):
+    _write_month(tmp_path, "202601", {"capiscol": [ACTIVITY]})
+    update_manifest(tmp_path)
+    before = (tmp_path / "index.json").read_bytes()
+
+    update_manifest(tmp_path)
+    update_manifest(tmp_path, ["202601"])
+
+    assert (tmp_path / "index.json").read_bytes() == before
+
+
+def test_manifest_updates_only_the_changed_month(tmp_path):
+    _write_month(tmp_path, "202601", {"capiscol": [ACTIVITY]})
+    _write_month(tmp_path, "202602", {"capiscol": [ACTIVITY]})
+    first = {m["month"]: m for m in update_manifest(tmp_path)["months"]}
+
+    _write_month(tmp_path, "202602", {"capiscol": [ACTIVITY] * 2})
+    second = {m["month"]: m for m in update_manifest(tmp_path, ["202602"])["months"]}
+
+    assert second["202601"] == first["202601"]
+    assert second["202602"]["activities"] == 2
+    assert second["202602"]["files"] != first["202602"]["files"]
+
+
+def test_storage_and_publish_keep_manifest_in_sync(tmp_path):
+    storage = MonthStorage(tmp_path / "202601")
+    storage.month_dir.mkdir()
+    storage.save_civico("capiscol", {"capiscol": [ACTIVITY]})
+
+    entry = _read(tmp_path)["months"][0]
+    assert entry["activities"] == 1
+    assert set(entry["files"]) == {"actividades.json"}
+
+    publish_month(storage.month_dir)
+
+    entry = _read(tmp_path)["months"][0]
+    assert set(entry["files"]) == {"actividades.json", "actividades.min.json", "search.json"}
+
+
+def test_sharded_storage_updates_manifest_on_finalize(tmp_path):
+    storage = MonthStorage(tmp_path / "202601", sharded=True)
+    all_activities = {"capiscol": [ACTIVITY]}
+    storage.save_civico("capiscol", all_activities)
+    assert not (tmp_path / "index.json").exists()
+
+    storage.finalize(all_activities)
+
+    assert _read(tmp_path)["months"][0]["civicos"] == {"capiscol": 1}
+
+
+def test_manifest_drops_derived_files_built_from_another_source(tmp_path):
+    storage = MonthStorage(tmp_path / "202601")
+    storage.month_dir.mkdir()
+    storage.save_civico("capiscol", {"capiscol": [ACTIVITY]})
+    publish_month(storage.month_dir)
+    source_sha256 = _read(tmp_path)["months"][0]["files"]["actividades.json"]["sha256"]
+    assert _read(tmp_path)["months"][0]["files"]["actividades.min.json"]["source"] == source_sha256
+
+    # Guardado sin volver a publicar (--no-publish, fallo antes de publish_month...)
+    storage.save_civico("capiscol", {"capiscol": [ACTIVITY, ACTIVITY]})
+
+    entry = _read(tmp_path)["months"][0]
+    assert set(entry["files"]) == {"actividades.json"}
+    assert (storage.month_dir / "actividades.min.json").exists()
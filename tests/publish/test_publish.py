@@ -0,0 +1,80 @@
+import gzip
+import json
+
+from src.publish import main as publish
+from src.publish.main import elide_nulls, publish_all, publish_month
+
+ACTIVITY = {
+    "nombre": "Yoga",
+    "descripcion": None,
+    "fecha": "04/12/2025",
+    "fecha_fin": None,
+    "hora": "19:30",
+    "hora_fin": None,
+    "requiere_inscripcion": True,
+    "lugar": "Sala de encuentro",
+    "publico": "adultos",
+    "edad_minima": None,
+    "edad_maxima": None,
+    "precio": 0,
+}
+
+
+def _month(tmp_path, name="202512"):
+    month_dir = tmp_path / name
+    month_dir.mkdir()
+    data = {"gamonal_norte": [ACTIVITY] * 20, "capiscol": []}
+    (month_dir / "actividades.json").write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    return month_dir, data
+
+
+def test_elide_nulls_keeps_falsy_values():
+    minified = elide_nulls({"c": [ACTIVITY]})["c"][0]
+
+    assert "descripcion" not in minified and "edad_minima" not in minified
+    assert minified["precio"] == 0
+    assert minified["requiere_inscripcion"] is True
+
+
+def test_publish_month_writes_min_and_gzip(tmp_path):
+    month_dir, data = _month(tmp_path)
+
+    report = publish_month(month_dir)
+
+    minified = (month_dir / "actividades.min.json").read_bytes()
+    assert json.loads(minified) == elide_nulls(data)
+    assert b"\n" not in minified and b": " not in minified
+    assert gzip.decompress((month_dir / "actividades.min.json.gz").read_bytes()) == minified
+    assert report["original"] > report["min"] > report["gz"]
+    assert oct((month_dir / "actividades.min.json").stat().st_mode & 0o777) == "0o644"
+
+
+def test_publish_is_deterministic_and_skips_unchanged(tmp_path):
+    month_dir, _ = _month(tmp_path)
+    first = publish_month(month_dir)
+    gz = (month_dir / "actividades.min.json.gz").read_bytes()
+
+    second = publish_month(month_dir)
+
+    assert first["written"]
+    assert second["written"] == []
+    assert (month_dir / "actividades.min.json.gz").read_bytes() == gz
+
+
+def test_publish_without_brotli(tmp_path, monkeypatch):
+    monkeypatch.setattr(publish, "brotli", None)
+    month_dir, _ = _month(tmp_path)
+
+    report = publish_month(month_dir)
+
+    assert report["br"] is None
+    assert not (month_dir / "actividades.min.json.br").exists()
+
+
+def test_publish_all_skips_months_without_data(tmp_path):
+    _month(tmp_path, "202601")
+    (tmp_path / "202602").mkdir()
+
+    reports = publish_all(tmp_path)
+
+    assert [r["month"] for r in reports] == ["202601"]
@@ -0,0 +1,70 @@
+import hashlib
+import json
+
+from src.publish.main import publish_month
+from src.publish.search_index import activity_days, build_search_index, fold, tokenize
+
+
+def _activity(nombre, fecha, *, fecha_fin=None, publico="adultos", lugar=None, requiere_inscripcion=False):
+    return {
+        "nombre": nombre,
+        "fecha": fecha,
+        "fecha_fin": fecha_fin,
+        "publico": publico,
+        "lugar": lugar,
+        "requiere_inscripcion": requiere_inscripcion,
+    }
+
+
+DATA = {
+    "gamonal_norte": [
+        _activity("Yoga Suave", "02/03/2026", publico="Adultos"),
+        _activity("Cuentacuentos", "03/03/2026", publico="Niñ@s de 4 a 7 años", requiere_inscripcion=True),
+    ],
+    "capiscol": [],
+    "huelgas": [
+        _activity("Exposición de fotografía", "01/03/2026", fecha_fin="04/03/2026", lugar="Sala de exposiciones"),
+    ],
+}
+
+
+def test_fold_and_tokenize_strip_accents_and_punctuation():
+    assert fold("Niñ@s PEQUEÑOS Exposición") == "nin@s pequenos exposicion"
+    assert tokenize("Niñ@s de 4 a 7 años") == ["nin", "s", "de", "4", "a", "7", "anos"]
+    assert tokenize(None) == []
+
+
+def test_activity_days_expands_ranges():
+    assert activity_days(DATA["huelgas"][0]) == ["2026-03-01", "2026-03-02", "2026-03-03", "2026-03-04"]
+    assert activity_days(_activity("x", "05/03/2026", fecha_fin="01/03/2026")) == ["2026-03-05"]
+    assert activity_days(_activity("x", "sin fecha")) == []
+
+
+def test_ids_follow_flattened_order():
+    index = build_search_index(DATA)
+
+    assert index["count"] == 3
+    assert index["civicos"] == {"gamonal_norte": [0, 1], "capiscol": [], "huelgas": [2]}
+    assert index["tokens"]["nombre"]["yoga"] == [0]
+    assert index["tokens"]["publico"]["adultos"] == [0, 2]
+    assert index["tokens"]["publico"]["anos"] == [1]
+    assert index["tokens"]["lugar"]["exposiciones"] == [2]
+    assert index["fechas"]["2026-03-02"] == [0, 2]
+    assert index["fechas"]["2026-03-03"] == [1, 2]
+    assert index["inscripcion"] == {"false": [0, 2], "true": [1]}
+
+
+def test_publish_month_writes_search_index(tmp_path):
+    month_dir = tmp_path / "202603"
+    month_dir.mkdir()
+    raw = json.dumps(DATA, ensure_ascii=False, indent=2).encode("utf-8")
+    (month_dir / "actividades.json").write_bytes(raw)
+
+    report = publish_month(month_dir)
+
+    index = json.loads((month_dir / "search.json").read_bytes())
+    assert index["source"] == hashlib.sha256(raw).hexdigest()
+    assert index == {**build_search_index(DATA), "source": index["source"]}
+    assert "search.json" in report["written"]
+    manifest = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))
+    assert "search.json" in manifest["months"][0]["files"]
@@ -0,0 +1,90 @@
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+
+from src.store.activity_store import ActivityStore, date_ordinal, minute_of_day
+
+
+def _activity(nombre, fecha, *, hora=None, fecha_fin=None, publico="adultos", **extra):
+    return {"nombre": nombre, "fecha": fecha, "fecha_fin": fecha_fin, "hora": hora, "publico": publico,
+            "requiere_inscripcion": False, **extra}
+
+
+@pytest.fixture
+def store(tmp_path):
+    months = {
+        "202601": {
+            "gamonal_norte": [
+                _activity("Yoga", "30/01/2026", hora="19:00"),
+                _activity("Exposición", "20/01/2026", fecha_fin="10/02/2026", lugar="Sala Exposiciones"),
+            ],
+            "capiscol": [_activity("Cuentacuentos", "15/01/2026", hora="18:00", publico="Público familiar")],
+        },
+        "202602": {
+            "capiscol": [
+                _activity("Taller", "02/02/2026", hora="10:30", requiere_inscripcion=True, precio=5,
+                          edad_minima=6, edad_maxima=12, publico="Niñ@s de 6 a 12 años"),
+                _activity("Cine familiar", "02/02/2026", hora="09:00", publico="FAMILIAS"),
+                _activity("Sin fecha", "pronto"),
+            ],
+        },
+        "202603": {},
+    }
+    for month, data in months.items():
+        (tmp_path / month).mkdir()
+        (tmp_path / month / "actividades.json").write_text(json.dumps(data), encoding="utf-8")
+    return ActivityStore.load(tmp_path)
+
+
+def _names(store, idx):
+    return [a["nombre"] for a in store.records(idx)]
+
+
+def test_parse_helpers():
+    assert date_ordinal("02/02/2026") == date(2026, 2, 2).toordinal()
+    assert date_ordinal("pronto") == date_ordinal(None) == -1
+    assert minute_of_day("10:30") == 630
+    assert minute_of_day(None) == -1
+
+
+def test_load_builds_columns_and_skips_invalid_dates(store):
+    assert len(store) == 5
+    assert store.start.dtype == np.int32 and store.start_min.dtype == np.int16
+    assert set(store.civicos) == {"gamonal_norte", "capiscol"}
+    assert store.max_span == 21
+    # Orden cronológico global (fecha, hora)
+    assert _names(store, store.by_start) == ["Cuentacuentos", "Exposición", "Yoga", "Cine familiar", "Taller"]
+
+
+def test_range_query_crosses_months_and_includes_ongoing(store):
+    idx = store.query(start=date(2026, 1, 28), end=date(2026, 2, 3))
+    assert _names(store, idx) == ["Exposición", "Yoga", "Cine familiar", "Taller"]
+
+    assert _names(store, store.in_range(date(2026, 2, 10))) == ["Exposición"]
+    assert len(store.in_range(date(2026, 2, 11))) == 0
+
+
+def test_facet_filters(store):
+    assert _names(store, store.query(publico="famil")) == ["Cuentacuentos", "Cine familiar"]
+    assert _names(store, store.query(publico="NINOS", edad=8)) == []
+    assert _names(store, store.query(publico="nin", edad=8)) == ["Taller"]
+    assert _names(store, store.query(lugar="exposicion")) == ["Exposición"]
+    assert _names(store, store.query(civicos=["capiscol"], gratis=False)) == ["Taller"]
+    assert _names(store, store.query(requiere_inscripcion=False, desde_hora="09:00", hasta_hora="18:30")) == [
+        "Cuentacuentos", "Cine familiar"
+    ]
+    with pytest.raises(TypeError):
+        store.query(descripcion="x")
+
+
+def test_facets_count_results(store):
+    idx = store.query(start=date(2026, 2, 1), end=date(2026, 2, 28))
+
+    facets = store.facets(idx)
+    assert facets["total"] == 3
+    assert facets["civicos"] == {"gamonal_norte": 1, "capiscol": 2}
+    assert facets["meses"] == {"202601": 1, "202602": 2}
+    assert facets["requiere_inscripcion"] == {"true": 1, "false": 2}
+    assert store.days(idx)[date(2026, 2, 2)] == 2
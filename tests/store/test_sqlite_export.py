@@ -0,0 +1,122 @@
+import json
+
+import pytest
+
+from src.store.sqlite_export import activity_rows, connect, export_all, parse_warnings
+
+
+def _activity(nombre, fecha="02/02/2026", **extra):
+    return {"nombre": nombre, "descripcion": None, "fecha": fecha, "publico": "adultos",
+            "requiere_inscripcion": False, **extra}
+
+
+def _write_month(data_dir, month, activities, links=None, warnings=None):
+    month_dir = data_dir / month
+    month_dir.mkdir(parents=True, exist_ok=True)
+    (month_dir / "actividades.json").write_text(json.dumps(activities), encoding="utf-8")
+    if links is not None:
+        (month_dir / "links.json").write_text(json.dumps({"meta": {}, "links": links}), encoding="utf-8")
+    if warnings is not None:
+        (month_dir / "warnings.log").write_text(warnings, encoding="utf-8")
+
+
+@pytest.fixture
+def db(tmp_path):
+    return tmp_path / "actividades.sqlite"
+
+
+def test_activity_ids_are_stable_and_distinguish_repeats():
+    data = {"capiscol": [_activity("Yoga"), _activity("Yoga"), _activity("Pilates")]}
+
+    ids = [row[0] for row in activity_rows("202602", data)]
+    reordered = [row[0] for row in activity_rows("202602", {"capiscol": data["capiscol"][::-1]})]
+
+    assert len(set(ids)) == 3
+    assert set(ids) == set(reordered)
+    assert next(activity_rows("202602", data))[5] == "2026-02-02"
+
+
+def test_parse_warnings_joins_continuation_lines():
+    text = (
+        "2026-02-01 10:00:00,001 [W] src.parser.x:12 - Fecha ilegible\n"
+        "  detalle en otra línea\n"
+        "2026-02-01 10:00:01,002 [W] src.parser.y:40 - Hora sin minutos\n"
+    )
+    assert parse_warnings(text) == [
+        (1, "2026-02-01 10:00:00,001", "src.parser.x:12", "Fecha ilegible\n  detalle en otra línea"),
+        (3, "2026-02-01 10:00:01,002", "src.parser.y:40", "Hora sin minutos"),
+    ]
+
+
+def test_parse_warnings_reads_both_log_formats():
+    text = (
+        "2026-02-01 10:00:00,001 [W] src.parser.x:12 - Fecha ilegible\n"
+        "[WARNING] 2026-02-01 10:00:01,002 - src.orchestrator.main:250 - ⚠ parse_raw devolvió lista vacía\n"
+        "[ERROR] 2026-02-01 10:00:02,003 - src.orchestrator.main:230 - ✗ Error en extract_raw: PDF corrupto\n"
+        "Traceback (most recent call last):\n"
+        "  File \"x.py\", line 1\n"
+        "[CRITICAL] formato desconocido\n"
+    )
+    assert parse_warnings(text) == [
+        (1, "2026-02-01 10:00:00,001", "src.parser.x:12", "Fecha ilegible"),
+        (2, "2026-02-01 10:00:01,002", "src.orchestrator.main:250", "⚠ parse_raw devolvió lista vacía"),
+        (3, "2026-02-01 10:00:02,003", "src.orchestrator.main:230",
+         "✗ Error en extract_raw: PDF corrupto\nTraceback (most recent call last):\n  File \"x.py\", line 1"),
+        (6, None, None, "[CRITICAL] formato desconocido"),
+    ]
+
+
+def test_export_is_incremental(tmp_path, db):
+    data_dir = tmp_path / "data"
+    links = [{"civico_id": "capiscol", "title": "Agenda", "url": "https://x/a.pdf", "filename": "a.pdf", "is_new": True}]
+    _write_month(data_dir, "202602", {"capiscol": [_activity("Yoga"), _activity("Pilates")]}, links,
+                 "2026-02-01 10:00:00,001 [W] src.parser.x:12 - Fecha ilegible\n")
+
+    [first] = export_all(data_dir, db)
+    assert (first["inserted"], first["deleted"], first["links"], first["warnings"]) == (2, 0, True, True)
+
+    conn = connect(db)
+    yoga_rowid = conn.execute("SELECT rowid FROM activities WHERE nombre = 'Yoga'").fetchone()[0]
+    conn.close()
+
+    [rerun] = export_all(data_dir, db)
+    assert (rerun["inserted"], rerun["deleted"], rerun["unchanged"], rerun["links"]) == (0, 0, 2, False)
+
+    _write_month(data_dir, "202602", {"capiscol": [_activity("Yoga"), _activity("Zumba")]})
+    [changed] = export_all(data_dir, db)
+    assert (changed["inserted"], changed["deleted"], changed["unchanged"]) == (1, 1, 1)
+
+    conn = connect(db)
+    assert conn.execute("SELECT rowid FROM activities WHERE nombre = 'Yoga'").fetchone()[0] == yoga_rowid
+    assert conn.execute("SELECT activities FROM months WHERE month = '202602'").fetchone()[0] == 2
+    assert conn.execute("SELECT url FROM links").fetchall() == [("https://x/a.pdf",)]
+    assert conn.execute("SELECT source, message FROM warnings").fetchall() == [("src.parser.x:12", "Fecha ilegible")]
+    conn.close()
+
+
+def test_indexes_and_full_text_search(tmp_path, db):
+    data_dir = tmp_path / "data"
+    _write_month(data_dir, "202601", {"huelgas": [_activity("Exposición de fotografía", "20/01/2026")]})
+    _write_month(data_dir, "202602", {
+        "capiscol": [_activity("Taller", descripcion="Fotografía con el móvil"), _activity("Yoga")],
+    })
+    export_all(data_dir, db)
+
+    conn = connect(db)
+    matches = conn.execute(
+        "SELECT a.nombre FROM activities_fts JOIN activities a ON a.rowid = activities_fts.rowid "
+        "WHERE activities_fts MATCH 'fotografia' ORDER BY a.fecha"
+    ).fetchall()
+    assert matches == [("Exposición de fotografía",), ("Taller",)]
+
+    plan = " ".join(
+        row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT nombre FROM activities WHERE fecha BETWEEN '2026-02-01' AND '2026-02-14'"
+        )
+    )
+    assert "idx_activities_fecha" in plan
+
+    _write_month(data_dir, "202602", {"capiscol": [_activity("Yoga")]})
+    export_all(data_dir, db, ["202602"])
+    assert conn.execute("SELECT COUNT(*) FROM activities_fts WHERE activities_fts MATCH 'movil'").fetchone()[0] == 0
+    conn.close()
@@ -0,0 +1,30 @@
+import json
+
+from src.utils.disk_cache import DiskCache
+
+
+class TablesCache(DiskCache):
+    def _unpack(self, entry):
+        return entry["tables"]
+
+
+def test_entry_without_expected_fields_is_dropped(tmp_path):
+    cache = TablesCache(tmp_path, max_age_seconds=60)
+    key = "ab" * 32
+    cache._put(key, {"tables": [[1]]})
+    assert cache.get(key) == [[1]]
+
+    path = tmp_path / "ab" / f"{key}.json"
+    path.write_text(json.dumps({"key": key}), encoding="utf-8")
+
+    assert cache.get(key) is None
+    assert not path.exists()
+
+
+def test_evict_without_max_bytes_only_drops_expired(tmp_path):
+    cache = DiskCache(tmp_path, max_age_seconds=60)
+    for i in range(3):
+        cache._put(f"{i:02d}" * 32, {"data": "x" * 1000})
+
+    assert cache.evict() == 0
+    assert len(list(tmp_path.glob("*/*.json"))) == 3
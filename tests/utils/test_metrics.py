@@ -0,0 +1,81 @@
+import pytest
+
+from src.utils import metrics
+from src.utils.metrics import Registry
+
+
+def test_render_text_exposition_format():
+    registry = Registry()
+    rows = registry.counter("rows_total", "Filas", labels=("civico", "result"))
+    rows.inc(civico="capiscol", result="parsed")
+    rows.inc(2, civico="capiscol", result="parsed")
+    rows.inc(civico='sala "2"\\b', result="discarded")
+    registry.gauge("activities", "Actividades", labels=("civico",)).set(12, civico="huelgas")
+
+    assert registry.render() == (
+        "# HELP burgos_civicos_activities Actividades\n"
+        "# TYPE burgos_civicos_activities gauge\n"
+        'burgos_civicos_activities{civico="huelgas"} 12\n'
+        "# HELP burgos_civicos_rows_total Filas\n"
+        "# TYPE burgos_civicos_rows_total counter\n"
+        'burgos_civicos_rows_total{civico="capiscol",result="parsed"} 3\n'
+        'burgos_civicos_rows_total{civico="sala \\"2\\"\\\\b",result="discarded"} 1\n'
+    )
+    # Mismo nombre → misma métrica; etiquetas distintas → error
+    assert registry.counter("rows_total", "Filas", labels=("civico", "result")) is rows
+    with pytest.raises(ValueError):
+        registry.gauge("rows_total", "Filas")
+    with pytest.raises(ValueError):
+        rows.inc(civico="capiscol")
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = Registry()
+    latency = registry.histogram("llm_request_seconds", "Latencia", labels=("model",), buckets=(0.1, 1, 10))
+    for value in (0.05, 0.5, 0.7, 30):
+        latency.observe(value, model="mistral")
+
+    lines = registry.render().splitlines()
+    assert lines[2:] == [
+        'burgos_civicos_llm_request_seconds_bucket{model="mistral",le="0.1"} 1',
+        'burgos_civicos_llm_request_seconds_bucket{model="mistral",le="1"} 3',
+        'burgos_civicos_llm_request_seconds_bucket{model="mistral",le="10"} 3',
+        'burgos_civicos_llm_request_seconds_bucket{model="mistral",le="+Inf"} 4',
+        'burgos_civicos_llm_request_seconds_sum{model="mistral"} 31.25',
+        'burgos_civicos_llm_request_seconds_count{model="mistral"} 4',
+    ]
+
+
+def test_snapshot_merge_adds_counters_and_histograms():
+    parent, worker = Registry(), Registry()
+    for registry in (parent, worker):
+        registry.counter("calls_total", "Llamadas").inc()
+        registry.histogram("page_seconds", "Página", labels=("flavor",)).observe(0.2, flavor="lattice")
+        registry.gauge("activities", "Actividades").set(5)
+    worker.gauge("activities", "Actividades").set(7)
+
+    parent.merge(worker.snapshot())
+
+    assert parent.counter("calls_total", "Llamadas").snapshot() == [[[], 2]]
+    (_, (counts, total, n)), = parent.histogram("page_seconds", "Página", labels=("flavor",)).snapshot()
+    assert (sum(counts), total, n) == (2, pytest.approx(0.4), 2)
+    assert parent.gauge("activities", "Actividades").snapshot() == [[[], 7]]
+
+
+def test_finish_run_writes_textfile(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_TEXTFILE_DIR", None)
+    assert metrics.finish_run("scraper", started=0, success=True) is None
+
+    monkeypatch.setattr(metrics, "METRICS_TEXTFILE_DIR", str(tmp_path / "textfile"))
+    path = metrics.finish_run("scraper", started=0, success=False)
+
+    assert path == tmp_path / "textfile" / "burgos_civicos_scraper.prom"
+    text = path.read_text(encoding="utf-8")
+    assert 'burgos_civicos_run_success{job="scraper"} 0' in text
+    assert "# TYPE burgos_civicos_last_run_timestamp_seconds gauge" in text
+    assert not list(path.parent.glob(".*.tmp"))
+
+
+def test_metric_base_class_requires_merge():
+    with pytest.raises(TypeError):
+        metrics.Metric("sin_merge", "Sin merge")
@@ -0,0 +1,86 @@
+import json
+import threading
+
+import pytest
+
+from src.utils import timing
+from src.utils.timing import RunReport, activate, format_duration, percentile
+
+
+def test_spans_record_attrs_counts_and_errors():
+    report = RunReport("202601")
+
+    with report.span("extract", civico="capiscol", pdf_bytes=1000) as span:
+        span["rows"] = 12
+    with pytest.raises(ValueError):
+        with report.span("parse", civico="capiscol"):
+            raise ValueError("roto")
+
+    data = report.to_dict()
+    assert data["civicos"]["capiscol"]["extract"] == {
+        "count": 1, "seconds": pytest.approx(data["spans"][0]["duration"]), "pdf_bytes": 1000, "rows": 12,
+    }
+    assert data["civicos"]["capiscol"]["parse"]["errors"] == 1
+    assert data["spans"][1]["attrs"]["error"] == "ValueError: roto"
+
+
+def test_module_helpers_use_the_active_report():
+    report = RunReport("202601")
+
+    # Sin informe activo no se registra nada
+    with timing.span("llm", civico="huelgas") as attrs:
+        timing.add_counts(requests=1)
+    assert attrs == {} and report.spans == []
+
+    with activate(report):
+        def call():
+            with timing.span("llm", civico="huelgas", rows=2):
+                timing.add_counts(requests=1, prompt_tokens=100)
+                timing.add_counts(requests=1, prompt_tokens=50)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        with timing.span("llm", civico="huelgas", rows=1):
+            timing.add_counts(cache_hits=1)
+    assert timing.get_active_report() is None
+
+    data = report.to_dict()
+    assert data["stages"]["llm"]["prompt_tokens"] == 450
+    assert data["llm"]["calls"] == 3 and data["llm"]["cached"] == 1
+    assert data["llm"]["p50"] <= data["llm"]["p95"]
+
+
+def test_progress_line_estimates_remaining_time():
+    report = RunReport("202601", civicos=3)
+    report._add({"name": "extract", "civico": "a", "start": 0.0, "duration": 1.0, "pid": 1, "thread": "t", "attrs": {"rows": 10}})
+    report._add({"name": "parse", "civico": "a", "start": 1.0, "duration": 5.0, "pid": 1, "thread": "t", "attrs": {"rows": 10}})
+    report._parse_started = report.t0 - 10  # 10 filas en 10 s → 1 fila/s
+
+    line = report.progress_line()
+
+    # 2 cívicos sin extraer ≈ 20 filas más
+    assert line.startswith("Progreso 202601: 1/3 cívicos, 10/30 filas, 1.00 filas/s, ETA 20s")
+
+
+def test_chrome_trace_format(tmp_path):
+    report = RunReport("202601")
+    with report.span("download", civico="san_juan", bytes=10):
+        pass
+
+    report.write(tmp_path, trace=True)
+
+    events = json.loads((tmp_path / timing.TRACE_NAME).read_text())["traceEvents"]
+    (complete,) = [e for e in events if e["ph"] == "X"]
+    assert complete["name"] == "download san_juan"
+    assert complete["args"] == {"bytes": 10}
+    assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in events)
+    assert format_duration(3725) == "1h02m"
+
+
+def test_percentile_nearest_rank():
+    assert percentile([], 50) is None
+    assert percentile([3.0, 1.0, 2.0, 4.0], 50) == 2.0
+    assert percentile([float(i) for i in range(1, 21)], 95) == 19.0
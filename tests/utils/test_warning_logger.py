@@ -0,0 +1,64 @@
+import pytest
+
+from src.utils import warning_logger
+from src.utils.warning_logger import (
+    close_warning_loggers,
+    configure_warning_logger,
+    flush_warning_loggers,
+    get_warning_logger,
+)
+
+
+@pytest.fixture
+def warnings_dir(tmp_path):
+    configure_warning_logger(tmp_path)
+    yield tmp_path
+    close_warning_loggers()
+    configure_warning_logger(warning_logger.Path("docs/data"))
+
+
+def test_same_logger_and_single_handler(warnings_dir):
+    first = get_warning_logger("202601")
+    for _ in range(100):
+        assert get_warning_logger("202601") is first
+
+    assert len(first.handlers) == 1
+
+
+def test_buffered_until_flush_and_respects_base_dir(warnings_dir):
+    log = get_warning_logger("202601")
+    log_path = warnings_dir / "202601" / "warnings.log"
+
+    for i in range(10):
+        log.warning("Sin hora: actividad %d", i)
+    assert not log_path.exists() or log_path.read_text(encoding="utf-8") == ""
+
+    flush_warning_loggers()
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 10
+    assert "Sin hora: actividad 9" in lines[-1]
+
+
+def test_file_opened_once(warnings_dir):
+    log = get_warning_logger("202602")
+    file_handler = log.handlers[0].target
+
+    log.warning("uno")
+    flush_warning_loggers()
+    stream = file_handler.stream
+    log.warning("dos")
+    flush_warning_loggers()
+
+    assert file_handler.stream is stream
+
+
+def test_close_flushes_and_releases_file(warnings_dir):
+    log = get_warning_logger("202603")
+    file_handler = log.handlers[0].target
+    log.warning("pendiente")
+
+    close_warning_loggers()
+
+    assert file_handler.stream is None
+    assert "pendiente" in (warnings_dir / "202603" / "warnings.log").read_text(encoding="utf-8")
+    assert get_warning_logger("202603") is log and len(log.handlers) == 1
@@ -0,0 +1,64 @@
+import jsonschema
+import pytest
+
+from src.validators.validate_activities import get_activity_validator, validate_activities
+
+VALID = {
+    "nombre": "Yoga",
+    "descripcion": None,
+    "fecha": "04/12/2025",
+    "fecha_fin": None,
+    "hora": "19:30",
+    "hora_fin": None,
+    "requiere_inscripcion": True,
+    "lugar": "Sala",
+    "publico": "adultos",
+    "edad_minima": None,
+    "edad_maxima": None,
+    "precio": None,
+}
+
+
+def test_validator_is_built_once():
+    assert get_activity_validator() is get_activity_validator()
+
+
+def test_validate_single_activity():
+    validator = get_activity_validator()
+    validator.validate(VALID)
+
+    with pytest.raises(jsonschema.ValidationError):
+        validator.validate({**VALID, "hora": "7:30"})
+
+
+def test_validate_batch_returns_all_errors_with_json_paths():
+    validator = get_activity_validator()
+    batch = [VALID, {**VALID, "hora": "7:30", "publico": ""}, VALID, {**VALID, "extra": 1}]
+
+    issues = validator.validate_batch(batch, civico="gamonal_norte", start=10)
+
+    paths = [path for path, _ in issues]
+    assert paths == ["$.gamonal_norte[11].hora", "$.gamonal_norte[11].publico", "$.gamonal_norte[13]"]
+    assert "extra" in issues[-1][1]
+    assert validator.validate_batch([VALID] * 3) == []
+
+
+def test_validate_document_and_legacy_function():
+    validator = get_activity_validator()
+    data = {"a": [VALID], "b": [VALID, {**VALID, "fecha": "4/12/2025"}]}
+
+    assert validator.validate_document(data) == [
+        ("$.b[1].fecha", "'4/12/2025' does not match '^\\\\d{2}/\\\\d{2}/\\\\d{4}$'")
+    ]
+    with pytest.raises(jsonschema.ValidationError):
+        validate_activities(data)
+
+
+def test_validate_document_orders_errors_by_numeric_index():
+    validator = get_activity_validator()
+    bad = {**VALID, "hora": "7:30"}
+    data = {"capiscol": [bad if i in (2, 10) else VALID for i in range(11)]}
+
+    paths = [path for path, _ in validator.validate_document(data)]
+
+    assert paths == ["$.capiscol[2].hora", "$.capiscol[10].hora"]